@@ -0,0 +1,73 @@
+"""Benchmark attribute evaluation on a single Real carrying many edits.
+
+Applies N edits of one kind (default 10 000) to a fresh ``Real`` and reports
+the time to apply them and the latency of ``at_time`` at random times, plus
+one vectorized ``at_times`` call.  Evaluation must neither recurse nor slow
+down much as N grows; compare runs with a few values of ``--edits``.
+
+    python scripts/bench_edits.py --edits 10000 20000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from vectormation.attributes import Real  # noqa: E402
+
+
+def _one(t):
+    return 1
+
+
+EDITS = {
+    'set_at': lambda r, i: r.set_at(i, i),
+    'set_onward': lambda r, i: r.set_onward(i, i),
+    'move_to': lambda r, i: r.move_to(i, i + 0.5, i),
+    'set (func)': lambda r, i: r.set(i, i + 0.5, lambda t: t),
+    'add (stay)': lambda r, i: r.add(i, i + 0.5, _one, stay=True),
+}
+
+
+def bench(kind, n, lookups=2000):
+    r = Real(0, 0)
+    edit = EDITS[kind]
+    t0 = time.perf_counter()
+    for i in range(n):
+        edit(r, i)
+    build = time.perf_counter() - t0
+
+    rng = random.Random(0)
+    times = [rng.uniform(-1, n + 1) for _ in range(lookups)]
+    at_time = r.at_time
+    t0 = time.perf_counter()
+    for t in times:
+        at_time(t)
+    lookup = (time.perf_counter() - t0) / lookups
+
+    t0 = time.perf_counter()
+    r.at_times(times)
+    batch = time.perf_counter() - t0
+    return build, lookup, batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--edits', type=int, nargs='+', default=[10000])
+    parser.add_argument('--kind', choices=sorted(EDITS), action='append')
+    args = parser.parse_args()
+    print(f"{'edit':<12} {'N':>7} {'apply':>10} {'at_time':>10} {'at_times':>10}")
+    for kind in args.kind or EDITS:
+        for n in args.edits:
+            build, lookup, batch = bench(kind, n)
+            print(f'{kind:<12} {n:>7} {build * 1e3:>8.1f}ms {lookup * 1e6:>8.2f}us '
+                  f'{batch * 1e3:>8.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark the cost of rounding the numbers of frame SVGs.
+
+Builds a scene of N moving objects (default 200 circles, paths and text
+labels over a number plane) and times ``generate_frame_svg`` over a range
+of frames in three modes, alternating between them and keeping the best
+run of each: numbers rounded as they are written (as exported), a regex
+pass over each finished fragment (how frames used to be rounded), and no
+rounding at all.
+
+    python scripts/bench_rounding.py --objects 50 200 800
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import vectormation._canvas as _canvas  # noqa: E402
+import vectormation.style as style  # noqa: E402
+from vectormation._axes import NumberPlane  # noqa: E402
+from vectormation._canvas import VectorMathAnim  # noqa: E402
+from vectormation._shapes import Circle  # noqa: E402
+from vectormation._shapes_ext import Path as SvgPath, Text  # noqa: E402
+
+
+def scene(n):
+    canvas = VectorMathAnim(tempfile.mkdtemp())
+    canvas.add_objects(NumberPlane())
+    for i in range(n):
+        x, y = 100 + (i * 37) % 1700, 100 + (i * 53) % 880
+        kind = i % 3
+        if kind == 0:
+            obj = Circle(r=10 + i % 20, cx=x, cy=y)
+        elif kind == 1:
+            obj = SvgPath(f'M {x} {y} C {x + 30.123} {y - 40.456} {x + 60.789} {y + 40.321} {x + 90} {y}')
+        else:
+            obj = Text(f'label {i}', x=x, y=y)
+        obj.shift(dx=300.3, dy=-120.7, start=0, end=2)
+        obj.rotate_by(0, 2, 90)
+        canvas.add_objects(obj)
+    return canvas
+
+
+def _regex_pass(obj, time, rnd):
+    return rnd(obj.to_svg(time))
+
+
+def _no_rounding(obj, time, rnd):
+    return obj.to_svg(time)
+
+
+MODES = {   # mode -> (canvas._fragment, style._num, style._round_svg)
+    'emitted': (_canvas._fragment, style._num, style._round_svg),
+    'regex': (_regex_pass, str, str),
+    'raw': (_no_rounding, str, str),
+}
+
+
+def _use(mode):
+    _canvas._fragment, style._num, style._round_svg = MODES[mode]
+
+
+def bench(n, frames, repeat=5):
+    canvas = scene(n)
+    times = [2 * i / frames for i in range(frames)]
+    best = dict.fromkeys(MODES, float('inf'))
+    canvas.generate_frame_svg(0)   # warm the caches
+    for _ in range(repeat):   # alternate, so all see the same machine state
+        for mode in MODES:
+            _use(mode)
+            try:
+                t0 = time.perf_counter()
+                for t in times:
+                    canvas.generate_frame_svg(t)
+                best[mode] = min(best[mode], (time.perf_counter() - t0) / frames)
+            finally:
+                _use('emitted')
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--objects', type=int, nargs='+', default=[200])
+    parser.add_argument('--frames', type=int, default=60)
+    args = parser.parse_args()
+    print(f"{'objects':>8} {'emitted':>10} {'regex':>10} {'raw':>10} {'saved':>7}")
+    for n in args.objects:
+        best = bench(n, args.frames)
+        ms = ' '.join(f'{best[mode] * 1e3:>8.2f}ms' for mode in MODES)
+        saved = (best['regex'] - best['emitted']) / best['regex']
+        print(f'{n:>8} {ms} {saved:>7.1%}')
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,9 @@
 """Tests for the time-varying attribute system (Real, Coor, Color, etc.)."""
 import math
+import numpy as np
 import pytest
 
-from vectormation.attributes import Real, Coor, Color, String, Tup, _wrap
+from vectormation.attributes import Real, Coor, Color, String, Tup, EvalCache, Columns, _wrap
 import vectormation.easings as easings
 
 
@@ -48,6 +49,381 @@ class TestWrap:
         assert f(3) == 0         # end excluded
 
 
+class TestTimeline:
+    """Test the segment timeline that backs every attribute."""
+
+    def test_set_onward_replaces_segments(self):
+        r = Real(0, 0)
+        for i in range(100):
+            r.set_onward(i, i)
+        # Each set_onward cuts off everything after it: one piece per edit
+        # plus the before-creation piece, which set_onward(0, 0) merges with.
+        assert len(r._tl.segs) == 100
+        assert r.at_time(50.5) == 50
+
+    def test_many_edits_do_not_nest(self):
+        r = Real(0, 0)
+        for i in range(5000):
+            r.add(i, i + 1, lambda t: 1)
+        assert r.at_time(2500.5) == 1
+        assert r.at_time(2500) == 2     # closed intervals overlap at the seam
+
+    def test_stay_holds_value_at_end(self):
+        r = Real(0, 1)
+        r.add(1, 2, lambda t: t, stay=True)
+        r.set(3, 4, 100)
+        assert r.at_time(2.5) == 3
+        assert r.at_time(3.5) == 100
+        assert r.at_time(5) == 3
+
+    def test_time_func_is_a_frozen_view(self):
+        r = Real(0, 1)
+        before = r.time_func
+        r.set(0, 1, lambda t: before(t) + 1)
+        assert r.at_time(0.5) == 2
+        assert before(0.5) == 1
+
+    def test_internal_reads_do_not_freeze(self):
+        from vectormation._shapes import Circle
+        c = Circle(r=10, fill='#ff0000')
+        c.styling.fill.set_onward(1, '#00ff00')
+        tl = c.styling.fill._tl
+        assert c.get_fill_color(0) == '#ff0000'
+        c.styling.fill.set_onward(2, '#0000ff')
+        assert c.styling.fill._tl is tl
+
+
+class TestSegments:
+    """Test timeline introspection and merging of redundant pieces."""
+
+    def test_equal_constants_merge(self):
+        r = Real(0, 0)
+        r.set_onward(1, 5)
+        r.set_onward(2, 5)
+        r.set_onward(3, 5)
+        assert [s['start'] for s in r.segments()] == [-math.inf, 1]
+        assert r.at_time(2.5) == 5
+
+    def test_types_kept_apart(self):
+        r = Real(0, 5)
+        r.set_onward(1, 5.0)
+        assert len(r.segments()) == 3
+        assert type(r.at_time(2)) is float
+
+    def test_shadowed_edits_dropped(self):
+        r = Real(0, 0)
+        for i in range(50):
+            r.set(1, 2, lambda t, i=i: t + i)
+        kinds = [s['kind'] for s in r.segments()]
+        assert kinds == ['constant', 'function', 'constant']
+        assert r.at_time(1.5) == 50.5
+
+    def test_add_zero_folds_back(self):
+        r = Real(0, 3.0)
+        r.add_at(1, 0)
+        assert len(r.segments()) == 2
+
+    def test_kinds(self):
+        src = Real(0, 1)
+        r = Real(0, 0)
+        r.set_to(src)
+        assert [s['kind'] for s in r.segments()] == ['link']
+        r.add(1, 2, lambda t: 1, stay=True)
+        segs = r.segments()
+        assert [s['kind'] for s in segs] == ['link', 'link', 'held']
+        assert segs[1]['ops'] == 1
+        assert segs[2]['start'] == 2 and not segs[2]['start_incl']
+        assert segs[2]['end'] == math.inf
+
+
+class TestAtTimes:
+    """Test vectorized evaluation over many times."""
+
+    def test_matches_at_time(self):
+        r = Real(0, 0)
+        r.move_to(1, 2, 10)
+        r.add(1.5, 3, lambda t: t, stay=True)
+        r.set(4, 5, lambda t: max(t, 4.5))   # scalar-only lambda falls back
+        ts = np.linspace(-1, 6, 141)
+        assert r.at_times(ts) == pytest.approx([r.at_time(t) for t in ts])
+
+    def test_coor_returns_rows(self):
+        c = Coor(0, (0, 0))
+        c.move_to(0, 1, (10, 20))
+        vals = c.at_times([0, 0.5, 1])
+        assert vals.shape == (3, 2)
+        assert tuple(vals[2]) == pytest.approx((10, 20))
+
+    def test_color_returns_channels(self):
+        col = Color(0, '#ff0000').interpolate(Color(0, '#0000ff'), 0, 1)
+        assert col.at_times([0.5])[0] == pytest.approx((127.5, 0, 127.5))
+
+    def test_string_returns_objects(self):
+        s = String(1, 'a')
+        assert list(s.at_times([0, 2])) == ['', 'a']
+
+
+class TestStatic:
+    """Test constant folding and static-range queries."""
+
+    def test_fresh_attribute_is_static(self):
+        r = Real(2, 5)
+        assert r.is_static(2, 100)
+        assert not r.is_static(1, 3)        # jumps from 0 to 5 at creation
+        assert r.static_since() == 2
+
+    def test_animation_is_not_static(self):
+        r = Real(0, 0)
+        r.move_to(1, 2, 10)
+        assert r.is_static(0, 0.5)
+        assert not r.is_static(0.5, 1.5)
+        assert r.is_static(2.5, 50)         # held end value is folded
+        assert r.static_since() == 2
+
+    def test_constant_offsets_fold(self):
+        c = Coor(0, (1, 2))
+        c.add_onward(1, (10, 10))
+        assert c._tl.segs[-1].const == (11, 12)
+        assert c.is_static(1, 5)
+
+    def test_functions_are_not_assumed_constant(self):
+        r = Real(0, 0)
+        r.set_onward(1, lambda t: 7)
+        assert not r.is_static(2, 3)
+        assert r.static_since() is None
+
+    def test_copy_keeps_folding(self):
+        from copy import deepcopy
+        r = deepcopy(Real(0, 5))
+        assert r.at_time(1) == 5
+        assert r.is_static(0, 1)
+
+
+class TestCompile:
+    """Test pre-sampled lookup tables."""
+
+    def test_lookup_matches_at_time(self):
+        r = Real(0, 0)
+        r.move_to(0, 1, 10)
+        times = [i / 10 for i in range(15)]
+        expected = [r.at_time(t) for t in times]
+        r.compile(times)
+        assert [r.at_time(t) for t in times] == expected
+        assert r.at_time(0.55) == pytest.approx(Real(0, 0).move_to(0, 1, 10).at_time(0.55))
+
+    def test_keeps_value_types(self):
+        c = Coor(0, (0, 0))
+        c.move_to(0, 1, (10, 20))
+        c.compile([0, 0.5, 1, 2])
+        assert c.at_time(0.5) == pytest.approx((5, 10))
+        assert type(c.at_time(1)[0]) is type(Coor(0, (0, 0)).move_to(0, 1, (10, 20)).at_time(1)[0])
+
+    def test_edit_drops_buffer(self):
+        r = Real(0, 0)
+        r.move_to(0, 1, 10)
+        r.compile([0.5])
+        r.set_onward(0, 3)
+        assert r.at_time(0.5) == 3
+
+    def test_captured_time_func_is_frozen(self):
+        r = Real(0, 1)
+        r.set_onward(0, lambda t: t)
+        r.compile([2.0])
+        f = r.time_func
+        r.set_onward(0, 0)
+        assert f(2.0) == 2.0
+        assert r.at_time(2.0) == 0
+
+    def test_impure_piece_stays_lazy(self):
+        k = Real(0, 2)
+        r = Real(0, 0)
+        r.set_onward(0, lambda t: t * k.at_time(0))
+        r.compile([1.0, 2.0])
+        assert r.at_time(2.0) == 4
+        k.set_onward(0, 10)
+        assert r.at_time(2.0) == 20
+
+    def test_plain_link_to_pure_piece_is_sampled(self):
+        a = Real(0, 0)
+        a.move_to(0, 1, 10)
+        b = Real(0)
+        b.set_to(a)
+        b.compile([0.5])
+        assert b._tl.rows == {0.5: 5.0}
+        c = a.apply(lambda x: x * 2)
+        c.compile([0.5])
+        assert c._tl.rows == {}
+        assert c.at_time(0.5) == 10
+
+
+class TestDependencies:
+    """Test the dependency graph built by set_to/apply."""
+
+    def test_graph_edges(self):
+        a = Real(0, 1)
+        b = Real(0)
+        b.set_to(a)
+        c = b.apply(lambda x: x * 2)
+        assert b.sources() == [a]
+        assert a.dependents() == [b]
+        assert b.dependents() == [c]
+
+    def test_static_propagates(self):
+        a = Real(0, 1)
+        a.move_to(1, 2, 5)
+        b = a.apply(lambda x: x + 1)
+        assert b.is_static(0, 0.9)
+        assert not b.is_static(0.5, 1.5)
+        assert b.static_since() == 2
+        assert b.at_time(3) == 6
+
+    def test_func_reading_other_attributes_stays_current(self):
+        a = Real(0, 1)
+        k = Real(0, 2)
+        b = a.apply(lambda v: v * k.at_time(0))
+        assert b.at_time(5) == 2
+        k.set_onward(0, 10)
+        assert b.at_time(5) == 10
+        assert b.static_run(5) == (0, math.inf)
+
+    def test_edit_invalidates_downstream(self):
+        a = Real(0, 3)
+        b = a.apply(lambda x: x * 2)
+        c = b.apply(lambda x: x + 1)
+        c.compile([0.5, 1.5])
+        assert c.at_time(1.5) == 7
+        a.set_onward(1, 10)
+        assert c.at_time(0.5) == 7
+        assert c.at_time(1.5) == 21
+
+    def test_deepcopy_keeps_reading_source(self):
+        from copy import deepcopy
+        a = Real(0, 3)
+        b = deepcopy(a.apply(lambda x: x * 2))
+        a.set_onward(0, 5)
+        assert b.at_time(1) == 10
+        assert b in a.dependents()
+
+
+class TestEvalCache:
+    """Test the per-frame evaluation cache."""
+
+    def test_hits_and_misses(self):
+        r = Real(0, 0)
+        r.move_to(0, 1, 10)
+        cache = EvalCache()
+        with cache:
+            first = r.at_time(0.5)
+            assert r.at_time(0.5) == first
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['times'] == 0      # frame-scoped by default
+
+    def test_edit_clears(self):
+        r = Real(0, 1)
+        with EvalCache():
+            assert r.at_time(1) == 1
+            r.set_onward(0, 2)
+            assert r.at_time(1) == 2
+
+    def test_lru_keeps_recent_times(self):
+        r = Real(0, 1)
+        cache = EvalCache(frames=2)
+        for t in (1, 2, 3, 2):
+            cache.touch(t)
+            with cache:
+                r.at_time(t)
+        assert list(cache.store) == [3, 2]
+        assert cache.hits == 1
+        r.set_onward(0, 5)
+        with cache:
+            assert r.at_time(2) == 5
+
+    def test_inactive_outside_block(self):
+        r = Real(0, 1)
+        cache = EvalCache()
+        with cache:
+            pass
+        r.at_time(0)
+        assert cache.stats()['misses'] == 0
+
+
+class TestInterning:
+    """Test slotted attributes and shared default timelines."""
+
+    def test_fresh_attributes_share_timeline(self):
+        a, b = Real(0, 5), Real(0, 5)
+        assert a._tl is b._tl
+        a.set_onward(1, 7)
+        assert b.at_time(2) == 5
+        assert a.at_time(2) == 7
+
+    def test_value_types_kept_apart(self):
+        assert type(Real(0, 1).at_time(0)) is int
+        assert type(Real(0, 1.0).at_time(0)) is float
+        assert type(Coor(0, (1.0, 2)).at_time(0)[0]) is float
+
+    def test_slotted(self):
+        with pytest.raises(AttributeError):
+            Real(0, 1).extra = 1
+
+    def test_deepcopy_keeps_state(self):
+        from copy import deepcopy
+        c = deepcopy(Color(0, '#ff0000'))
+        assert c.use == 'rgb'
+        assert c.at_time(0) == 'rgb(255,0,0)'
+
+
+class TestLongEditChains:
+    """Test that evaluation depth does not grow with the number of edits."""
+
+    def test_held_adds(self):
+        r = Real(0, 0)
+        for i in range(10000):
+            r.add(i, i + 0.5, lambda t: 1, stay=True)
+        assert r.at_time(1e9) == 10000
+        assert r.at_time(5000.25) == 5001
+        assert r.at_times([0.25, 3.0]).tolist() == [1, 4]
+
+    def test_held_coor_shifts(self):
+        c = Coor(0, (0, 0))
+        for i in range(5000):
+            c.add(i, i + 1, lambda t: (1, 2), stay=True)
+        assert c.at_time(1e9) == (5000, 10000)
+
+    def test_many_set_at(self):
+        r = Real(0, 0)
+        for i in range(10000):
+            r.set_at(i, i)
+        assert r.at_time(9999) == 9999
+        assert r.at_time(9999.5) == 0
+
+
+class TestColumns:
+    """Test the column-wise attribute store."""
+
+    def test_move_selected_rows(self):
+        cols = Columns(0, [[0, 0], [10, 10], [20, 20]])
+        cols.move_to(0, 1, (1, 1), easing=easings.linear, index=[0, 2])
+        np.testing.assert_allclose(cols.at_time(0.5), [[0.5, 0.5], [10, 10], [10.5, 10.5]])
+        np.testing.assert_allclose(cols.at_time(2), [[1, 1], [10, 10], [1, 1]])
+        assert cols.last_change == 1
+
+    def test_later_edits_win(self):
+        cols = Columns(0, [1, 2, 3])
+        cols.move_to(1, 3, [9, 9, 9], easing=easings.linear)
+        cols.set_onward(2, 0, index=1)
+        np.testing.assert_allclose(cols.at_time(0), [1, 2, 3])
+        np.testing.assert_allclose(cols.at_time(2), [5, 0, 6])
+        np.testing.assert_allclose(cols.at_time(4), [9, 0, 9])
+
+    def test_move_starts_from_current_value(self):
+        cols = Columns(0, [0.0])
+        cols.set_onward(1, 10)
+        cols.move_to(2, 3, 20, easing=easings.linear)
+        assert cols.at_time(2.5)[0] == pytest.approx(15)
+
+
 class TestReal:
 
     def test_initial_value(self):
@@ -73,6 +449,18 @@ class TestReal:
         r.set(1, 3, lambda t: t * 100, stay=True)
         assert r.at_time(4) == 300        # stays at f(3)
 
+    def test_stay_reads_current_state(self):
+        state = {'v': 1}
+        r = Real(0, 0)
+        r.set(0, 1, lambda t: state['v'], stay=True)
+        r.add(2, 3, lambda t: 1, stay=True)
+        assert r.at_time(1.5) == 1 and r.at_time(4) == 2
+        state['v'] = 5
+        assert r.at_time(1.5) == 5 and r.at_time(4) == 6
+        assert r.at_times([1.5, 4]).tolist() == [5, 6]
+        state['v'] = 7
+        assert r.at_times([1.5, 4]).tolist() == [7, 8]
+
     def test_add_accumulates(self):
         r = Real(0, 10)
         r.add(1, 3, lambda t: 5)
@@ -270,6 +658,31 @@ class TestColor:
         # The two midpoints should differ (HSL goes through hue wheel)
         assert hsl_mid != pytest.approx(rgb_mid, abs=1)
 
+    def test_interpolate_oklab(self):
+        red = Color(0, '#ff0000')
+        blue = Color(0, '#0000ff')
+        mid = red.interpolate(blue, 0, 1, color_space='oklab')
+        assert mid.time_func(0) == pytest.approx((255, 0, 0), abs=1e-3)
+        assert mid.time_func(1) == pytest.approx((0, 0, 255), abs=1e-3)
+        # Perceptual blend keeps the midpoint brighter than the RGB average
+        assert sum(mid.time_func(0.5)) > 255 + 1
+
+    @pytest.mark.parametrize('space', ['rgb', 'hsl', 'oklab'])
+    def test_interpolate_at_times_matches(self, space):
+        red = Color(0, '#ff0000')
+        teal = Color(0, '#00ff88')
+        mid = red.interpolate(teal, 0, 2, easing=easings.smooth, color_space=space)
+        ts = np.linspace(-0.5, 2.5, 13)
+        batch = mid.at_times(ts)
+        for t, row in zip(ts, batch):
+            assert tuple(row) == pytest.approx(mid.time_func(float(t)), abs=1e-9)
+
+    def test_color_strings_cached(self):
+        c = Color(0, (10.4, 20.6, 30))
+        assert c.at_time(0) == 'rgb(10,21,30)'
+        assert c.at_time(0) is c.at_time(1)
+        assert c.at_time(0, rounding_func=int) == 'rgb(10,20,30)'
+
     def test_set_onward_changes_color(self):
         c = Color(0, '#ff0000')
         c.set_onward(1, '#00ff00')
@@ -1,13 +1,25 @@
 """Tests for VectorMathAnim canvas: rendering, camera, object management."""
+import io
+import json
+import math
 import os
 import re
+import subprocess
 import tempfile
 import pytest
 
-from vectormation._canvas import VectorMathAnim
-from vectormation._shapes import Circle, Rectangle, Line
+import numpy as np
+
+from vectormation._canvas import VectorMathAnim, FragmentCache, _GifWriter, _resume_chunks
+from vectormation._raster import (PillowBackend, RenderBackend, SVGBackend,
+                                  _damage_rects, _straight_alpha, _stroke_shapes)
+from vectormation._shapes import Circle, Dot, Rectangle, Line
+from vectormation._shapes_ext import Path, Text
+from vectormation._axes import NumberPlane
+from vectormation._base import VCollection
 from vectormation._constants import CANVAS_WIDTH, CANVAS_HEIGHT
 import vectormation.easings as easings
+from vectormation.attributes import Real
 
 
 @pytest.fixture
@@ -103,6 +115,569 @@ class TestFrameGeneration:
             content = f.read()
         assert '<svg' in content
 
+    def test_compiled_frames_match(self, canvas):
+        c = Circle(r=50, cx=100, cy=100)
+        c.shift(dx=200, start=0, end=1)
+        c.fadeout(start=0.5, end=1)
+        canvas.add_objects(c)
+        times = list(canvas._frame_times(0, 1, 10))
+        frames = [canvas.generate_frame_svg(t) for t in times]
+        canvas.compile_timelines(0, 1, fps=10)
+        assert [canvas.generate_frame_svg(t) for t in times] == frames
+
+    def test_compiled_frames_follow_edited_dependency(self, canvas):
+        k = Real(0, 100.5)
+        c = Circle(r=50, cx=100, cy=100)
+        c.c.set_onward(0, lambda t: (k.at_time(t), 100.5))
+        canvas.add_objects(c)
+        canvas.compile_timelines(0, 1, fps=10)
+        before = canvas.generate_frame_svg(0.5)
+        k.set_onward(0, 300.5)
+        after = canvas.generate_frame_svg(0.5)
+        assert after != before
+        assert "cx='300.5'" in after
+
+    def test_write_frame_svg_streams_same_output(self, canvas):
+        c = Circle(r=50.123456, cx=100.98765, cy=100)
+        c.shift(dx=200, start=0, end=1)
+        canvas.add_objects(c, Rectangle(10.55555, 10))
+        buf = io.StringIO()
+        canvas.write_frame_svg(buf, 0.3)
+        assert buf.getvalue() == canvas.generate_frame_svg(0.3)
+
+    def test_numbers_rounded_at_precision(self, canvas):
+        canvas.add_objects(Circle(r=50.123456, cx=100.98765, cy=100))
+        assert "r='50.12'" in canvas.generate_frame_svg(0)
+        canvas.precision = 4
+        svg = canvas.generate_frame_svg(0)
+        assert "r='50.1235'" in svg and "cx='100.9877'" in svg
+
+    def test_fragments_rounded_like_whole_svg(self, canvas):
+        c = Circle(r=50.123456, cx=100.98765, cy=100, stroke_width=2.345678)
+        c.styling.dx.set_onward(0, 10.98765)
+        group = VCollection(Text('pi 3.14159', x=1.23456, y=2),
+                            Path('M 0.12345 1 L 2.5 3.98765'))
+        group.scale(1.23456)
+        canvas.add_objects(c, group)
+        for precision in (2, 4, 2):
+            canvas.precision = precision
+            svg = canvas.generate_frame_svg(0)
+            for obj in (c, group):
+                assert canvas._round_svg_values(obj.to_svg(0), precision) in svg
+        assert "translate(10.99,0)" in svg and "stroke-width='2.35'" in svg
+
+    def test_style_classes_share_repeated_styles(self, canvas):
+        for i in range(20):
+            canvas.add_objects(Rectangle(10, 10, x=i * 20, fill='#58C4DD', stroke_width=2))
+        canvas.add_objects(Circle(r=5, fill='#ff0000'))
+        inline = canvas.generate_frame_svg(0)
+        canvas.style_classes = True
+        shared = canvas.generate_frame_svg(0)
+        assert len(shared) < len(inline)
+        # The first use stays inline, styles used once get no rule
+        assert shared.count("class='vm0'") == 19
+        assert shared.count("fill='rgb(88,196,221)'") == 1
+        assert "fill='rgb(255,0,0)'" in shared
+        assert '<style>.vm0{fill:rgb(88,196,221);' in shared
+        assert '.vm1' not in shared
+
+    def test_style_classes_keep_transforms_inline(self, canvas):
+        canvas.add_objects(Circle(r=5))
+        c = Circle(r=5)
+        c.styling.dx.set_onward(0, 10)
+        canvas.add_objects(c)
+        canvas.style_classes = True
+        svg = canvas.generate_frame_svg(0)
+        assert "class='vm0' transform='translate(10,0)'" in svg
+        # Outside a frame, styles are inline again
+        assert 'class=' not in c.styling.svg_style(0)
+
+    def test_map_frames_in_workers_keeps_order(self, canvas):
+        c = Circle(r=50)
+        c.shift(dx=200, start=0, end=1)
+        canvas.add_objects(c)
+        jobs = [(t,) for t in canvas._frame_times(0, 1, 20)]
+        serial = list(canvas._map_frames(VectorMathAnim.generate_frame_svg, jobs))
+        parallel = list(canvas._map_frames(VectorMathAnim.generate_frame_svg, jobs, workers=3))
+        assert parallel == serial and len(serial) == 21
+
+
+class TestFragmentCache:
+
+    @pytest.fixture
+    def cached(self, canvas):
+        canvas.fragment_cache = FragmentCache()
+        return canvas
+
+    def test_static_object_reuses_fragment(self, cached, canvas):
+        canvas.add_objects(Circle(r=50, cx=100, cy=100))
+        reference = VectorMathAnim(canvas.save_dir)
+        reference.add_objects(*canvas.objects.values())
+        frames = [canvas.generate_frame_svg(t) for t in (0, 0.5, 1, 2)]
+        assert frames[1:] == frames[:1] * 3
+        assert frames[0] == reference.generate_frame_svg(0)
+        assert canvas.fragment_cache.stats()['hits'] >= 2
+
+    def test_moving_object_matches_uncached(self, cached, canvas):
+        c = Circle(r=50)
+        c.shift(dx=200, start=0, end=1)
+        canvas.add_objects(c)
+        times = [0, 0.25, 0.5, 0.75, 1, 1.5, 2]
+        frames = [canvas.generate_frame_svg(t) for t in times]
+        canvas.fragment_cache = None
+        assert frames == [canvas.generate_frame_svg(t) for t in times]
+
+    def test_edit_invalidates_fragment(self, cached, canvas):
+        c = Circle(r=50)
+        canvas.add_objects(c)
+        canvas.generate_frame_svg(0)
+        canvas.generate_frame_svg(1)
+        c.styling.fill.set_onward(0, '#ff0000')
+        assert "fill='rgb(255,0,0)'" in canvas.generate_frame_svg(1)
+
+    def test_updaters_are_skipped(self, cached, canvas):
+        c = Circle(r=50)
+        c.add_updater(lambda obj, t: None)
+        canvas.add_objects(c)
+        canvas.generate_frame_svg(0)
+        canvas.generate_frame_svg(1)
+        stats = canvas.fragment_cache.stats()
+        assert stats['skipped'] == 2 and stats['hits'] == 0
+        canvas.fragment_cache.reset_stats()
+        assert canvas.fragment_cache.stats() == {
+            'hits': 0, 'misses': 0, 'skipped': 0, 'hit_rate': 0.0}
+
+
+class TestHeldFrames:
+
+    def test_static_stretch_is_held(self, canvas):
+        c = Circle(r=50)
+        c.shift(dx=200, start=1)
+        c.styling.fill.set_onward(2, '#ff0000')
+        canvas.add_objects(c)
+        times = [0, 0.5, 1, 1.5, 2, 2.5, 3]
+        assert canvas._held_frames(times) == [
+            False, True, False, True, False, True, True]
+
+    def test_animation_is_not_held(self, canvas):
+        c = Circle(r=50)
+        c.shift(dx=200, start=1, end=2)
+        canvas.add_objects(c)
+        assert canvas._held_frames([0, 0.5, 1, 1.25, 1.5]) == [False, True, False, False, False]
+
+    def test_held_frames_match_rendered(self, canvas):
+        c = Circle(r=50)
+        c.shift(dx=200, start=1, end=2)
+        canvas.add_objects(c)
+        times = [i / 4 for i in range(13)]
+        for t, held in zip(times[1:], canvas._held_frames(times)[1:]):
+            if held:
+                assert canvas.generate_frame_svg(t) == canvas.generate_frame_svg(t - 0.25)
+
+    def test_updaters_disable_holding(self, canvas):
+        c = Circle(r=50)
+        c.add_updater(lambda obj, t: None)
+        canvas.add_objects(c)
+        assert not any(canvas._held_frames([0, 1, 2]))
+
+    def test_export_frames_reuses_results(self, canvas):
+        canvas.add_objects(Circle(r=50))
+        rendered = []
+        def render(canvas, time):
+            rendered.append(time)
+            return time
+        jobs = [(0,), (1,), (2,)]
+        assert list(canvas._export_frames(render, jobs)) == [(False, 0), (True, 0), (True, 0)]
+        assert rendered == [0]
+        rendered.clear()
+        assert list(canvas._export_frames(render, jobs, dedupe=False)) == [(False, 0), (False, 1), (False, 2)]
+
+
+class _FakeFfmpeg:
+    """Stands in for ffmpeg: records each command and the frames piped to it.
+
+    Encoders whose output file name is in *failing* exit with an error;
+    the others write their output file when they exit.
+    """
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.runs = []   # (argv, frames written to stdin)
+
+    def Popen(self, args, **kwargs):
+        return _FakeEncoder(self, args)
+
+    def run(self, args, **kwargs):
+        listing = args[args.index('-i') + 1]
+        with open(listing, encoding='utf-8') as f:
+            self.runs.append((args, f.read()))
+        with open(args[-1], 'wb') as f:
+            f.write(b'joined')
+        return subprocess.CompletedProcess(args, 0)
+
+
+class _FakeEncoder:
+
+    def __init__(self, ffmpeg, args):
+        self.args = args
+        self.frames = []
+        ffmpeg.runs.append((args, self.frames))
+        self.returncode = 1 if os.path.basename(args[-1]) in ffmpeg.failing else 0
+        self.stdin = self
+        self.stderr = io.BytesIO(b'encoder failed' if self.returncode else b'')
+
+    def write(self, data):
+        self.frames.append(bytes(data))
+
+    def close(self):
+        with open(self.args[-1], 'wb') as f:
+            f.write(b''.join(self.frames))
+
+    def wait(self):
+        return self.returncode
+
+
+class TestStreamVideo:
+
+    @pytest.fixture
+    def ffmpeg(self, monkeypatch):
+        fake = _FakeFfmpeg()
+        monkeypatch.setattr(subprocess, 'Popen', fake.Popen)
+        return fake
+
+    def test_pipes_raw_frames(self, canvas, ffmpeg, tmp_path):
+        pytest.importorskip('PIL')
+        canvas.render_backend = PillowBackend()
+        r = Rectangle(960, 1080, x=0, y=0, fill='#0000ff', fill_opacity=0.5, stroke_width=0)
+        r.shift(dx=480, start=0, end=1)
+        canvas.add_objects(r)
+        out = str(tmp_path / 'out.mp4')
+        assert canvas._stream_video(out, [0, 0.5, 1, 1.5, 2], (48, 27), 24, ['-c:v', 'libx264']) == 5
+        (args, frames), = ffmpeg.runs
+        assert args == ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+                        '-s', '48x27', '-r', '24', '-i', '-', '-c:v', 'libx264', out]
+        assert [len(frame) for frame in frames] == [48 * 27 * 4] * 5
+        assert frames[0] != frames[1] != frames[2]
+        assert frames[3] == frames[2] and frames[4] == frames[2]   # held frames are written again
+        assert frames[0][(10 * 48 + 2) * 4:(10 * 48 + 3) * 4] == bytes((0, 0, 255, 128))
+        assert frames[0][(10 * 48 + 40) * 4 + 3] == 0
+
+    def test_straight_alpha(self):
+        pixels = np.array([[[0, 0, 128, 128], [0, 0, 0, 0], [10, 20, 30, 255]]], dtype=np.uint8)
+        assert _straight_alpha(pixels, 3).tolist() == [[[0, 0, 255, 128], [0, 0, 0, 0], [10, 20, 30, 255]]]
+        assert _straight_alpha(pixels[..., ::-1], 0).tolist() == [[[128, 255, 0, 0], [0, 0, 0, 0], [255, 30, 20, 10]]]
+        opaque = pixels[:, 2:]
+        assert _straight_alpha(opaque, 3) is opaque
+
+    def test_encoder_error_is_raised(self, canvas, ffmpeg, tmp_path):
+        pytest.importorskip('PIL')
+        canvas.render_backend = PillowBackend()
+        ffmpeg.failing.add('out.mp4')
+        with pytest.raises(subprocess.CalledProcessError) as err:
+            canvas._stream_video(str(tmp_path / 'out.mp4'), [0, 1], (48, 27), 24, [])
+        assert err.value.stderr == b'encoder failed'
+
+    def test_render_error_is_not_masked(self, canvas, ffmpeg, tmp_path):
+
+        class Broken(RenderBackend):
+            def raw(self, canvas, time, size):
+                raise ValueError('bad frame')
+
+        canvas.render_backend = Broken()
+        ffmpeg.failing.add('out.mp4')
+        with pytest.raises(ValueError, match='bad frame'):
+            canvas._stream_video(str(tmp_path / 'out.mp4'), [0, 1], (48, 27), 24, [])
+
+
+class TestChunkedExport:
+
+    @staticmethod
+    def _manifest(fps=30):
+        return {'version': 1, 'fps': fps, 'chunks': [
+            {'index': 0, 'file': 'chunk_00000.mp4', 'first': 0, 'frames': 300},
+            {'index': 1, 'file': 'chunk_00001.mp4', 'first': 300, 'frames': 12}]}
+
+    def test_finished_chunks_are_skipped(self, tmp_path):
+        parts = str(tmp_path / 'out.mp4.parts')
+        manifest = self._manifest()
+        assert [c['index'] for c in _resume_chunks(parts, manifest)] == [0, 1]
+        (tmp_path / 'out.mp4.parts' / 'chunk_00000.mp4').write_bytes(b'done')
+        assert [c['index'] for c in _resume_chunks(parts, manifest)] == [1]
+        with open(os.path.join(parts, 'manifest.json')) as f:
+            assert json.load(f) == manifest
+
+    def test_other_export_starts_over(self, tmp_path):
+        parts = str(tmp_path / 'out.mp4.parts')
+        _resume_chunks(parts, self._manifest())
+        (tmp_path / 'out.mp4.parts' / 'chunk_00000.mp4').write_bytes(b'done')
+        assert [c['index'] for c in _resume_chunks(parts, self._manifest(fps=60))] == [0, 1]
+        assert not os.path.exists(os.path.join(parts, 'chunk_00000.mp4'))
+
+    def test_resume_after_crash(self, canvas, tmp_path, monkeypatch):
+        pytest.importorskip('PIL')
+        canvas.render_backend = PillowBackend()
+        c = Circle(r=50, cx=100, cy=100)
+        c.shift(dx=200, start=0, end=1)
+        canvas.add_objects(c)
+        out = str(tmp_path / 'out.mp4')
+        parts = out + '.parts'
+        times = list(canvas._frame_times(0, 1, 10))
+
+        def export(ffmpeg):
+            monkeypatch.setattr(subprocess, 'Popen', ffmpeg.Popen)
+            monkeypatch.setattr(subprocess, 'run', ffmpeg.run)
+            return canvas._export_chunks(out, 0, 1, times, (48, 27), 10, ['-c:v', 'libx264'], 0.3)
+
+        crashed = _FakeFfmpeg(failing=['partial_chunk_00002.mp4'])
+        with pytest.raises(subprocess.CalledProcessError):
+            export(crashed)
+        assert [os.path.basename(args[-1]) for args, _ in crashed.runs] == [
+            'partial_chunk_00000.mp4', 'partial_chunk_00001.mp4', 'partial_chunk_00002.mp4']
+        assert sorted(os.listdir(parts)) == [
+            'chunk_00000.mp4', 'chunk_00001.mp4', 'manifest.json', 'partial_chunk_00002.mp4']
+        with open(os.path.join(parts, 'manifest.json')) as f:
+            manifest = json.load(f)
+        assert manifest['chunk_frames'] == 3 and manifest['size'] == [48, 27]
+        assert [(ch['file'], ch['first'], ch['frames']) for ch in manifest['chunks']] == [
+            ('chunk_00000.mp4', 0, 3), ('chunk_00001.mp4', 3, 3),
+            ('chunk_00002.mp4', 6, 3), ('chunk_00003.mp4', 9, 2)]
+
+        resumed = _FakeFfmpeg()
+        assert export(resumed) == 11
+        *encoded, (concat, listing) = resumed.runs
+        assert [(os.path.basename(args[-1]), len(frames)) for args, frames in encoded] == [
+            ('partial_chunk_00002.mp4', 3), ('partial_chunk_00003.mp4', 2)]
+        assert concat == ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                          '-i', os.path.join(parts, 'chunks.txt'), '-c', 'copy', out]
+        assert listing == ''.join(f"file 'chunk_{i:05d}.mp4'\n" for i in range(4))
+        assert not os.path.exists(parts)
+        with open(out, 'rb') as f:
+            assert f.read() == b'joined'
+
+    def test_edited_scene_reencodes_changed_chunks(self, canvas, tmp_path, monkeypatch):
+        pytest.importorskip('PIL')
+        canvas.render_backend = PillowBackend()
+        c = Circle(r=50, cx=100, cy=100)
+        c.shift(dx=200, start=0, end=1)
+        canvas.add_objects(c)
+        out = str(tmp_path / 'out.mp4')
+        times = list(canvas._frame_times(0, 1, 10))
+        ffmpeg = _FakeFfmpeg(failing=['partial_chunk_00003.mp4'])
+        monkeypatch.setattr(subprocess, 'Popen', ffmpeg.Popen)
+        with pytest.raises(subprocess.CalledProcessError):
+            canvas._export_chunks(out, 0, 1, times, (48, 27), 10, [], 0.3)
+        c.styling.fill.set_onward(0.45, '#ff0000')   # the last frame of chunk 1 onward
+        ffmpeg.runs.clear()
+        ffmpeg.failing.clear()
+        monkeypatch.setattr(subprocess, 'run', ffmpeg.run)
+        assert canvas._export_chunks(out, 0, 1, times, (48, 27), 10, [], 0.3) == 11
+        assert [os.path.basename(args[-1]) for args, _ in ffmpeg.runs[:-1]] == [
+            'partial_chunk_00001.mp4', 'partial_chunk_00002.mp4', 'partial_chunk_00003.mp4']
+
+
+class TestGifWriter:
+
+    @staticmethod
+    def _frame(color, box):
+        from PIL import Image
+        im = Image.new('RGB', (40, 30), (255, 255, 255))
+        im.paste(color, box)
+        return im
+
+    def _roundtrip(self, frames, palette=None):
+        from PIL import Image
+        buf = io.BytesIO()
+        writer = _GifWriter(buf, 50, palette=palette)
+        for frame in frames:
+            writer.append(frame)
+        writer.close()
+        gif = Image.open(io.BytesIO(buf.getvalue()))
+        out = []
+        for i in range(gif.n_frames):
+            gif.seek(i)
+            rgb = gif.convert('RGB')
+            out.append((gif.info['duration'], rgb.getpixel((5, 5)), rgb.getpixel((25, 15))))
+        return out
+
+    def test_frames_are_cropped_and_repeats_merged(self):
+        pytest.importorskip('PIL')
+        red = self._frame((255, 0, 0), (0, 0, 10, 10))
+        frames = [self._frame((0, 0, 0), (0, 0, 1, 1)), red, red.copy(),
+                  self._frame((0, 0, 255), (20, 10, 30, 20))]
+        white, r, b = (255, 255, 255), (255, 0, 0), (0, 0, 255)
+        assert self._roundtrip(frames) == [(50, white, white), (100, r, white), (50, white, b)]
+
+    def test_shared_palette(self):
+        Image = pytest.importorskip('PIL.Image')
+        frames = [self._frame((255, 0, 0), (0, 0, 10, 10)), self._frame((0, 0, 255), (20, 10, 30, 20))]
+        sheet = Image.new('RGB', (40, 60))
+        sheet.paste(frames[0], (0, 0))
+        sheet.paste(frames[1], (0, 30))
+        out = self._roundtrip(frames, palette=sheet.quantize(256))
+        assert out == [(50, (255, 0, 0), (255, 255, 255)), (50, (255, 255, 255), (0, 0, 255))]
+
+
+class TestPillowBackend:
+
+    @pytest.fixture
+    def backend(self):
+        pytest.importorskip('PIL')
+        return PillowBackend()
+
+    def test_default_backend_is_svg(self, canvas):
+        assert isinstance(canvas.render_backend, SVGBackend)
+
+    def test_draws_fill_and_stroke(self, canvas, backend):
+        canvas.set_background(fill='#000000')
+        canvas.add_objects(Circle(r=100, cx=400, cy=300, fill='#ff0000', fill_opacity=1,
+                                  stroke='#ffffff', stroke_width=10))
+        im = backend.image(canvas, 0, (CANVAS_WIDTH, CANVAS_HEIGHT))
+        assert backend.drawn == 1 and backend.fallbacks == 0
+        assert im.getpixel((400, 300)) == (255, 0, 0, 255)
+        assert im.getpixel((500, 300)) == (255, 255, 255, 255)
+        assert im.getpixel((700, 300)) == (0, 0, 0, 255)
+        raw = backend.raw(canvas, 0, (CANVAS_WIDTH, CANVAS_HEIGHT))
+        assert raw == im.tobytes() and backend.pix_fmt == 'rgba'
+
+    def test_transform_and_opacity(self, canvas, backend):
+        r = Rectangle(100, 100, x=0, y=0, fill='#0000ff', fill_opacity=1, stroke_width=0, opacity=0.5)
+        r.styling.dx.set_onward(0, 300)
+        canvas.add_objects(r)
+        im = backend.image(canvas, 0, (CANVAS_WIDTH, CANVAS_HEIGHT))
+        assert im.getpixel((350, 50)) == (0, 0, 255, 128)
+        assert im.getpixel((50, 50))[3] == 0
+
+    def test_evenodd_leaves_hole(self, canvas, backend):
+        d = 'M 0 0 L 200 0 L 200 200 L 0 200 Z M 50 50 L 150 50 L 150 150 L 50 150 Z'
+        canvas.add_objects(Path(d, fill='#00ff00', fill_opacity=1, stroke_width=0, fill_rule='evenodd'))
+        im = backend.image(canvas, 0, (CANVAS_WIDTH, CANVAS_HEIGHT))
+        assert im.getpixel((20, 100))[:3] == (0, 255, 0)
+        assert im.getpixel((100, 100))[3] == 0
+
+    @staticmethod
+    def _star(cx, cy, r):
+        """Return the pentagram through five points on a circle, its outline and its inner pentagon."""
+        outer = [(cx + r * math.sin(i * math.pi * 2 / 5), cy - r * math.cos(i * math.pi * 2 / 5)) for i in range(5)]
+        ri = r * math.cos(math.pi * 2 / 5) / math.cos(math.pi / 5)
+        inner = [(cx + ri * math.sin((i + 0.5) * math.pi * 2 / 5), cy - ri * math.cos((i + 0.5) * math.pi * 2 / 5))
+                 for i in range(5)]
+        star = [outer[i * 2 % 5] for i in range(5)]
+        outline = [p for pair in zip(outer, inner) for p in pair]
+        return star, outline, inner
+
+    @staticmethod
+    def _expected(size, scale, *polys):
+        """Mask of the pixel centers inside an odd number of the simple polygons *polys* (canvas units)."""
+        ys, xs = np.mgrid[:size[1], :size[0]] + 0.5
+        inside = np.zeros((size[1], size[0]), dtype=bool)
+        for poly in polys:
+            pts = np.asarray(poly) * scale
+            odd = np.zeros_like(inside)
+            for (x0, y0), (x1, y1) in zip(pts, np.roll(pts, -1, axis=0)):
+                crosses = (y0 > ys) != (y1 > ys)
+                with np.errstate(all='ignore'):
+                    odd ^= crosses & (xs > x0 + (ys - y0) * (x1 - x0) / (y1 - y0))
+            inside ^= odd
+        return inside
+
+    @staticmethod
+    def _d(*polys):
+        return ' '.join('M ' + ' L '.join(f'{x} {y}' for x, y in poly) + ' Z' for poly in polys)
+
+    def _mask(self, canvas, path, size):
+        canvas.add_objects(path)
+        im = PillowBackend(supersample=1).image(canvas, 0, size)
+        return np.asarray(im.getchannel('A')) == 255
+
+    @pytest.mark.parametrize('rule', ['nonzero', 'evenodd'])
+    def test_pentagram_fill_rule(self, canvas, rule):
+        pytest.importorskip('PIL')
+        star, outline, inner = self._star(960, 540, 500)
+        path = Path(self._d(star), fill='#00ff00', fill_opacity=1, stroke_width=0, fill_rule=rule)
+        expected = self._expected((192, 108), 0.1, outline, *([inner] if rule == 'evenodd' else []))
+        assert (self._mask(canvas, path, (192, 108)) == expected).all()
+
+    @pytest.mark.parametrize('rule,reverse,parts', [
+        ('nonzero', False, 1), ('nonzero', True, 2), ('evenodd', False, 2)])
+    def test_overlapping_subpaths(self, canvas, rule, reverse, parts):
+        pytest.importorskip('PIL')
+        a = [(203.3, 151.7), (1204.1, 151.7), (1204.1, 803.9), (203.3, 803.9)]
+        b = [(702.6, 402.2), (1702.8, 402.2), (1702.8, 1003.4), (702.6, 1003.4)]
+        path = Path(self._d(a, b[::-1] if reverse else b), fill='#00ff00', fill_opacity=1,
+                    stroke_width=0, fill_rule=rule)
+        union = [a[0], a[1], (1204.1, 402.2), b[1], b[2], b[3], (702.6, 803.9), a[3]]
+        overlap = [b[0], (1204.1, 402.2), a[2], (702.6, 803.9)]
+        expected = self._expected((192, 108), 0.1, union, *([overlap] if parts == 2 else []))
+        assert (self._mask(canvas, path, (192, 108)) == expected).all()
+
+    def test_unsupported_frame_uses_fallback(self, canvas):
+        pytest.importorskip('PIL')
+
+        class Solid(RenderBackend):
+            def raw(self, canvas, time, size):
+                return bytes((9, 9, 9, 255)) * (size[0] * size[1])
+
+        backend = PillowBackend(fallback=Solid())
+        canvas.add_objects(Circle(r=10), Text('hi'))
+        im = backend.image(canvas, 0, (40, 30))
+        assert backend.fallbacks == 1 and im.getpixel((0, 0)) == (9, 9, 9, 255)
+
+    def test_dirty_rects_match_full_redraw(self, canvas, backend):
+        dot = Dot(cx=300, cy=300, fill='#ff0000')
+        dot.shift(dx=400, dy=100, start=0, end=1)
+        canvas.add_objects(NumberPlane(), dot)
+        full = PillowBackend(dirty_rects=False)
+        size = (480, 270)
+        for t in (0, 0.25, 0.5, 1, 1.5):
+            assert backend.raw(canvas, t, size) == full.raw(canvas, t, size)
+        assert backend.partial == 4 and full.partial == 0 and backend.fallbacks == 0
+
+    @pytest.mark.parametrize('dirty_rects,static_layer', [(True, False), (False, True), (True, True)])
+    def test_moving_over_self_intersecting_path(self, canvas, dirty_rects, static_layer):
+        pytest.importorskip('PIL')
+        star, _, _ = self._star(960, 540, 450)
+        dot = Dot(r=40, cx=400, cy=300, fill='#ff0000')
+        dot.shift(dx=1100, dy=500, start=0, end=1)
+        canvas.add_objects(Path(self._d(star), fill='#00ff00', fill_opacity=0.6, stroke='#ffffff', stroke_width=4),
+                           dot)
+        backend = PillowBackend(dirty_rects=dirty_rects, static_layer=static_layer)
+        full = PillowBackend(dirty_rects=False, static_layer=False)
+        size = (480, 270)
+        for t in (0, 0.2, 0.4, 0.5, 0.6, 0.8, 1, 1.5):
+            assert backend.raw(canvas, t, size) == full.raw(canvas, t, size)
+        assert backend.fallbacks == 0
+        assert (backend.partial > 0) == dirty_rects and (backend.layers > 0) == static_layer
+
+    def test_static_layer_is_reused(self, canvas):
+        pytest.importorskip('PIL')
+        dot = Dot(cx=300, cy=300, fill='#ff0000')
+        dot.shift(dx=400, start=0, end=1)
+        late = Circle(r=80, cx=1500, cy=500, fill='#00ff00', fill_opacity=1)
+        late.shift(dy=100, start=0, end=0.5)
+        canvas.add_objects(NumberPlane(), late, dot)
+        layered = PillowBackend(dirty_rects=False)
+        plain = PillowBackend(dirty_rects=False, static_layer=False)
+        size = (480, 270)
+        for t in (0, 0.25, 0.5, 0.75, 1, 1.5):
+            assert layered.raw(canvas, t, size) == plain.raw(canvas, t, size)
+        # The plane, then the circle once it stops, then the dot
+        assert layered.layers == 3 and plain.layers == 0
+
+    def test_damage_rects(self):
+        size = (256, 256)
+        assert _damage_rects([], size) == []
+        assert sorted(_damage_rects([(10, 10, 20, 20), (200, 150, 210, 160)], size)) == [
+            (0, 0, 64, 64), (192, 128, 256, 192)]
+        assert _damage_rects([(10, 10, 20, 100), (50, 10, 100, 20)], size) == [
+            (0, 0, 128, 64), (0, 64, 64, 128)]
+        assert _damage_rects([(0, 0, 200, 200)], size) is None
+
+    def test_miter_join_reaches_corner(self):
+        square = np.array([[0, 0], [100, 0], [100, 100], [0, 100]], dtype=float)
+        polys, circles = _stroke_shapes(square, True, 5, 'butt', 'miter')
+        corners = {tuple(np.round(q, 6)) for poly in polys for q in poly}
+        assert (-5.0, -5.0) in corners and (105.0, 105.0) in corners and not circles
+
 
 class TestCamera:
 
@@ -149,6 +149,18 @@ class TestBulkOperations:
         assert first_fill == 'rgb(255,0,0)'
         assert last_fill == 'rgb(0,0,255)'
 
+    def test_set_color_by_gradient_matches_interpolate_color(self):
+        from vectormation.colors import interpolate_color
+        from vectormation.attributes import Color
+        circles = _make_circles(7, r=20)
+        VCollection(*circles).set_color_by_gradient('#ff0000', '#00ff00', '#0000ff')
+        for i, c in enumerate(circles):
+            seg = i / 6 * 2
+            idx = min(int(seg), 1)
+            expected = interpolate_color(['#ff0000', '#00ff00', '#0000ff'][idx],
+                                         ['#ff0000', '#00ff00', '#0000ff'][idx + 1], seg - idx)
+            assert c.styling.fill.at_time(0) == Color(0, expected).at_time(0)
+
     def test_filter(self):
         c_big = Circle(r=100, cx=0, cy=0)
         c_small = Circle(r=10, cx=0, cy=0)
@@ -1,5 +1,6 @@
 """Tests for easing functions: boundary conditions, mathematical properties, combinators."""
 import math
+import numpy as np
 import pytest
 
 import vectormation.easings as easings
@@ -69,6 +70,23 @@ class TestZeroDecorator:
         assert easing(1.1) == 0
 
 
+class TestArrayInput:
+    """Easings accept NumPy arrays and agree with the scalar path."""
+
+    @pytest.mark.parametrize("easing", STANDARD_EASINGS + OVERSHOOTING_EASINGS
+                             + [easings.there_and_back, easings.wiggle,
+                                easings.there_and_back_with_pause, easings.running_start],
+                             ids=lambda e: e.__name__)
+    def test_matches_scalar(self, easing):
+        ts = np.linspace(-0.25, 1.25, 121)
+        expected = [easing(float(t)) for t in ts]
+        assert easing(ts) == pytest.approx(expected, abs=1e-12)
+
+    def test_unregistered_easing_falls_back_elementwise(self):
+        custom = easings.unit_interval(lambda t: math.sin(t))
+        assert custom(np.array([-1.0, 0.5, 2.0])) == pytest.approx([0, math.sin(0.5), 1])
+
+
 class TestStandardEasingRange:
     """Standard (non-overshooting) easings should stay in [0, 1]."""
 
@@ -3,7 +3,7 @@ import math
 import pytest
 
 from vectormation._shapes import (
-    Polygon, Circle, Ellipse, Rectangle, Dot, Lines, RoundedRectangle,
+    Polygon, Circle, Ellipse, Rectangle, Dot, DotCloud, Lines, RoundedRectangle,
 )
 from vectormation._constants import ORIGIN
 import vectormation.easings as easings
@@ -373,6 +373,28 @@ class TestDot:
         assert d.center(0) == pytest.approx((100, 200))
 
 
+class TestDotCloud:
+
+    def test_svg_has_one_circle_per_visible_dot(self):
+        cloud = DotCloud([(0, 0), (10, 20), (30, 40)], r=5, fill=['#f00', '#0f0', '#00f'])
+        cloud.set_fill_opacity(0, index=1)
+        svg = cloud.to_svg(0)
+        assert svg.count('<circle') == 2
+        assert "fill='rgb(255,0,0)'" in svg
+        assert "cx='30.0' cy='40.0' r='5.0'" in svg
+
+    def test_animated_points_and_shift(self):
+        cloud = DotCloud([(0, 0), (100, 0)])
+        cloud.set_points([(50, 50)], start=0, end=1, easing=easings.linear, index=[0])
+        cloud.shift(dx=10)
+        assert cloud.get_points(0.5).tolist() == [[35, 25], [110, 0]]
+        assert cloud.last_change == 1
+
+    def test_bbox_covers_radii(self):
+        cloud = DotCloud([(0, 0), (100, 50)], r=5)
+        assert cloud.bbox(0) == pytest.approx((-5, -5, 110, 60))
+
+
 class TestLines:
 
     def test_lines_is_open_polygon(self):
@@ -54,3 +54,123 @@ class TestSetStyle:
         c = Circle(r=50)
         c.set_style(start=0, stroke_width=10)
         assert c.styling.stroke_width.at_time(0) == pytest.approx(10)
+
+
+class TestStyleCache:
+
+    def test_static_style_is_reused(self):
+        s = Circle(r=50, fill='#ff0000').styling
+        s.svg_style(0)
+        first = s.svg_style(0.5)
+        assert s.svg_style(3) is first
+
+    def test_unrelated_edit_keeps_cache(self):
+        s = Circle(r=50, fill='#ff0000').styling
+        s.svg_style(0)
+        first = s.svg_style(0.5)
+        Circle(r=10).styling.opacity.set_onward(1, 0.5)
+        assert s.svg_style(3) is first
+
+    def test_edit_invalidates(self):
+        s = Circle(r=50, fill='#ff0000').styling
+        before = s.svg_style(0.5)
+        s.fill.set_onward(1, '#00ff00')
+        assert s.svg_style(0.5) == before
+        assert 'rgb(0,255,0)' in s.svg_style(2)
+
+    def test_window_ends_at_next_change(self):
+        s = Circle(r=50).styling
+        s.stroke_width.set_onward(2, 9, lincl=False)
+        assert "stroke-width='9'" not in s.svg_style(1)
+        assert "stroke-width='9'" not in s.svg_style(2)
+        assert "stroke-width='9'" in s.svg_style(2.5)
+        assert "stroke-width='9'" not in s.svg_style(1.5)
+
+    def test_animated_attribute_is_recomputed(self):
+        s = Circle(r=50).styling
+        s.opacity.move_to(0, 1, 0)
+        values = {s.svg_style(t) for t in (0.2, 0.4, 0.6)}
+        assert len(values) == 3
+        assert s.svg_style(2) is s.svg_style(3)
+
+    def test_assignment_invalidates(self):
+        from vectormation.attributes import Color
+        s = Circle(r=50, fill='#ff0000').styling
+        s.svg_style(0)
+        s.fill = Color(0, '#0000ff')
+        assert 'rgb(0,0,255)' in s.svg_style(0)
+
+    def test_transform_cached_separately(self):
+        s = Circle(r=50).styling
+        s.dx.move_to(0, 1, 100)
+        assert s.svg_style(0.5) != s.svg_style(0.25)
+        assert s.transform_style(2) == 'translate(100,0)'
+
+
+class TestTransformMatrix:
+
+    def test_identity_is_none(self):
+        assert Styling({}).transform_matrix(0) is None
+
+    def test_matches_transform_chain(self):
+        s = Styling({'rotation': (90, 10, 0), 'dx': 5, 'scale_x': 2, 'skew_x': 45})
+        a, b, c, d, e, f = s.transform_matrix(0)
+        # (1, 1) -> skewX(45) (2, 1) -> scale (4, 1) -> translate (9, 1)
+        # -> rotate(270, 10, 0) (11, 1)
+        assert (a + c + e, b + d + f) == pytest.approx((11, 1))
+
+    def test_compose_transforms_emits_single_matrix(self):
+        s = Styling({'dx': 5, 'scale_y': 2})
+        s.compose_transforms = True
+        assert s.transform_style(0) == 'matrix(1,0,0,2,5,0)'
+        assert "transform='matrix(1,0,0,2,5,0)'" in s.svg_style(0)
+
+    def test_transformed_bbox_matches_adjusted_bbox(self):
+        import svgpathtools
+        from vectormation.morphing import Path
+        path = Path(*svgpathtools.parse_path('M 0 0 C 10 40 50 -20 60 10 L 30 80'))
+        s = Styling({'rotation': (30, 5, 5), 'dx': 7, 'scale_x': 1.5})
+        expected = path.adjusted_bbox(*s.transform_style(0).split())
+        assert path.transformed_bbox(s.transform_matrix(0)) == pytest.approx(expected)
+
+
+class TestInterpolateMany:
+
+    def _pairs(self, n=4):
+        src = [Styling({'fill': '#ff0000', 'opacity': 1, 'dx': i}) for i in range(n)]
+        dst = [Styling({'fill': '#0000ff', 'opacity': 0.5, 'dx': i}) for i in range(n)]
+        return list(zip(src, dst))
+
+    def test_matches_pairwise_interpolate(self):
+        import vectormation.easings as easings
+        pairs = self._pairs()
+        batch = Styling.interpolate_many(pairs, 0, 2, easing=easings.smooth)
+        for (a, b), s in zip(pairs, batch):
+            single = a.interpolate(b, 0, 2, easing=easings.smooth)
+            for t in (-1, 0, 0.3, 1, 2, 3):
+                assert s.svg_style(t) == single.svg_style(t)
+
+    def test_changing_attribute_shares_one_lerp(self):
+        batch = Styling.interpolate_many(self._pairs(), 0, 1)
+        lerps = {s.opacity.time_func.segs[0].func.lerp for s in batch}
+        assert len(lerps) == 1
+        assert [s.opacity.at_time(0.5) for s in batch] == [0.75] * 4
+
+    def test_static_attribute_shares_timeline(self):
+        batch = Styling.interpolate_many(self._pairs(), 0, 1)
+        assert batch[0].stroke_width._tl is batch[1].stroke_width._tl
+        batch[0].stroke_width.set_onward(0, 9)
+        assert batch[1].stroke_width.at_time(0.5) == 4
+
+    def test_exact_endpoint_types(self):
+        import vectormation.easings as easings
+        s = Styling.interpolate_many([(Styling({'stroke_width': 4}),
+                                       Styling({'stroke_width': 2}))], 0, 1,
+                                     easing=easings.smooth)[0]
+        # Before the start the easing gives an exact 0, so the int survives
+        assert "stroke-width='4'" in s.svg_style(-1)
+        assert "stroke-width='2'" in s.svg_style(2)
+
+    def test_rejects_non_styling(self):
+        with pytest.raises(TypeError):
+            Styling.interpolate_many([(Styling({}), 'red')], 0, 1)
@@ -1,7 +1,7 @@
 """VectorMation -- vector-based math animation engine."""
 from vectormation.objects import (
     VectorMathAnim, VObject, VCollection, MorphObject,
-    Polygon, Circle, Ellipse, Dot, LabeledDot, Rectangle, RoundedRectangle, EquilateralTriangle,
+    Polygon, Circle, Ellipse, Dot, DotCloud, LabeledDot, Rectangle, RoundedRectangle, EquilateralTriangle,
     Line, Lines, DashedLine, Text, Image, Path, Trace, TexObject, SplitTexObject,
     Graph, FunctionGraph, Axes, NumberPlane, from_svg, from_svg_file, parse_args, CountAnimation,
     RegularPolygon, Star, Arrow, DoubleArrow, CurvedArrow, Brace, Arc, Wedge, Sector,
@@ -35,6 +35,9 @@ from vectormation._base_effects import _VObjectEffectsMixin
 
 class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
     """Base class for all vector objects with time-varying attributes."""
+    # False for classes whose SVG depends on the time other than through
+    # their attributes, so the canvas FragmentCache never reuses it
+    _fragment_cacheable = True
 
     @abstractmethod
     def __init__(self, creation: float = 0, z: float = 0):
@@ -204,7 +207,7 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
             cur_c = getattr(self.styling, attr_name)
             saved_c = getattr(saved_styling, attr_name)
             if isinstance(cur_c, attributes.Color) and isinstance(saved_c, attributes.Color):
-                saved_rgb = saved_c.time_func(st)
+                saved_rgb = saved_c._tl(st)
                 restore_c = attributes.Color(start, saved_rgb)
                 if end is None:
                     cur_c.set_to(restore_c)
@@ -989,7 +992,7 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
 
     def set_color(self, start: float = 0, end: float = 1, fill=None, stroke=None, easing=easings.smooth, color_space='rgb'):
         """Animate fill and/or stroke color change over [start, end].
-        color_space: 'rgb' or 'hsl' (smoother for hue transitions)."""
+        color_space: 'rgb', 'hsl' (smoother for hue transitions) or 'oklab' (perceptually even)."""
         for attr_name, target in [('fill', fill), ('stroke', stroke)]:
             if target is None:
                 continue
@@ -1017,7 +1020,7 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
         style_attr = getattr(self.styling, attr)
         if not isinstance(style_attr, attributes.Color):
             return self
-        base_rgb = style_attr.time_func(start)
+        base_rgb = style_attr._tl(start)
         wave_rgb = _hex_to_rgb(wave_color)
         _d = max(dur, 1e-9)
         _w = max(width, 0.01)
@@ -1126,9 +1129,9 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
 
     def set_color_if(self, predicate, color, start: float = 0, end: float | None = None):
         """Set fill to *color* when ``predicate(t)`` is True, revert otherwise."""
-        _orig_rgb = self.styling.fill.time_func(start)
+        _orig_rgb = self.styling.fill._tl(start)
         _new_color = attributes.Color(0, color)
-        _new_rgb = _new_color.time_func(0)
+        _new_rgb = _new_color._tl(0)
         def _update(obj, t):
             if predicate(t):
                 obj.styling.fill.set_onward(t, lambda _, _c=_new_rgb: _c)
@@ -1325,7 +1328,7 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
 
     def flash(self, start: float = 0, end: float = 1, color='#FFFF00', easing=easings.there_and_back):
         """Briefly flash a fill color and return to original."""
-        original = self.styling.fill.time_func(start)
+        original = self.styling.fill._tl(start)
         if not isinstance(original, tuple):
             return self
         _, target_color = attributes.Color(0, color).parse(color)
@@ -1932,8 +1935,8 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
         src = getattr(self.styling, attr)
         if not isinstance(src, attributes.Color):
             return self
-        original_rgb = src.time_func(start)
-        parsed = [original_rgb] + [attributes.Color(0, c).time_func(0) for c in colors]
+        original_rgb = src._tl(start)
+        parsed = [original_rgb] + [attributes.Color(0, c)._tl(0) for c in colors]
         n = len(parsed)
         def _cycle(t, _s=start, _d=dur, _n=n, _p=parsed, _e=easing):
             p = max(0.0, min((t - _s) / _d, 1.0))
@@ -1976,8 +1979,8 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
         src = getattr(self.styling, attr)
         if not isinstance(src, attributes.Color):
             return self
-        original_rgb = src.time_func(start)
-        target_rgb = attributes.Color(0, color).time_func(0)
+        original_rgb = src._tl(start)
+        target_rgb = attributes.Color(0, color)._tl(0)
         pulse_dur = dur / n_pulses
         def _pulse(t, _s=start, _pd=pulse_dur, _orig=original_rgb, _tgt=target_rgb):
             p = (t - _s) % _pd / _pd
@@ -1993,7 +1996,7 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
         src = self.styling.fill
         if not isinstance(src, attributes.Color):
             return self
-        rgb = src.time_func(start)
+        rgb = src._tl(start)
         if not isinstance(rgb, tuple) or len(rgb) < 3:
             return self
         h, s, l = _rgb_to_hsl(rgb[0], rgb[1], rgb[2])
@@ -2395,11 +2398,11 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
 
     def get_fill_color(self, time: float = 0):
         """Return the fill color (hex string) at the given time."""
-        return self._rgb_to_hex(self.styling.fill.time_func(time))
+        return self._rgb_to_hex(self.styling.fill._tl(time))
 
     def get_stroke_color(self, time: float = 0):
         """Return the stroke color (hex string) at the given time."""
-        return self._rgb_to_hex(self.styling.stroke.time_func(time))
+        return self._rgb_to_hex(self.styling.stroke._tl(time))
 
     def get_stroke_width(self, time: float = 0):
         """Return the stroke width at the given time."""
@@ -2436,7 +2439,7 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
             src = getattr(self.styling, attr_name)
             tgt = getattr(target_style.styling, attr_name)
             if isinstance(src, attributes.Color):
-                target_color = attributes.Color(start, tgt.time_func(start))
+                target_color = attributes.Color(start, tgt._tl(start))
                 new_attr = src.interpolate(target_color, start, end, easing=easing)
                 setattr(self.styling, attr_name, new_attr)
             else:
@@ -2449,7 +2452,7 @@ class VObject(_BBoxMethodsMixin, _VObjectEffectsMixin, ABC):  # Vector Object
         for attr_name in style._STYLES:
             src = getattr(other.styling, attr_name)
             dst = getattr(self.styling, attr_name)
-            val = src.time_func(time) if isinstance(src, attributes.Color) else src.at_time(time)
+            val = src._tl(time) if isinstance(src, attributes.Color) else src.at_time(time)
             dst.set_onward(time, val)
         return self
 
@@ -93,8 +93,8 @@ class _VObjectEffectsMixin:
 
     def match_style(self, other, time: float = 0):
         """Copy fill, stroke, opacity, and stroke_width from *other* at *time*."""
-        self.styling.fill.set_onward(time, other.styling.fill.time_func(time))
-        self.styling.stroke.set_onward(time, other.styling.stroke.time_func(time))
+        self.styling.fill.set_onward(time, other.styling.fill._tl(time))
+        self.styling.stroke.set_onward(time, other.styling.stroke._tl(time))
         self.styling.fill_opacity.set_onward(time, other.styling.fill_opacity.at_time(time))
         self.styling.stroke_opacity.set_onward(time, other.styling.stroke_opacity.at_time(time))
         self.styling.stroke_width.set_onward(time, other.styling.stroke_width.at_time(time))
@@ -433,7 +433,7 @@ class _VObjectEffectsMixin:
     def typewriter_cursor(self, start: float = 0, end: float = 1, blink_rate: float = 0.5, cursor_char='|'):
         """For Text objects: append a blinking cursor character."""
         _ensure_text(self, 'typewriter_cursor')
-        _base_text_func = self.text.time_func
+        _base_text_func = self.text._tl.copy()
         def _blink(t, _s=start, _rate=blink_rate, _char=cursor_char, _base=_base_text_func):
             base = _base(t)
             if int((t - _s) / _rate) % 2 == 0:
@@ -694,10 +694,10 @@ class _VObjectEffectsMixin:
         cur_w = self.get_width(start)
         if cur_w > 0 and tw > 0:
             self.scale(tw / cur_w, start=start, end=end, easing=easing)
-        target_fill = target_obj.styling.fill.time_func(start)
+        target_fill = target_obj.styling.fill._tl(start)
         if target_fill:
             self.set_color(start, end, fill=self._rgb_to_hex(target_fill), easing=easing)
-        target_stroke = target_obj.styling.stroke.time_func(start)
+        target_stroke = target_obj.styling.stroke._tl(start)
         if target_stroke:
             self.set_color(start, end, stroke=self._rgb_to_hex(target_stroke), easing=easing)
         return self
@@ -1,21 +1,285 @@
 """VectorMathAnim: the main canvas/video object."""
+import contextlib
+import hashlib
+import json
+import math
 import os
-import re
 import shutil
 import subprocess
 import sys
 import logging
+import multiprocessing
 import tempfile
 
+import numpy as np
+
 import vectormation.easings as easings
 import vectormation.attributes as attributes
 import vectormation.style as style
+from vectormation._raster import SVGBackend, _require_cairosvg
 from vectormation._constants import CANVAS_WIDTH, CANVAS_HEIGHT
 from vectormation._base_helpers import _clamp01, _ramp
 
 logger = logging.getLogger('vectormation')
 
-_SVG_FLOAT_RE = re.compile(r'-?\d+\.\d{3,}')
+def _fragment(obj, time, rnd):
+    """Return the SVG of *obj* at *time*, rounded by *rnd* unless already rounded.
+
+    ``to_svg`` methods marked with ``style._rounds_svg`` write their numbers
+    rounded as they go (the frame runs inside a ``style._Rounding``).
+    """
+    svg = obj.to_svg(time)
+    return svg if getattr(obj.to_svg, '_rounds_svg', False) else rnd(svg)
+
+
+_PLAIN = (int, float, complex, str, bytes, type(None), np.ndarray, np.generic)
+
+
+def _fragment_attrs(obj):
+    """Return every attribute the SVG of *obj* can depend on.
+
+    Walks the object's fields like :meth:`VectorMathAnim._attributes`,
+    through child objects, stylings and containers.  Returns None when the
+    output may also depend on something else: a stored function (updaters,
+    ``DynamicObject``, wrapped ``to_svg``), an object of another kind, or a
+    class that reads the time directly (``_fragment_cacheable = False``).
+    """
+    from vectormation._base import VObject
+    from vectormation._collection import VCollection
+    found = []
+    seen = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, _PLAIN):
+            continue
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, attributes._Attribute):
+            found.append(item)
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (VObject, VCollection, style.Styling)):
+            if not getattr(item, '_fragment_cacheable', True):
+                return None
+            for name, value in vars(item).items():
+                if name != '_svg_memo':
+                    stack.append(value)
+        else:
+            return None
+    return found
+
+
+class FragmentCache:
+    """Reuses the SVG fragment of each object while its attributes hold still.
+
+    Set ``canvas.fragment_cache = FragmentCache()`` to enable it.  Each
+    object keeps its last fragment (already rounded) in ``_svg_memo``,
+    with the time window on which all of its attributes are constant (see
+    ``static_run``), like ``Styling.svg_style`` does for its strings.
+    Edits are noticed through the timeline stamps; objects that depend on
+    anything but their attributes are always rendered (``skipped``).
+    Frames with ``style_classes`` bypass the cache, since class names are
+    assigned per frame.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def svg(self, obj, time, rnd, precision):
+        """Return ``_fragment(obj, time, rnd)``, reusing the cached fragment if valid."""
+        d = vars(obj)
+        memo = d.get('_svg_memo')
+        epoch = attributes._edits
+        if memo is not None:
+            if memo[5] is None:   # not cacheable as of memo[0]
+                if memo[0] == epoch:
+                    self.skipped += 1
+                    return _fragment(obj, time, rnd)
+            elif memo[6] == precision and (time == memo[1] or memo[2] < time < memo[3]):
+                if memo[0] == epoch or self._unchanged(obj, memo):
+                    self.hits += 1
+                    return memo[4]
+        text = _fragment(obj, time, rnd)
+        hot = None if memo is None else memo[7]
+        if hot is not None and memo[0] == epoch and hot.static_run(time) is None:
+            d['_svg_memo'] = (epoch, time, time, time, text, memo[5], precision, hot)
+            self.misses += 1
+            return text
+        attrs = _fragment_attrs(obj)
+        if attrs is None:
+            d['_svg_memo'] = (epoch, None, None, None, None, None, None, None)
+            self.skipped += 1
+            return text
+        self.misses += 1
+        lo, hi, hot = -math.inf, math.inf, None
+        if memo is None:
+            lo = hi = time   # objects shown for one frame skip the window scan
+        else:
+            for attr in attrs:
+                run = attr.static_run(time)
+                if run is None:
+                    lo = hi = time
+                    hot = attr
+                    break
+                if run[0] > lo:
+                    lo = run[0]
+                if run[1] < hi:
+                    hi = run[1]
+        d['_svg_memo'] = (epoch, time, lo, hi, text, attrs, precision, hot)
+        return text
+
+    @staticmethod
+    def _unchanged(obj, memo):
+        """Whether *obj* has the same attributes as in *memo*, none edited since."""
+        then = memo[0]
+        attrs = _fragment_attrs(obj)
+        if attrs is None or len(attrs) != len(memo[5]):
+            return False
+        for attr, old in zip(attrs, memo[5]):
+            if attr is not old or attr._tl.stamp > then:
+                return False
+        vars(obj)['_svg_memo'] = (attributes._edits,) + memo[1:]
+        return True
+
+    def stats(self):
+        """Return ``{'hits', 'misses', 'skipped', 'hit_rate'}``."""
+        total = self.hits + self.misses + self.skipped
+        return {'hits': self.hits, 'misses': self.misses, 'skipped': self.skipped,
+                'hit_rate': self.hits / total if total else 0.0}
+
+    def reset_stats(self):
+        self.hits = self.misses = self.skipped = 0
+
+
+_export_canvas = None   # canvas inherited by forked export workers
+_MANIFEST = 'manifest.json'   # describes a chunked export, see VectorMathAnim._export_chunks
+
+
+def _frame_job(args):
+    """Pool entry point: run one frame job on the canvas inherited at fork."""
+    func, job = args
+    return func(_export_canvas, *job)
+
+
+def _frame_png(canvas, time, size, path=None):
+    """Rasterize the frame at *time*; return the PNG bytes unless written to *path*."""
+    return canvas.render_backend.png(canvas, time, size, path)
+
+
+def _frame_raw(canvas, time, size):
+    """Rasterize the frame at *time* to raw pixel bytes in the backend's ``pix_fmt``."""
+    return canvas.render_backend.raw(canvas, time, size)
+
+
+def _chunk_fingerprint(canvas, times, size):
+    """Return a hash of the pixels of the first and last frame at *times*.
+
+    Stored per chunk in the manifest so a chunk is encoded again when an
+    edited script changes how it starts or ends.  Pixels are hashed rather
+    than the frame SVG, whose element ids differ from run to run.
+    """
+    digest = hashlib.sha1()
+    for t in dict.fromkeys((times[0], times[-1])):
+        digest.update(_frame_raw(canvas, t, size))
+    return digest.hexdigest()
+
+
+def _resume_chunks(parts, manifest):
+    """Prepare the directory *parts* for the chunked export in *manifest*; return the chunks left to do.
+
+    A chunk is done when its file exists: chunks are only renamed into
+    place once encoded.  Chunk files that the manifest found there
+    describes differently (other export settings, or another fingerprint)
+    are removed, and the manifest is replaced.
+    """
+    os.makedirs(parts, exist_ok=True)
+    path = os.path.join(parts, _MANIFEST)
+    try:
+        with open(path, encoding='utf-8') as f:
+            old = json.load(f)
+    except (OSError, ValueError):
+        old = None
+    if old != manifest:
+        if isinstance(old, dict):
+            same = ({k: v for k, v in old.items() if k != 'chunks'}
+                    == {k: v for k, v in manifest.items() if k != 'chunks'})
+            stale = [chunk for chunk in old.get('chunks', []) if not (same and chunk in manifest['chunks'])]
+            if stale:
+                logger.warning('%s holds %d chunks of another export or an edited scene; encoding them again',
+                               parts, len(stale))
+            for chunk in stale:
+                with contextlib.suppress(OSError, TypeError, KeyError):
+                    os.remove(os.path.join(parts, chunk['file']))
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(path + '.tmp', path)
+    return [chunk for chunk in manifest['chunks'] if not os.path.exists(os.path.join(parts, chunk['file']))]
+
+
+class _GifWriter:
+    """Writes an animated GIF frame by frame, holding one frame at a time.
+
+    Each frame is cropped to the area that changed since the previous one
+    and written once the next frame arrives; a repeated frame extends the
+    duration of the one before instead.  With a *palette* image (mode
+    ``'P'``) every frame is quantized to it, otherwise each frame gets its
+    own adaptive palette.
+    """
+
+    def __init__(self, file, duration, loop=0, palette=None):
+        self._file = file
+        self._duration = duration
+        self._loop = loop
+        self._palette = palette
+        self._prev = None      # last full RGB frame
+        self._pending = None   # [paletted image, offset, duration] not written yet
+        self.frames = 0
+
+    def append(self, rgb):
+        """Add the next frame, a full-size RGB ``PIL.Image``."""
+        from PIL import ImageChops  # type: ignore[import-not-found]
+        if self._prev is None:
+            bbox = (0, 0) + rgb.size
+        else:
+            bbox = ImageChops.difference(rgb, self._prev).getbbox()
+            if bbox is None:
+                self._pending[2] += self._duration  # type: ignore[index]
+                return
+        self._write_pending()
+        self._prev = rgb
+        im = rgb.crop(bbox)
+        im = im.quantize() if self._palette is None else im.quantize(palette=self._palette)
+        self._pending = [im, bbox[:2], self._duration]
+
+    def _write_pending(self):
+        from PIL import GifImagePlugin  # type: ignore[import-not-found]
+        if self._pending is None:
+            return
+        im, offset, duration = self._pending
+        if self.frames == 0:
+            header, _ = GifImagePlugin.getheader(im, info={'loop': self._loop, 'duration': duration})
+            self._file.write(b''.join(header))
+        local = self.frames > 0 and self._palette is None
+        for chunk in GifImagePlugin.getdata(im, offset, duration=duration, include_color_table=local):
+            self._file.write(chunk)
+        self.frames += 1
+        self._pending = None
+
+    def repeat(self):
+        """Show the last frame for one more frame duration."""
+        self._pending[2] += self._duration  # type: ignore[index]
+
+    def close(self):
+        """Write the last frame and the GIF trailer."""
+        self._write_pending()
+        if self.frames:
+            self._file.write(b';')
 
 
 class _ProgressBar:
@@ -96,6 +360,11 @@ class VectorMathAnim:
         self.snap_enabled = False  # If True, send snap points to browser
         self.loop_enabled = False  # If True, loop animation at end
         self._last_visible = []  # Last sorted visible objects from generate_frame_svg
+        self.eval_cache = None  # Optional attributes.EvalCache used while rendering frames
+        self.style_classes = False  # If True, share repeated styles as CSS classes in frames
+        self.precision = 2  # Decimals kept for numbers in frame SVGs
+        self.fragment_cache = None  # Optional FragmentCache reusing unchanged object SVGs
+        self.render_backend = SVGBackend()  # Turns frames into pixels on export (see _raster)
         self._pending_responses = []  # Queue of messages to send back to browser
 
         logger.info('Initialized canvas %dx%d, saving to %s', width, height, save_dir)
@@ -294,8 +563,9 @@ class VectorMathAnim:
         if time is None:
             time = self.time
         points = []
-        for obj in self._visible_objects(time):
-            self._collect_snap_points(obj, time, points)
+        with self._eval_scope(time):
+            for obj in self._visible_objects(time):
+                self._collect_snap_points(obj, time, points)
         return points
 
     @classmethod
@@ -313,55 +583,91 @@ class VectorMathAnim:
     @staticmethod
     def _round_svg_values(svg, precision: int = 2):
         """Round floating-point numbers in SVG strings for data compression."""
-        def _round_match(m):
-            return f'{float(m.group()):.{precision}f}'.rstrip('0').rstrip('.')
-        return _SVG_FLOAT_RE.sub(_round_match, svg)
+        return style._rounder(precision)(svg)
+
+    def _eval_scope(self, time):
+        """Context for evaluating attributes at *time*: the eval cache, if set."""
+        cache = self.eval_cache
+        if cache is None:
+            return contextlib.nullcontext()
+        cache.touch(time)
+        return cache
 
     def generate_frame_svg(self, time=None):
         """Generate the SVG content for a frame as a string."""
+        parts = []
+        self._emit_frame(time, parts.append)
+        return ''.join(parts)
+
+    def write_frame_svg(self, file, time=None):
+        """Stream the SVG of a frame into the text file object *file*.
+
+        Same output as :meth:`generate_frame_svg`, written part by part
+        without building the whole document first.
+        """
+        self._emit_frame(time, file.write)
+
+    def _emit_frame(self, time, write):
+        """Pass the parts of the frame SVG at *time* to *write*, in order.
+
+        Numbers are rounded to ``self.precision`` as they are written: the
+        objects run inside a ``style._Rounding``, and the parts whose
+        ``to_svg`` does not round its own numbers are rounded as a whole
+        (parts never split a number), so there is no pass over the whole
+        document.  The ``<style>`` element of ``style_classes`` comes last,
+        since its rules are only known after all objects are rendered.
+        """
         if time is None:
             time = self.time  # The canvas time
 
         logger.log(5, 'Generating frame at t=%.3f', time)
-        parts = []
-        parts.append("<?xml version='1.0' encoding='UTF-8'?>\n")
+        rounding = style._Rounding(self.precision)
+        rnd = rounding.round
+        write("<?xml version='1.0' encoding='UTF-8'?>\n")
         vb = (self.vb_x.at_time(time), self.vb_y.at_time(time),
               self.vb_w.at_time(time), self.vb_h.at_time(time))
         header = f"<svg version='1.1' xmlns='http://www.w3.org/2000/svg' " \
                  f"xmlns:xlink='http://www.w3.org/1999/xlink' " \
                  f"width='{self.width * self.scale}' height='{self.height * self.scale}' " \
                  f"viewBox='{vb[0]} {vb[1]} {vb[2]} {vb[3]}'>\n"
-        parts.append(header)
+        write(rnd(header))
 
         # Output <defs> block for gradients and clip paths
         if self.defs:
-            parts.append('<defs>\n')
+            write('<defs>\n')
             for def_obj in self.defs.values():
                 if hasattr(def_obj, 'to_svg_def'):
-                    parts.append(def_obj.to_svg_def(time) + '\n')
-            parts.append('</defs>\n')
+                    write(rnd(def_obj.to_svg_def(time)) + '\n')
+            write('</defs>\n')
 
         # Run updaters and add objects sorted by z-order
-        visible = [(obj.z.at_time(time), obj)
-                   for obj in self.objects.values() if obj.show.at_time(time)]
-        sorted_visible = sorted(visible, key=lambda x: x[0])
-        self._last_visible = [obj for _, obj in sorted_visible]
-        for idx, (_, obj) in enumerate(sorted_visible):
-            if hasattr(obj, '_run_updaters'):
-                obj._run_updaters(time)
-            parts.append(f"<g data-obj-idx='{idx}'>" + obj.to_svg(time) + '</g>\n')
+        sheet = style._StyleSheet() if self.style_classes else None
+        cache = self.fragment_cache if sheet is None else None
+        with self._eval_scope(time), sheet or contextlib.nullcontext(), rounding:
+            visible = [(obj.z.at_time(time), obj)
+                       for obj in self.objects.values() if obj.show.at_time(time)]
+            sorted_visible = sorted(visible, key=lambda x: x[0])
+            self._last_visible = [obj for _, obj in sorted_visible]
+            for idx, (_, obj) in enumerate(sorted_visible):
+                if hasattr(obj, '_run_updaters'):
+                    obj._run_updaters(time)
+                if cache is None:
+                    fragment = _fragment(obj, time, rnd)
+                else:
+                    fragment = cache.svg(obj, time, rnd, self.precision)
+                write(f"<g data-obj-idx='{idx}'>{fragment}</g>\n")
+        if sheet is not None:
+            write(rnd(sheet.to_svg()))
 
         # Close the header
-        parts.append("</svg>")
-        svg = ''.join(parts)
-        return self._round_svg_values(svg)
+        write("</svg>")
 
     def write_frame(self, time=None, filename=None):
         """This combines all the svgs of objects alive at the canvas time and writes to disk"""
         if filename is None:
             filename = self.filename
         with open(filename, 'w') as s:
-            s.write(self.generate_frame_svg(time))
+            self.write_frame_svg(s, time)
 
     def handle_browser_event(self, msg):
         """Process a parsed JSON message from the browser viewer."""
@@ -604,32 +910,32 @@ class VectorMathAnim:
         else:
             graph_kind = 'real'
 
-        for i in range(n):
-            t = start + i * dt
-            try:
-                v = attr_obj.at_time(t)
-            except Exception:
-                return
+        sample_times = [start + i * dt for i in range(n)]
+        times = [round(t, 4) for t in sample_times]
+        try:
+            if graph_kind == 'string':
+                values = [attr_obj.at_time(t) for t in sample_times]
+            else:
+                # One vectorized pass instead of n scalar at_time calls
+                values = attr_obj.at_times(sample_times)
+        except Exception:
+            return
 
-            times.append(round(t, 4))
+        for v in values:
             if graph_kind == 'color':
-                try:
-                    raw = attr_obj.time_func(t)
-                    if isinstance(raw, tuple) and len(raw) >= 3:
-                        data.append([int(raw[0]), int(raw[1]), int(raw[2])])
-                    else:
-                        data.append([0, 0, 0])
-                except Exception:
+                if isinstance(v, np.ndarray) and len(v) >= 3:
+                    data.append([int(v[0]), int(v[1]), int(v[2])])
+                else:
                     data.append([0, 0, 0])
             elif graph_kind == 'string':
                 data.append(str(v))
             elif graph_kind == 'coor':
-                if isinstance(v, tuple) and len(v) >= 2:
+                if isinstance(v, np.ndarray) and len(v) >= 2:
                     data.append([round(float(v[0]), 4), round(float(v[1]), 4)])
                 else:
                     data.append([0, 0])
             elif graph_kind == 'tup':
-                if isinstance(v, tuple):
+                if isinstance(v, (np.ndarray, tuple)):
                     data.append([round(float(x), 4) for x in v])
                 else:
                     data.append([round(float(v), 4)])
@@ -673,19 +979,13 @@ class VectorMathAnim:
     @staticmethod
     def _require_cairosvg():
         """Import and return cairosvg, raising a helpful error if missing."""
-        try:
-            import cairosvg  # type: ignore[import-not-found]
-            return cairosvg
-        except ImportError:
-            raise ImportError('cairosvg is required for export. Install it with: pip install cairosvg')
+        return _require_cairosvg()
 
     def export_png(self, time: float = 0, filename='frame.png', scale=None):
-        """Export a single frame as PNG using cairosvg."""
-        cairosvg = self._require_cairosvg()
+        """Export a single frame as PNG using the render backend (cairosvg by default)."""
+        self.render_backend.require()
         scale, ow, oh = self._export_dims(scale)
-        svg = self.generate_frame_svg(time)
-        cairosvg.svg2png(bytestring=svg.encode(), write_to=filename,
-                         output_width=ow, output_height=oh)
+        _frame_png(self, time, (ow, oh), filename)
         logger.info('Exported PNG to %s', filename)
 
     def _resolve_end(self, end):
@@ -709,78 +1009,327 @@ class VectorMathAnim:
             yield t
             t += dt
 
+    def _attributes(self):
+        """Yield every animated attribute reachable from the canvas objects."""
+        from vectormation._base import VObject
+        seen = set()
+        stack = [self.vb_x, self.vb_y, self.vb_w, self.vb_h, *self.objects.values()]
+        while stack:
+            item = stack.pop()
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            if isinstance(item, attributes._Attribute):
+                yield item
+            elif isinstance(item, (VObject, style.Styling)):
+                for value in vars(item).values():
+                    if isinstance(value, (list, tuple)):
+                        stack.extend(value)
+                    else:
+                        stack.append(value)
+
+    def compile_timelines(self, start: float = 0, end: float | None = None, fps: int = 60):
+        """Pre-sample every attribute at the frame times of an export.
+
+        Frame generation at those times then reads NumPy buffers instead of
+        evaluating the animation functions.  Editing an attribute afterwards
+        drops its buffer; see :meth:`attributes.Real.compile` for caveats.
+        """
+        end = self._resolve_end(end)
+        times = list(self._frame_times(start, end, fps))
+        for attr in self._attributes():
+            attr.compile(times)
+        return self
+
     @staticmethod
     def _count_frames(start, end, fps):
         """Count the number of frames between start and end at given fps."""
         fps = max(fps, 1)
         return max(1, int(round((end - start) * fps)) + 1)
 
-    def export_video(self, filename='animation.mp4', start: float = 0, end: float | None = None, fps: int = 60, scale=None):
-        """Export animation as video using cairosvg + ffmpeg."""
-        cairosvg = self._require_cairosvg()
+    def _held_frames(self, times):
+        """Return, per frame time, whether it renders exactly like the frame before.
+
+        A frame is held when no attribute that the scene can depend on
+        changes between the last rendered frame and it: the time lies in
+        the window where all of them are constant (see ``static_run``).
+        When some object also depends on something else (updaters, stored
+        functions, ``_fragment_cacheable = False``, gradient defs), no frame
+        is held.
+        """
+        held = [False] * len(times)
+        attrs = [self.vb_x, self.vb_y, self.vb_w, self.vb_h]
+        for obj in (*self.objects.values(), *self.defs.values()):
+            found = _fragment_attrs(obj)
+            if found is None:
+                return held
+            attrs.extend(found)
+        lo = hi = math.nan
+        hot = None
+        for i, t in enumerate(times):
+            if lo < t < hi:
+                held[i] = True
+                continue
+            lo, hi = -math.inf, math.inf
+            if hot is not None and hot.static_run(t) is None:
+                lo = hi = math.nan
+                continue
+            for attr in attrs:
+                run = attr.static_run(t)
+                if run is None:
+                    lo = hi = math.nan
+                    hot = attr
+                    break
+                lo = max(lo, run[0])
+                hi = min(hi, run[1])
+        return held
+
+    def _export_frames(self, func, jobs, workers=1, dedupe=True):
+        """Yield ``(held, result)`` per job like :meth:`_map_frames`.
+
+        With *dedupe*, frames held from the previous one (see
+        :meth:`_held_frames`) are not rendered: they come with
+        ``held=True`` and the result of the last rendered frame.
+        """
+        held = self._held_frames([job[0] for job in jobs]) if dedupe else [False] * len(jobs)
+        results = self._map_frames(func, [job for job, h in zip(jobs, held) if not h], workers)
+        result = None
+        for h in held:
+            if not h:
+                result = next(results)
+            yield h, result
+        n_held = sum(held)
+        if n_held:
+            logger.info('Reused %d of %d frames held from the previous one', n_held, len(held))
+
+    def _map_frames(self, func, jobs, workers=1):
+        """Yield ``func(self, *job)`` for each job, in order.
+
+        With *workers* > 1 the jobs run in a pool of processes forked from
+        this one, so they share the scene as it is now (compiled timelines
+        included) without pickling it.  Each process gets contiguous runs
+        of frames, which keeps the per-object caches useful.  Where fork is
+        not available the jobs run here, one after the other.
+        """
+        global _export_canvas
+        jobs = list(jobs)
+        workers = min(workers or 1, len(jobs))
+        if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            logger.warning('Parallel export needs the fork start method; rendering serially')
+            workers = 1
+        if workers <= 1:
+            for job in jobs:
+                yield func(self, *job)
+            return
+        _export_canvas = self
+        try:
+            chunk = max(1, len(jobs) // (workers * 4))
+            with multiprocessing.get_context('fork').Pool(workers) as pool:
+                yield from pool.imap(_frame_job, [(func, job) for job in jobs], chunksize=chunk)
+        finally:
+            _export_canvas = None
+
+    def export_video(self, filename='animation.mp4', start: float = 0, end: float | None = None, fps: int = 60, scale=None,
+                     precompile: bool = False, workers: int = 1, stream: bool = True, dedupe: bool = True,
+                     chunk: float | None = None, chunks=None):
+        """Export animation as video using the render backend + ffmpeg.
+
+        With *precompile*, attribute timelines are sampled up front
+        (see :meth:`compile_timelines`).  *workers* > 1 rasterizes frames
+        in that many processes (see :meth:`_map_frames`).  With *stream*,
+        raw frames are piped to ffmpeg while rendering goes on; otherwise
+        they are written as temporary PNGs and encoded at the end.  With
+        *dedupe*, frames where nothing changes reuse the previous raster
+        (see :meth:`_held_frames`).  With *chunk* (seconds), the video is
+        encoded in resumable pieces joined at the end, of which *chunks*
+        selects the ones to do here (see :meth:`_export_chunks`).  A chunk
+        left by an earlier run is reused when its first and last frames
+        still look the same; after editing the scene only between those,
+        delete ``<filename>.parts`` first."""
+        self.render_backend.require()
         if shutil.which('ffmpeg') is None:
             raise RuntimeError('ffmpeg is required for video export. Install it from https://ffmpeg.org/')
 
         end = self._resolve_end(end)
+        if precompile:
+            self.compile_timelines(start, end, fps)
         scale, output_w, output_h = self._export_dims(scale)
         total = self._count_frames(start, end, fps)
-        tmpdir = tempfile.mkdtemp(prefix='vectormation_')
-        try:
-            progress = _ProgressBar(total, label='Rendering frames ')
-            n_frames = 0
-            for i, t in enumerate(self._frame_times(start, end, fps)):
-                svg = self.generate_frame_svg(t)
-                cairosvg.svg2png(bytestring=svg.encode(),
-                                 output_width=output_w, output_height=output_h,
-                                 write_to=os.path.join(tmpdir, f'frame_{i:05d}.png'))
-                n_frames = i + 1
-                progress.update()
+        times = self._frame_times(start, end, fps)
+        encode = ['-c:v', 'libx264', '-pix_fmt', 'yuv420p']
+        progress = _ProgressBar(total, label='Rendering frames ')
+        n_frames = 0
+        if chunk is not None:
+            n_frames = self._export_chunks(filename, start, end, list(times), (output_w, output_h), fps, encode,
+                                           chunk, chunks, workers, dedupe, progress)
+            if n_frames is None:
+                return
+        elif stream:
+            n_frames = self._stream_video(filename, times, (output_w, output_h), fps, encode,
+                                          workers, dedupe, progress)
             progress.finish()
-            sys.stderr.write('Encoding video...\n')
-            sys.stderr.flush()
-            subprocess.run([
-                'ffmpeg', '-y', '-framerate', str(fps),
-                '-i', os.path.join(tmpdir, 'frame_%05d.png'),
-                '-c:v', 'libx264', '-pix_fmt', 'yuv420p', filename
-            ], check=True, capture_output=True)
-            logger.info('Exported video to %s (%d frames, %dx%d)', filename, n_frames, output_w, output_h)
+        else:
+            tmpdir = tempfile.mkdtemp(prefix='vectormation_')
+            try:
+                jobs = [(t, (output_w, output_h), os.path.join(tmpdir, f'frame_{i:05d}.png'))
+                        for i, t in enumerate(times)]
+                prev = None
+                for (_, _, path), (held, _) in zip(jobs, self._export_frames(_frame_png, jobs, workers, dedupe)):
+                    if held:
+                        shutil.copyfile(prev, path)
+                    prev = path
+                    n_frames += 1
+                    progress.update()
+                progress.finish()
+                sys.stderr.write('Encoding video...\n')
+                sys.stderr.flush()
+                subprocess.run([
+                    'ffmpeg', '-y', '-framerate', str(fps),
+                    '-i', os.path.join(tmpdir, 'frame_%05d.png'), *encode, filename
+                ], check=True, capture_output=True)
+            finally:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+        logger.info('Exported video to %s (%d frames, %dx%d)', filename, n_frames, output_w, output_h)
+
+    def _stream_video(self, filename, times, size, fps, encode, workers=1, dedupe=True, progress=None):
+        """Encode the frames at *times* to *filename*, piping raw pixels to ffmpeg; return the frame count."""
+        jobs = [(t, size) for t in times]
+        ffmpeg = subprocess.Popen([
+            'ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', self.render_backend.pix_fmt,
+            '-s', f'{size[0]}x{size[1]}', '-r', str(fps), '-i', '-', *encode, filename
+        ], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        n_frames = 0
+        failed = True   # an exception of our own is propagating; don't mask it with ffmpeg's
+        try:
+            for _, raw in self._export_frames(_frame_raw, jobs, workers, dedupe):
+                ffmpeg.stdin.write(raw)  # type: ignore[union-attr]
+                n_frames += 1
+                if progress is not None:
+                    progress.update()
+            failed = False
+        except BrokenPipeError:
+            failed = False   # ffmpeg exited early; its error is reported below
         finally:
-            shutil.rmtree(tmpdir, ignore_errors=True)
-
-    def export_gif(self, filename='animation.gif', start: float = 0, end: float | None = None, fps: int = 30, scale=None, loop: int = 0):
-        """Export animation as an animated GIF using cairosvg + Pillow."""
-        cairosvg = self._require_cairosvg()
+            with contextlib.suppress(BrokenPipeError):
+                ffmpeg.stdin.close()  # type: ignore[union-attr]
+            stderr = ffmpeg.stderr.read()  # type: ignore[union-attr]
+            if ffmpeg.wait() and not failed:
+                raise subprocess.CalledProcessError(ffmpeg.returncode, ffmpeg.args, stderr=stderr)
+        return n_frames
+
+    def _export_chunks(self, filename, start, end, times, size, fps, encode, seconds, only=None,
+                       workers=1, dedupe=True, progress=None):
+        """Encode *times* as chunks of *seconds* in ``<filename>.parts``, then join them into *filename*.
+
+        The directory holds a manifest (the export settings, and the frames
+        and a fingerprint of the first and last one of each chunk) and one
+        video file per finished chunk, renamed into place once encoded.
+        Running the same export again skips the chunks already there whose
+        fingerprint still matches, so an interrupted export resumes where
+        it stopped.  *only* restricts this run to some chunk indices, e.g.
+        to share the chunks between machines writing to the same
+        directory.  Once every chunk is done they are concatenated without
+        re-encoding and the directory is removed.  Returns the frame count
+        of the video, or None while chunks are still missing.
+        """
+        parts = filename + '.parts'
+        per = max(1, round(seconds * fps))
+        ext = os.path.splitext(filename)[1] or '.mp4'
+        manifest = {
+            'version': 1, 'start': float(start), 'end': float(end), 'fps': fps, 'size': [int(v) for v in size],
+            'pix_fmt': self.render_backend.pix_fmt, 'encode': encode, 'chunk_frames': per,
+            'chunks': [{'index': i, 'file': f'chunk_{i:05d}{ext}', 'first': first,
+                        'frames': min(per, len(times) - first),
+                        'scene': _chunk_fingerprint(self, times[first:first + per], size)}
+                       for i, first in enumerate(range(0, len(times), per))],
+        }
+        todo = _resume_chunks(parts, manifest)
+        if only is not None:
+            only = set(only)
+            todo = [chunk for chunk in todo if chunk['index'] in only]
+        skipped = len(times) - sum(chunk['frames'] for chunk in todo)
+        if skipped and progress is not None:
+            progress.update(skipped)
+        for chunk in todo:
+            path = os.path.join(parts, chunk['file'])
+            partial = os.path.join(parts, f'partial_{chunk["file"]}')
+            self._stream_video(partial, times[chunk['first']:chunk['first'] + chunk['frames']],
+                               size, fps, encode, workers, dedupe, progress)
+            os.replace(partial, path)
+        if progress is not None:
+            progress.finish()
+        missing = [chunk['index'] for chunk in manifest['chunks']
+                   if not os.path.exists(os.path.join(parts, chunk['file']))]
+        if missing:
+            logger.info('%d of %d chunks still missing in %s', len(missing), len(manifest['chunks']), parts)
+            return None
+        listing = os.path.join(parts, 'chunks.txt')
+        with open(listing, 'w', encoding='utf-8') as f:
+            f.writelines(f"file '{chunk['file']}'\n" for chunk in manifest['chunks'])
+        subprocess.run(['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                        '-i', listing, '-c', 'copy', filename], check=True, capture_output=True)
+        shutil.rmtree(parts, ignore_errors=True)
+        return len(times)
+
+    def export_gif(self, filename='animation.gif', start: float = 0, end: float | None = None, fps: int = 30, scale=None, loop: int = 0,
+                   precompile: bool = False, workers: int = 1, global_palette: bool = False, palette_samples: int = 16,
+                   dedupe: bool = True):
+        """Export animation as an animated GIF using the render backend + Pillow.
+
+        Frames are quantized and written one at a time, so memory does not
+        grow with the duration.  With *global_palette*, one palette built
+        from *palette_samples* frames spread over the animation is shared
+        by every frame; otherwise each frame has its own.
+
+        With *precompile*, attribute timelines are sampled up front
+        (see :meth:`compile_timelines`).  *workers* > 1 rasterizes frames
+        in that many processes (see :meth:`_map_frames`), and with *dedupe*
+        held frames are not rendered again (see :meth:`_held_frames`)."""
+        self.render_backend.require()
         try:
             from PIL import Image as PILImage  # type: ignore[import-not-found]
         except ImportError:
             raise ImportError('Pillow is required for GIF export. Install it with: pip install Pillow')
-        import io
+
+        pix_fmt = self.render_backend.pix_fmt.upper()
+
+        def to_rgb(raw):
+            rgba = PILImage.frombuffer('RGBA', (output_w, output_h), raw, 'raw', pix_fmt, 0, 1)
+            rgb = PILImage.new('RGB', rgba.size, (255, 255, 255))
+            rgb.paste(rgba, mask=rgba.split()[3])
+            return rgb
 
         end = self._resolve_end(end)
+        if precompile:
+            self.compile_timelines(start, end, fps)
         scale, output_w, output_h = self._export_dims(scale)
         total = self._count_frames(start, end, fps)
+        jobs = [(t, (output_w, output_h)) for t in self._frame_times(start, end, fps)]
+        palette = None
+        if global_palette and jobs:
+            step = max(1, len(jobs) // max(palette_samples, 1))
+            samples = [to_rgb(raw) for raw in self._map_frames(_frame_raw, jobs[::step], workers)]
+            sheet = PILImage.new('RGB', (output_w, output_h * len(samples)))
+            for i, sample in enumerate(samples):
+                sheet.paste(sample, (0, i * output_h))
+            palette = sheet.quantize(256)
+            del samples, sheet
         progress = _ProgressBar(total, label='Rendering frames ')
-        frames = []
-        for t in self._frame_times(start, end, fps):
-            svg = self.generate_frame_svg(t)
-            png_data: bytes = cairosvg.svg2png(bytestring=svg.encode(),
-                                               output_width=output_w, output_height=output_h)  # type: ignore[assignment]
-            rgba = PILImage.open(io.BytesIO(png_data)).convert('RGBA')
-            rgb = PILImage.new('RGB', rgba.size, (255, 255, 255))
-            rgb.paste(rgba, mask=rgba.split()[3])
-            frames.append(rgb)
-            progress.update()
+        with open(filename, 'wb') as f:
+            writer = _GifWriter(f, int(1000 / fps), loop=loop, palette=palette)
+            for held, raw in self._export_frames(_frame_raw, jobs, workers, dedupe):
+                if held:
+                    writer.repeat()
+                else:
+                    writer.append(to_rgb(raw))
+                progress.update()
+            writer.close()
         progress.finish()
 
-        if not frames:
+        if not writer.frames:
             logger.warning('No frames generated for GIF export')
             return
-
-        sys.stderr.write('Encoding GIF...\n')
-        sys.stderr.flush()
-        frames[0].save(filename, save_all=True, append_images=frames[1:],
-                       duration=int(1000 / fps), loop=loop, optimize=True)
-        logger.info('Exported GIF to %s (%d frames, %dx%d)', filename, len(frames), output_w, output_h)
+        logger.info('Exported GIF to %s (%d frames, %dx%d)', filename, writer.frames, output_w, output_h)
 
     def get_visible_objects_info(self, time=None):
         """Return info about visible objects at the given time.
@@ -796,19 +1345,20 @@ class VectorMathAnim:
                        for obj in self._visible_objects(time)]
             objects = [obj for _, obj in sorted(visible, key=lambda x: x[0])]
         result = []
-        for obj in objects:
-            info = {'class': obj.__class__.__name__, 'id': id(obj)}
-            try:
-                bx, by, bw, bh = obj.bbox(time)
-                info['bbox'] = [round(bx, 1), round(by, 1), round(bw, 1), round(bh, 1)]
-                info['center'] = [round(bx + bw / 2, 1), round(by + bh / 2, 1)]
-            except Exception:
-                pass
-            if hasattr(obj, 'text_content'):
-                tc = obj.text_content
-                if isinstance(tc, str) and len(tc) <= 30:
-                    info['name'] = tc
-            result.append(info)
+        with self._eval_scope(time):
+            for obj in objects:
+                info = {'class': obj.__class__.__name__, 'id': id(obj)}
+                try:
+                    bx, by, bw, bh = obj.bbox(time)
+                    info['bbox'] = [round(bx, 1), round(by, 1), round(bw, 1), round(bh, 1)]
+                    info['center'] = [round(bx + bw / 2, 1), round(by + bh / 2, 1)]
+                except Exception:
+                    pass
+                if hasattr(obj, 'text_content'):
+                    tc = obj.text_content
+                    if isinstance(tc, str) and len(tc) <= 30:
+                        info['name'] = tc
+                result.append(info)
         return result
 
     def show(self, **kwargs):
@@ -833,18 +1383,20 @@ class VectorMathAnim:
         start = kwargs.get('start', args.start or 0)
         end = kwargs.get('end', args.end or args.duration)
         fps = kwargs.get('fps', args.fps)
+        workers = kwargs.get('workers', args.workers)
+        chunk = kwargs.get('chunk', args.chunk)
 
         if export_path:
             ext = os.path.splitext(export_path)[1].lower()
             if ext == '.svg':
                 self.write_frame(time=float(start), filename=export_path)
             elif ext == '.gif':
-                self.export_gif(export_path, start=start, end=end, fps=fps)
+                self.export_gif(export_path, start=start, end=end, fps=fps, workers=workers)
             elif ext == '.png':
                 self.export_png(time=float(start), filename=export_path)
             else:
                 # Default to video (.mp4, .webm, etc.)
-                self.export_video(export_path, start=start, end=end, fps=fps)
+                self.export_video(export_path, start=start, end=end, fps=fps, workers=workers, chunk=chunk)
         else:
             # Hot-reload: detect the *caller's* script, not show() itself
             caller_frame = inspect.stack()[1]
@@ -857,9 +1409,20 @@ class VectorMathAnim:
             )
 
     def browser_display(self, start: float = 0, end: float | None = None, fps: int = 60,
-                        port=8765, hot_reload=True, _script_path=None):
+                        port=8765, hot_reload=True, _script_path=None, cache_frames: int | None = 0,
+                        cache_fragments: bool = True):
         """View the animation in a browser via WebSocket.
-        If end == 0, displays a single static picture (no animation)."""
+        If end == 0, displays a single static picture (no animation).
+        Attribute values are memoized per frame (see
+        :class:`attributes.EvalCache`); None disables the cache.  A positive
+        *cache_frames* also keeps the values of that many recent times for
+        scrubbing, which is only safe when no function reads plain Python
+        state.  With *cache_fragments*, objects that hold still
+        (backgrounds, grids) send their cached SVG instead of being
+        serialized again each frame (see :class:`FragmentCache`).  The
+        browser still gets and draws the whole vector document each frame;
+        static objects are not baked into a bitmap layer, which only
+        ``PillowBackend(static_layer=True)`` does, for export."""
         import inspect
         from vectormation.browser import BrowserViewer
 
@@ -879,6 +1442,10 @@ class VectorMathAnim:
         self.time = start
         self.frame_count = 0
         self.dt = 1 / fps
+        if cache_frames is not None:
+            self.eval_cache = attributes.EvalCache(cache_frames)
+        if cache_fragments and self.fragment_cache is None:
+            self.fragment_cache = FragmentCache()
 
         logger.info('Starting browser viewer on port %d', port)
 
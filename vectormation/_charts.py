@@ -196,7 +196,7 @@ class PieChart(VCollection):
         items = []
         for i, label in enumerate(labels[:len(self._sectors)]):
             sector = self._sectors[i]
-            color = sector.styling.fill.time_func(0)
+            color = sector.styling.fill._tl(0)
             if isinstance(color, tuple):
                 from vectormation.colors import _rgb_to_hex
                 color = _rgb_to_hex(*color[:3])
@@ -1328,7 +1328,7 @@ class SparkLine(VObject):
             last = self._data[-1]
             ex = self._x + self._width
             ey = self._y + self._height - (last - mn) / rng * self._height
-            sc = self.styling.stroke.time_func(time)
+            sc = self.styling.stroke._tl(time)
             color = f'rgb({int(sc[0])},{int(sc[1])},{int(sc[2])})' if isinstance(sc, tuple) else str(sc)
             svg += f'<circle cx="{ex:.1f}" cy="{ey:.1f}" r="{self._endpoint_r}" fill="{color}"/>'
         return svg
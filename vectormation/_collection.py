@@ -6,7 +6,8 @@ from itertools import zip_longest
 
 import vectormation.easings as easings
 import vectormation.attributes as attributes
-from vectormation.colors import interpolate_color
+import vectormation.style as style
+from vectormation.colors import _gradient_hex
 from vectormation._constants import ORIGIN, SMALL_BUFF, UP, RIGHT
 from vectormation._base import (
     _norm_dir, _norm_edge, _ramp,
@@ -24,10 +25,18 @@ def _scale_transform(sx, sy, origin):
     """Return an SVG transform attribute string for the group scale, or ''."""
     if sx == 1 and sy == 1:
         return ''
+    num = style._num
     if origin:
         cx, cy = origin
-        return f' transform="translate({cx},{cy}) scale({sx},{sy}) translate({-cx},{-cy})"'
-    return f' transform="scale({sx},{sy})"'
+        return (f' transform="translate({num(cx)},{num(cy)}) scale({num(sx)},{num(sy)})'
+                f' translate({num(-cx)},{num(-cy)})"')
+    return f' transform="scale({num(sx)},{num(sy)})"'
+
+
+def _child_svg(obj, time):
+    """Return ``obj.to_svg(time)``, rounded if its ``to_svg`` does not round itself."""
+    svg = obj.to_svg(time)
+    return svg if getattr(obj.to_svg, '_rounds_svg', False) else style._round_svg(svg)
 
 class VCollection(_BBoxMethodsMixin):
     """Container for a group of VObjects, delegating operations to children."""
@@ -154,10 +163,11 @@ class VCollection(_BBoxMethodsMixin):
         """Return a deep copy of this collection."""
         return deepcopy(self)
 
+    @style._rounds_svg
     def to_svg(self, time):
         visible = [((z.at_time(time) if (z := getattr(o, 'z', None)) is not None else 0), o)
                     for o in self.objects if o.show.at_time(time)]
-        inner = '\n'.join(o.to_svg(time) for _, o in sorted(visible, key=lambda x: x[0]))
+        inner = '\n'.join(_child_svg(o, time) for _, o in sorted(visible, key=lambda x: x[0]))
         transform = _scale_transform(self._scale_x.at_time(time),
                                      self._scale_y.at_time(time), self._scale_origin)
         return f'<g{transform}>\n{inner}\n</g>'
@@ -419,12 +429,7 @@ class VCollection(_BBoxMethodsMixin):
                 for obj in self.objects:
                     getattr(obj, setter)(colors[0], start=start)
             return self
-        for i, obj in enumerate(self.objects):
-            t = i / (n - 1)
-            seg = t * (len(colors) - 1)
-            idx = min(int(seg), len(colors) - 2)
-            local_t = seg - idx
-            color = interpolate_color(colors[idx], colors[idx + 1], local_t)
+        for obj, color in zip(self.objects, _gradient_hex(colors, n)):
             getattr(obj, setter)(color, start=start)
         return self
 
@@ -856,7 +861,7 @@ class VCollection(_BBoxMethodsMixin):
         # Change nth child fill to highlight color, then restore
         target = self.objects[n]
         # Save original fill as raw tuple for reliable round-tripping
-        orig_fill_raw = target.styling.fill.time_func(start)
+        orig_fill_raw = target.styling.fill._tl(start)
         target.set_fill(color=color, start=start, end=mid, easing=easing)
         target.set_fill(color=orig_fill_raw, start=mid, end=end, easing=easing)
         return self
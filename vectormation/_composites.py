@@ -81,16 +81,16 @@ class MorphObject(VCollection):
                 return lambda t: pf((t - start) / dur)
             return lambda t: ' '.join(pf((t - start) / dur) for pf in pfs)
 
+        stylings = style.Styling.interpolate_many(
+            [(entries[0][1], entries[0][2]) for entries in groups.values()], start, end,
+            easing=easing, rotation_degrees=rotation_degrees, rotation_center=(cx, cy))
         objects = []
-        for group_entries in groups.values():
+        for group_entries, styling in zip(groups.values(), stylings):
             path_funcs = [e[0] for e in group_entries]
             new = Path('', x=0, y=0, creation=start, z=z)
             new.show.set_onward(end, False)
             new.d.set(start, end, _make_d_func(path_funcs))
-            new.styling = group_entries[0][1].interpolate(
-                group_entries[0][2], start, end, easing=easing,
-                rotation_degrees=rotation_degrees, rotation_center=(cx, cy)
-            )
+            new.styling = styling
             if len(path_funcs) > 1:
                 new.styling.fill_rule = attributes.String(start, 'evenodd')
             objects.append(new)
@@ -1424,6 +1424,9 @@ def parse_args():
     parser.add_argument('--start', type=float, default=None, help='Start time in seconds')
     parser.add_argument('--end', type=float, default=None, help='End time in seconds')
     parser.add_argument('--hot-reload', action='store_true', help='Enable hot reload in browser')
+    parser.add_argument('-j', '--workers', type=int, default=1, help='Processes rendering frames on export')
+    parser.add_argument('--chunk', type=float, default=None,
+                        help='Encode video in resumable chunks of this many seconds')
     return parser.parse_args()
 
 class ParametricFunction(Lines):
@@ -23,7 +23,7 @@ def _make_cell(x, y, w, h, val, font_size, fill, border_color, text_color,
 
 def _flash_fill(obj, color, start, end, default='#264653'):
     """Temporarily change an object's fill color, reverting at *end*."""
-    orig = obj.styling.fill.time_func(0)
+    orig = obj.styling.fill._tl(0)
     orig_hex = _rgb_to_hex(*orig) if orig else default
     obj.set_fill(color=color, start=start)
     obj.set_fill(color=orig_hex, start=end)
@@ -17,6 +17,9 @@ The body's VObject position attributes are automatically updated so the
 object follows the simulated trajectory.
 """
 import math
+
+import numpy as np
+
 from vectormation._constants import ORIGIN
 
 _MIN_DIST = 0.001  # guard against near-zero distance in collisions/springs
@@ -1080,7 +1083,18 @@ def _separate_bodies(a, b):
 
 
 def _traj_at(traj, start, dt, t):
-    """Interpolate a trajectory at time *t*. Works for (x,y) tuples and scalars."""
+    """Interpolate a trajectory at time *t*. Works for (x,y) tuples and scalars.
+
+    *t* may also be a NumPy array (``at_times``); tuples then come back as
+    ``(xs, ys)``.
+    """
+    if isinstance(t, np.ndarray):
+        idx = (t - start) / dt
+        steps = np.arange(len(traj))
+        if isinstance(traj[0], tuple):
+            return (np.interp(idx, steps, [p[0] for p in traj]),
+                    np.interp(idx, steps, [p[1] for p in traj]))
+        return np.interp(idx, steps, traj)
     elapsed = t - start
     if elapsed <= 0:
         return traj[0]
@@ -0,0 +1,633 @@
+"""Render backends turning canvas frames into pixels for export."""
+import functools
+import math
+import re
+import sys
+
+import numpy as np
+
+# Byte order of cairo's native-endian ARGB32 pixels, as an ffmpeg pix_fmt
+_RAW_PIX_FMT = 'bgra' if sys.byteorder == 'little' else 'argb'
+_RGB_RE = re.compile(r'rgb\((\d+),(\d+),(\d+)\)')
+_MITER_LIMIT = 4
+_TILE = 64   # side of the squares the damaged area of a frame is rounded to
+
+
+def _require_cairosvg():
+    """Import and return cairosvg, raising a helpful error if missing."""
+    try:
+        import cairosvg  # type: ignore[import-not-found]
+        return cairosvg
+    except ImportError:
+        raise ImportError('cairosvg is required for export. Install it with: pip install cairosvg')
+
+
+def _require_pillow():
+    """Import and return ``PIL.Image``, raising a helpful error if missing."""
+    try:
+        from PIL import Image  # type: ignore[import-not-found]
+        return Image
+    except ImportError:
+        raise ImportError('Pillow is required for this export. Install it with: pip install Pillow')
+
+
+class RenderBackend:
+    """Turns the canvas frame at a time into pixels of a given size.
+
+    Backends implement :meth:`raw`, giving pixels in the ffmpeg pixel
+    format ``pix_fmt``; the export methods of the canvas use it through
+    ``canvas.render_backend``.  :meth:`png` and :meth:`image` are derived
+    from it.
+    """
+
+    pix_fmt = 'rgba'
+
+    def require(self):
+        """Raise ImportError when a library the backend needs is missing."""
+
+    def raw(self, canvas, time, size):
+        """Return the frame as raw ``pix_fmt`` bytes with straight alpha."""
+        raise NotImplementedError
+
+    def image(self, canvas, time, size):
+        """Return the frame as an RGBA ``PIL.Image``."""
+        Image = _require_pillow()
+        return Image.frombuffer('RGBA', size, self.raw(canvas, time, size),
+                                'raw', self.pix_fmt.upper(), 0, 1)
+
+    def png(self, canvas, time, size, path=None):
+        """Return the frame as PNG bytes, or write them to *path*."""
+        import io
+        out = path or io.BytesIO()
+        self.image(canvas, time, size).save(out, 'PNG')
+        return None if path else out.getvalue()
+
+
+class SVGBackend(RenderBackend):
+    """Reference backend: rasterizes the frame SVG with cairosvg.
+
+    The last frame rasterized is kept with its SVG: a frame whose SVG is
+    the same text at the same size reuses those pixels instead of going
+    through cairo again, which makes held frames nearly free.  There is
+    no static layer: every other frame is rasterized whole, background
+    included (see :class:`PillowBackend`).
+    """
+
+    pix_fmt = _RAW_PIX_FMT
+
+    def __init__(self):
+        self._last = None   # (kind, svg, size, result) of the last frame rasterized
+
+    def require(self):
+        _require_cairosvg()
+
+    def _reused(self, kind, svg, size):
+        """Return the last result when it was rasterized from the same frame, else None."""
+        last = self._last
+        if last is not None and last[0] == kind and last[2] == size and last[1] == svg:
+            return last[3]
+        return None
+
+    def png(self, canvas, time, size, path=None):
+        cairosvg = _require_cairosvg()
+        svg = canvas.generate_frame_svg(time)
+        data = self._reused('png', svg, size)
+        if data is None:
+            data = cairosvg.svg2png(bytestring=svg.encode(), output_width=size[0], output_height=size[1])
+            self._last = ('png', svg, size, data)
+        if path is None:
+            return data
+        with open(path, 'wb') as f:
+            f.write(data)
+        return None
+
+    def raw(self, canvas, time, size):
+        """Render onto a cairosvg surface and read its pixels, with no PNG step.
+
+        Cairo stores premultiplied alpha, so translucent pixels are converted
+        back to straight alpha like a PNG would hold them.
+        """
+        _require_cairosvg()
+        from cairosvg.parser import Tree  # type: ignore[import-not-found]
+        from cairosvg.surface import PNGSurface  # type: ignore[import-not-found]
+        svg = canvas.generate_frame_svg(time)
+        data = self._reused('raw', svg, size)
+        if data is not None:
+            return data
+        width, height = size
+        tree = Tree(bytestring=svg.encode())
+        surface = PNGSurface(tree, None, 96, output_width=width, output_height=height).cairo
+        surface.flush()
+        pixels = np.frombuffer(surface.get_data(), np.uint8).reshape(height, surface.get_stride())
+        pixels = pixels[:, :width * 4].reshape(height, width, 4)
+        data = _straight_alpha(pixels, 3 if _RAW_PIX_FMT == 'bgra' else 0).tobytes()
+        self._last = ('raw', svg, size, data)
+        return data
+
+
+def _straight_alpha(pixels, alpha_idx):
+    """Convert premultiplied (height, width, 4) *pixels* to straight alpha, rounding."""
+    alpha = pixels[..., alpha_idx]
+    if alpha.min() == 255:
+        return pixels
+    pixels = pixels.copy()
+    a = alpha.astype(np.uint16)[..., None]
+    color = [i for i in range(4) if i != alpha_idx]
+    rgb = pixels[..., color].astype(np.uint16)
+    pixels[..., color] = np.where(a > 0, (rgb * 255 + a // 2) // np.maximum(a, 1), 0)
+    return pixels
+
+
+# ---------------------------------------------------------------------------
+# Direct drawing
+# ---------------------------------------------------------------------------
+
+def _ellipse_subpaths(obj, time, px):
+    cx, cy, rx, ry = (float(v) for v in obj._ep(time))
+    n = max(16, min(1024, int(math.tau * max(abs(rx), abs(ry)) * px / 3)))
+    a = np.linspace(0, math.tau, n, endpoint=False)
+    return [(np.column_stack((cx + rx * np.cos(a), cy + ry * np.sin(a))), True)]
+
+
+def _polygon_subpaths(obj, time, px):
+    pts = np.array([v.at_time(time) for v in obj.vertices], dtype=float).reshape(-1, 2)
+    return [(pts, obj.closed)]
+
+
+def _line_subpaths(obj, time, px):
+    x1, y1, x2, y2 = (float(v) for v in obj._ep(time))
+    return [(np.array([[x1, y1], [x2, y2]]), False)]
+
+
+def _path_subpaths(obj, time, px):
+    return _flatten_d(obj.path(time), px)
+
+
+def _flatten_d(d, px):
+    """Return the subpaths of the path data *d* as ``(points, closed)`` pairs."""
+    import svgpathtools
+    if not d or not d.strip():
+        return []
+    out = []
+    for sub in svgpathtools.parse_path(d).continuous_subpaths():
+        pts = [sub[0].start]
+        for seg in sub:
+            if isinstance(seg, svgpathtools.Line):
+                pts.append(seg.end)
+                continue
+            if isinstance(seg, svgpathtools.Arc):
+                span = abs(seg.delta) * math.pi / 180 * max(seg.radius.real, seg.radius.imag)
+            else:
+                ctrl = seg.bpoints()
+                span = sum(abs(b - a) for a, b in zip(ctrl, ctrl[1:]))
+            n = max(2, min(256, int(span * px / 3)))
+            pts.extend(seg.point(t) for t in np.linspace(0, 1, n + 1)[1:])
+        arr = np.array(pts, dtype=complex)
+        out.append((np.column_stack((arr.real, arr.imag)), sub.isclosed()))
+    return out
+
+
+def _shape_kinds():
+    """Map each ``to_svg`` the direct backend can reproduce to its geometry."""
+    from vectormation._shapes import Polygon, Ellipse, Circle, Rectangle
+    from vectormation._shapes_ext import Line, Path
+    return {
+        Polygon.to_svg: _polygon_subpaths,
+        Ellipse.to_svg: _ellipse_subpaths,
+        Circle.to_svg: _ellipse_subpaths,
+        Rectangle.to_svg: _path_subpaths,
+        Path.to_svg: _path_subpaths,
+        Line.to_svg: _line_subpaths,
+    }
+
+
+def _paint_order(objs, time):
+    """Return the shown objects in paint order, opening up collections drawn as a plain group."""
+    from vectormation._collection import VCollection
+    shown = sorted((((z.at_time(time) if (z := getattr(obj, 'z', None)) is not None else 0), obj)
+                    for obj in objs if obj.show.at_time(time)), key=lambda x: x[0])
+    found = []
+    for _, obj in shown:
+        if (type(obj).to_svg is VCollection.to_svg and 'to_svg' not in vars(obj)
+                and obj._scale_x.at_time(time) == 1 and obj._scale_y.at_time(time) == 1):
+            found.extend(_paint_order(obj.objects, time))
+        else:
+            found.append(obj)
+    return found
+
+
+def _paint(color, opacity):
+    """Return ``(r, g, b, a)`` for an SVG color string, None when unsupported."""
+    m = _RGB_RE.fullmatch(color)
+    if m is None:
+        return None
+    return (int(m[1]) / 255, int(m[2]) / 255, int(m[3]) / 255, min(max(float(opacity), 0.0), 1.0))
+
+
+@functools.lru_cache(maxsize=256)
+def _scale_lut(k):
+    """Return the ``Image.point`` table multiplying 8-bit values by *k*."""
+    return [round(v * k) for v in range(256)]
+
+
+def _is_pixel_rect(pts):
+    """Whether the closed polygon *pts* is a rectangle with integer, axis-aligned edges."""
+    if len(pts) == 5 and np.all(pts[0] == pts[-1]):
+        pts = pts[:-1]
+    if len(pts) != 4 or np.any(pts != np.rint(pts)):
+        return False
+    xs, ys = pts[:, 0], pts[:, 1]
+    return bool(np.all((xs == np.roll(xs, 1)) | (ys == np.roll(ys, 1)))
+                and len(set(xs.tolist())) == 2 and len(set(ys.tolist())) == 2)
+
+
+def _fill_rows(polys, width, height, evenodd=False):
+    """Return the (height, width) uint8 mask (0 or 255) of the pixel centers inside the closed *polys*.
+
+    Each edge crosses the rows whose center it spans at some x, adding its
+    direction (+1 downward, -1 upward) to the winding number of every
+    pixel whose center lies right of it.  A pixel is inside when that
+    number is nonzero, or odd with *evenodd*.  The crossings are sorted
+    along the rows and the mask is written as runs between them; edges
+    past the left side count for the whole row, so the grid may cut the
+    polygons anywhere.
+    """
+    x0, y0, x1, y1 = (np.concatenate(v) for v in zip(*(
+        (p[:, 0], p[:, 1], np.roll(p[:, 0], -1), np.roll(p[:, 1], -1)) for p in polys)))
+    down = y1 > y0
+    lo = np.where(down, y0, y1)
+    hi = np.where(down, y1, y0)
+    # Rows r whose center r + 0.5 lies in [lo, hi)
+    first = np.clip(np.ceil(lo - 0.5), 0, height).astype(np.intp)
+    count = np.clip(np.ceil(hi - 0.5), 0, height).astype(np.intp) - first
+    edges = np.flatnonzero(count > 0)
+    if not len(edges):
+        return np.zeros((height, width), dtype=np.uint8)
+    reps = count[edges]
+    edge = np.repeat(edges, reps)
+    rows = np.repeat(first[edges] - np.cumsum(reps) + reps, reps) + np.arange(reps.sum())
+    xs = x0[edge] + (rows + 0.5 - y0[edge]) * (x1[edge] - x0[edge]) / (y1[edge] - y0[edge])
+    cols = np.clip(np.floor(xs - 0.5) + 1, 0, width).astype(np.intp)
+    # The crossings of a row add up to zero, so one running sum serves all rows;
+    # those right of the last pixel land at the start of the next row
+    pos = rows * width + cols
+    order = np.argsort(pos, kind='stable')
+    pos = pos[order]
+    winding = np.cumsum(np.where(down[edge], 1, -1)[order])
+    last = np.append(pos[1:] != pos[:-1], True)
+    pos, winding = pos[last], winding[last]
+    inside = (winding & 1) if evenodd else (winding != 0)
+    values = np.concatenate(([0], inside * 255)).astype(np.uint8)
+    runs = np.diff(np.concatenate(([0], pos, [width * height])))
+    return np.repeat(values, runs).reshape(height, width)
+
+
+def _intersect(box, rect):
+    """Return the overlap of two ``(x0, y0, x1, y1)`` boxes, None when empty."""
+    x0, y0 = max(box[0], rect[0]), max(box[1], rect[1])
+    x1, y1 = min(box[2], rect[2]), min(box[3], rect[3])
+    return (x0, y0, x1, y1) if x0 < x1 and y0 < y1 else None
+
+
+def _changed_boxes(before, after):
+    """Return the boxes of the prepared items that differ between two frames.
+
+    Items are compared in paint order; a pixel outside every returned box
+    is covered by the same items painting the same way in both frames.
+    """
+    boxes = []
+    for i in range(max(len(before), len(after))):
+        old = before[i] if i < len(before) else None
+        new = after[i] if i < len(after) else None
+        if old is not None and new is not None and old[0] == new[0]:
+            continue
+        boxes.extend(item[1] for item in (old, new) if item is not None)
+    return boxes
+
+
+def _damage_rects(boxes, size, tile=_TILE):
+    """Cover *boxes* with rectangles of whole tiles; None when most of the frame is dirty.
+
+    Dirty tiles are merged into runs along each row, and runs spanning
+    the same columns on consecutive rows into one rectangle.
+    """
+    width, height = size
+    cols, rows = -(-width // tile), -(-height // tile)
+    dirty = np.zeros((rows, cols), dtype=bool)
+    for x0, y0, x1, y1 in boxes:
+        dirty[y0 // tile:-(-y1 // tile), x0 // tile:-(-x1 // tile)] = True
+    if dirty.sum() * 2 > dirty.size:
+        return None
+    rects, open_runs = [], {}
+    for row in range(rows + 1):
+        runs = set()
+        if row < rows:
+            edges = np.flatnonzero(np.diff(np.concatenate(([0], dirty[row].view(np.int8), [0]))))
+            runs = set(zip(edges[::2].tolist(), edges[1::2].tolist()))
+        for run in set(open_runs) - runs:
+            c0, c1 = run
+            rects.append((c0 * tile, open_runs.pop(run) * tile,
+                          min(c1 * tile, width), min(row * tile, height)))
+        for run in runs - set(open_runs):
+            open_runs[run] = row
+    return rects
+
+
+def _stroke_shapes(pts, closed, hw, cap, join):
+    """Return the polygons and circle centers whose union is the stroke of a polyline."""
+    keep = np.ones(len(pts), dtype=bool)
+    keep[1:] = np.any(np.diff(pts, axis=0) != 0, axis=1)
+    pts = pts[keep]
+    if closed and len(pts) > 2 and np.all(pts[0] == pts[-1]):
+        pts = pts[:-1]
+    if len(pts) < 2:
+        if len(pts) == 1 and not closed and cap != 'butt':
+            x, y = pts[0]
+            if cap == 'round':
+                return [], [(x, y)]
+            return [[(x - hw, y - hw), (x + hw, y - hw), (x + hw, y + hw), (x - hw, y + hw)]], []
+        return [], []
+    starts = pts
+    ends = np.roll(pts, -1, axis=0)
+    if not closed:
+        starts, ends = pts[:-1], pts[1:]
+    d = ends - starts
+    d /= np.maximum(np.hypot(d[:, 0], d[:, 1]), 1e-12)[:, None]
+    n = np.column_stack((-d[:, 1], d[:, 0])) * hw
+    polys = np.stack((starts + n, ends + n, ends - n, starts - n), axis=1).tolist()
+    circles = []
+    # Joins between segment i-1 and segment i, at starts[i]
+    idx = np.arange(len(starts)) if closed else np.arange(1, len(starts))
+    p, d0, d1, n0, n1 = starts[idx], d[idx - 1], d[idx], n[idx - 1], n[idx]
+    cross = d0[:, 0] * d1[:, 1] - d0[:, 1] * d1[:, 0]
+    # Joins only fill the wedge outside both quads; skip those under half a pixel wide
+    turn = np.abs(np.arctan2(cross, np.einsum('ij,ij->i', d0, d1))) * hw >= 0.5
+    p, d0, d1, n0, n1, cross = p[turn], d0[turn], d1[turn], n0[turn], n1[turn], cross[turn]
+    if join == 'round':
+        circles = p.tolist()
+    elif len(p):
+        side = np.where(cross > 0, -1.0, 1.0)[:, None]
+        a, b = p + side * n0, p + side * n1
+        cos_half = np.sqrt(np.maximum((1 + np.einsum('ij,ij->i', d0, d1)) / 2, 0))
+        miter = (cos_half > 1 / _MITER_LIMIT) if join == 'miter' else np.zeros(len(p), dtype=bool)
+        if miter.any():
+            bis = n0[miter] + n1[miter]
+            bis /= np.maximum(np.hypot(bis[:, 0], bis[:, 1]), 1e-12)[:, None]
+            tip = p[miter] + side[miter] * bis * (hw / cos_half[miter])[:, None]
+            polys += np.stack((p[miter], a[miter], tip, b[miter]), axis=1).tolist()
+        bevel = ~miter
+        if bevel.any():
+            polys += np.stack((p[bevel], a[bevel], b[bevel]), axis=1).tolist()
+    if not closed and cap != 'butt':
+        for q, dd in ((pts[0], -d[0]), (pts[-1], d[-1])):
+            if cap == 'round':
+                circles.append(tuple(q))
+            else:
+                nn = np.array((-dd[1], dd[0])) * hw
+                e = dd * hw
+                polys.append([tuple(q + nn), tuple(q + nn + e), tuple(q - nn + e), tuple(q - nn)])
+    return polys, circles
+
+
+class PillowBackend(RenderBackend):
+    """Draws frames straight from the evaluated attributes with Pillow.
+
+    Polygons, ellipses, circles, rectangles, lines and paths are filled and
+    stroked as polygons, skipping the frame SVG and its parsing.  Edges are
+    antialiased by drawing *supersample* times larger and averaging.  A
+    frame holding anything else (text, images, gradients, clip paths,
+    dashes, updaters, subclasses with their own ``to_svg``) is passed whole
+    to *fallback*, by default the reference :class:`SVGBackend`, so
+    nothing is silently dropped.  ``drawn`` and ``fallbacks`` count the
+    frames of each kind.
+
+    With *dirty_rects*, a frame is drawn over the previous one: only the
+    tiles covering shapes that differ between the two are cleared and
+    redrawn, with every shape clipped to them.  ``partial`` counts the
+    frames drawn that way; the pixels are the same as a full redraw.
+
+    With *static_layer*, the objects at the bottom of the paint order
+    whose animations are over (``last_change``) are drawn once into a
+    layer kept between frames; frames and redrawn tiles start from it and
+    only draw the objects above.  ``layers`` counts the layers built.
+    Only this backend keeps such a layer: frames it passes to *fallback*
+    are rasterized whole.
+    """
+
+    def __init__(self, supersample: int = 3, fallback=None, dirty_rects: bool = True, static_layer: bool = True):
+        self.supersample = max(1, int(supersample))
+        self.fallback = fallback or SVGBackend()
+        self.dirty_rects = dirty_rects
+        self.static_layer = static_layer
+        self.drawn = 0
+        self.fallbacks = 0
+        self.partial = 0
+        self.layers = 0
+        self._kinds = None
+        self._last = None   # (size, prepared items, frame buffer) of the last frame drawn
+        self._static = None   # (size, item keys, image) of the static layer
+
+    def require(self):
+        _require_pillow()
+
+    def image(self, canvas, time, size):
+        im = self._draw(canvas, time, size)
+        if im is None:
+            self.fallbacks += 1
+            return self.fallback.image(canvas, time, size)
+        self.drawn += 1
+        return im.copy()
+
+    def raw(self, canvas, time, size):
+        im = self._draw(canvas, time, size)
+        if im is None:
+            self.fallbacks += 1
+            return self.fallback.image(canvas, time, size).tobytes()
+        self.drawn += 1
+        return im.tobytes()
+
+    def _items(self, canvas, time, px):
+        """Return ``(obj, subpaths, matrix, paint)`` per visible object, None if any is unsupported."""
+        if self._kinds is None:
+            self._kinds = _shape_kinds()
+        items = []
+        for obj in _paint_order(canvas.objects.values(), time):
+            geometry = self._kinds.get(getattr(type(obj), 'to_svg', None))
+            if geometry is None or 'to_svg' in vars(obj) or getattr(obj, '_updaters', None):
+                return None
+            st = obj.styling
+            rule = st.fill_rule.at_time(time)
+            if rule not in ('nonzero', 'evenodd') or st.stroke_dasharray.at_time(time) or st.clip_path.at_time(time):
+                return None
+            fill = _paint(st.fill.at_time(time), st.fill_opacity.at_time(time))
+            stroke = _paint(st.stroke.at_time(time), st.stroke_opacity.at_time(time))
+            if fill is None or stroke is None:
+                return None
+            try:
+                subpaths = geometry(obj, time, px)
+            except (ValueError, IndexError):
+                return None
+            paint = (fill, stroke, float(st.stroke_width.at_time(time)), float(st.opacity.at_time(time)),
+                     rule, st.stroke_linecap.at_time(time), st.stroke_linejoin.at_time(time))
+            items.append((obj, subpaths, st.transform_matrix(time), paint))
+        return items
+
+    def _draw(self, canvas, time, size):
+        """Return the frame as an RGBA ``PIL.Image``, None when unsupported.
+
+        The image is the backend's frame buffer, drawn over on the next
+        call; :meth:`image` hands out a copy.
+        """
+        from PIL import Image  # type: ignore[import-not-found]
+        width, height = size
+        vb = [float(a.at_time(time)) for a in (canvas.vb_x, canvas.vb_y, canvas.vb_w, canvas.vb_h)]
+        scale = min(width / vb[2], height / vb[3])   # preserveAspectRatio xMidYMid meet
+        ox = (width - vb[2] * scale) / 2 - vb[0] * scale
+        oy = (height - vb[3] * scale) / 2 - vb[1] * scale
+        with canvas._eval_scope(time):
+            items = self._items(canvas, time, scale)
+        if items is None:
+            self._last = None
+            return None
+        prepared = [self._prepare(item, scale, ox, oy, size) for item in items]
+        static = 0
+        if self.static_layer:
+            while static < len(items) and items[static][0].last_change <= time:
+                static += 1
+        layer = self._layer(prepared[:static], size) if static else None
+        last = self._last
+        rects = None
+        if self.dirty_rects and last is not None and last[0] == size:
+            rects = _damage_rects(_changed_boxes(last[1], prepared), size)
+        if rects is None:
+            frame = Image.new('RGBA', size, (0, 0, 0, 0)) if layer is None else layer.copy()
+            rects = [(0, 0, width, height)]
+        else:
+            frame = last[2]
+            self.partial += 1
+        for rect in rects:
+            if rect != (0, 0, width, height):
+                frame.paste((0, 0, 0, 0) if layer is None else layer.crop(rect), rect)
+            for item in prepared[static:]:
+                if item is not None:
+                    clip = _intersect(item[1], rect)
+                    if clip is not None:
+                        self._paint(frame, item[2], item[1], clip)
+        self._last = (size, prepared, frame)
+        return frame
+
+    def _layer(self, prepared, size):
+        """Return the image of the prepared items painted in order, reused while they stay the same.
+
+        A layer whose items start with those of the cached one is drawn
+        over a copy of it.
+        """
+        from PIL import Image  # type: ignore[import-not-found]
+        keys = [None if item is None else item[0] for item in prepared]
+        cached = self._static
+        start = 0
+        if cached is not None and cached[0] == size and keys[:len(cached[1])] == cached[1]:
+            if len(keys) == len(cached[1]):
+                return cached[2]
+            start = len(cached[1])
+            layer = cached[2].copy()
+        else:
+            layer = Image.new('RGBA', size, (0, 0, 0, 0))
+        for item in prepared[start:]:
+            if item is not None:
+                self._paint(layer, item[2], item[1], item[1])
+        self._static = (size, keys, layer)
+        self.layers += 1
+        return layer
+
+    @staticmethod
+    def _prepare(item, scale, ox, oy, size):
+        """Return ``(key, box, shape)`` for an item in device pixels, None when it paints nothing.
+
+        *key* compares equal exactly when the item would paint the same
+        pixels, and *box* bounds them.
+        """
+        _, subpaths, m, (fill, stroke, sw, opacity, rule, cap, join) = item
+        if opacity <= 0 or not subpaths:
+            return None
+        a, b, c, d, e, f = m if m is not None else (1, 0, 0, 1, 0, 0)
+        dev = [(np.column_stack((a * p[:, 0] + c * p[:, 1] + e, b * p[:, 0] + d * p[:, 1] + f))
+                * scale + (ox, oy), closed) for p, closed in subpaths]
+        hw = sw * scale * math.sqrt(abs(a * d - b * c)) / 2
+        has_fill = fill[3] > 0 and any(len(p) > 2 for p, _ in dev)
+        has_stroke = stroke[3] > 0 and hw > 0
+        if not (has_fill or has_stroke):
+            return None
+        allpts = np.concatenate([p for p, _ in dev])
+        pad = hw * (_MITER_LIMIT if join == 'miter' else 1) + 1 if has_stroke else 1
+        x0 = max(int(math.floor(allpts[:, 0].min() - pad)), 0)
+        y0 = max(int(math.floor(allpts[:, 1].min() - pad)), 0)
+        x1 = min(int(math.ceil(allpts[:, 0].max() + pad)), size[0])
+        y1 = min(int(math.ceil(allpts[:, 1].max() + pad)), size[1])
+        if x1 <= x0 or y1 <= y0:
+            return None
+        shape = (dev, hw, fill if has_fill else None, stroke if has_stroke else None, opacity, rule, cap, join)
+        key = (tuple((p.tobytes(), closed) for p, closed in dev), hw, shape[2:])
+        return key, (x0, y0, x1, y1), shape
+
+    def _paint(self, frame, shape, box, clip):
+        """Composite a prepared shape with bounds *box* onto *frame*, touching only the pixels in *clip*.
+
+        Masks always start at the corner of *box* and are only cut short on
+        the right and bottom: Pillow rasterizes polygons reaching past the
+        top or left edge a little differently, which would show where tiles
+        redrawn later meet pixels drawn earlier.
+        """
+        from PIL import Image, ImageDraw  # type: ignore[import-not-found]
+        dev, hw, fill, stroke, opacity, rule, cap, join = shape
+        ss = self.supersample
+        x0, y0, x1, y1 = clip
+        ax0, ay0 = box[0], box[1]
+        region = ((x1 - ax0) * ss, (y1 - ay0) * ss)
+        crop = (x0 - ax0, y0 - ay0, x1 - ax0, y1 - ay0)
+        shift = np.array((ax0, ay0), dtype=float)
+        masks = []
+        if fill is not None and fill[3] >= 1 and opacity >= 1 and len(dev) == 1 and _is_pixel_rect(dev[0][0]):
+            # An opaque pixel-aligned rectangle just replaces what is under it
+            (rx0, ry0), (rx1, ry1) = dev[0][0].min(axis=0), dev[0][0].max(axis=0)
+            frame.paste(tuple(round(v * 255) for v in fill[:3]) + (255,),
+                        (max(int(rx0), x0), max(int(ry0), y0), min(int(rx1), x1), min(int(ry1), y1)))
+        elif fill is not None:
+            masks.append((self._fill_mask(dev, shift, ss, region, rule), fill))
+        if stroke is not None:
+            mask = Image.new('L', region, 0)
+            draw = ImageDraw.Draw(mask)
+            r = hw * ss
+            for p, closed in dev:
+                polys, circles = _stroke_shapes((p - shift) * ss, closed, r, cap, join)
+                for poly in polys:
+                    draw.polygon(poly, fill=255)
+                for x, y in circles:
+                    draw.ellipse((x - r, y - r, x + r, y + r), fill=255)
+            masks.append((mask.reduce(ss) if ss > 1 else mask, stroke))
+        group = frame if opacity >= 1 else Image.new('RGBA', (x1 - x0, y1 - y0), (0, 0, 0, 0))
+        dest = (x0, y0) if opacity >= 1 else (0, 0)
+        for mask, (r, g, bl, alpha) in masks:
+            if crop != (0, 0) + mask.size:
+                mask = mask.crop(crop)
+            layer = Image.new('RGBA', mask.size, (round(r * 255), round(g * 255), round(bl * 255), 0))
+            layer.putalpha(mask if alpha >= 1 else mask.point(_scale_lut(alpha)))
+            group.alpha_composite(layer, dest)
+        if opacity < 1:
+            group.putalpha(group.getchannel('A').point(_scale_lut(opacity)))
+            frame.alpha_composite(group, (x0, y0))
+
+    @staticmethod
+    def _fill_mask(dev, shift, ss, region, rule):
+        """Return the fill coverage mask of the subpaths under *rule* ('nonzero' or 'evenodd')."""
+        from PIL import Image, ImageDraw  # type: ignore[import-not-found]
+        polys = [(p - shift) * ss for p, _ in dev if len(p) > 2]
+        if len(polys) == 1 and _is_pixel_rect(polys[0] / ss):
+            # Axis-aligned on the pixel grid (backgrounds, panels): exact without supersampling
+            x0, y0 = polys[0].min(axis=0) / ss
+            x1, y1 = polys[0].max(axis=0) / ss
+            mask = Image.new('L', (region[0] // ss, region[1] // ss), 0)
+            ImageDraw.Draw(mask).rectangle((int(x0), int(y0), int(x1) - 1, int(y1) - 1), fill=255)
+            return mask
+        mask = Image.fromarray(_fill_rows(polys, region[0], region[1], rule == 'evenodd'))
+        return mask.reduce(ss) if ss > 1 else mask
@@ -5,6 +5,8 @@ import random as _random
 import re as _re
 from typing import Any
 
+import numpy as np
+
 import vectormation.easings as easings
 import vectormation.attributes as attributes
 import vectormation.style as style
@@ -76,9 +78,11 @@ class Polygon(VObject):
             parts.append('Z')
         return ' '.join(parts)
 
+    @style._rounds_svg
     def to_svg(self, time):
         tag = 'polygon' if self.closed else 'polyline'
-        pts = ' '.join(f'{x},{y}' for x, y in (v.at_time(time) for v in self.vertices))
+        num = style._num
+        pts = ' '.join(f'{num(x)},{num(y)}' for x, y in (v.at_time(time) for v in self.vertices))
         return f"<{tag} points='{pts}'{self.styling.svg_style(time)} />"
 
     def get_vertices(self, time: float = 0):
@@ -155,7 +159,7 @@ class Polygon(VObject):
         d = self.path(time)
         # Snapshot styling values at the given time.
         # Color attributes return rgb(...) strings from at_time(), but the
-        # constructor expects hex or tuples.  Use the raw time_func to get
+        # constructor expects hex or tuples.  Use the raw timeline to get
         # the (r, g, b) tuple for color attrs.
         style_kwargs = {}
         for name in ('fill_opacity', 'stroke_width',
@@ -165,7 +169,7 @@ class Polygon(VObject):
             style_kwargs[name] = getattr(self.styling, name).at_time(time)
         for name in ('fill', 'stroke'):
             attr = getattr(self.styling, name)
-            style_kwargs[name] = attr.time_func(time)
+            style_kwargs[name] = attr._tl(time)
         return Path(d, **style_kwargs)
 
     def get_longest_edge(self, time: float = 0):
@@ -1016,9 +1020,12 @@ class Ellipse(VObject):
         cx, cy = self.c.at_time(0)
         return f'Ellipse(rx={self.rx.at_time(0):.0f}, ry={self.ry.at_time(0):.0f}, cx={cx:.0f}, cy={cy:.0f})'
 
+    @style._rounds_svg
     def to_svg(self, time):
         cx, cy, rx, ry = self._ep(time)
-        return f"<ellipse cx='{cx}' cy='{cy}' rx='{rx}' ry='{ry}'{self.styling.svg_style(time)} />"
+        num = style._num
+        return (f"<ellipse cx='{num(cx)}' cy='{num(cy)}' rx='{num(rx)}' ry='{num(ry)}'"
+                f"{self.styling.svg_style(time)} />")
 
 class Circle(Ellipse):
     """Circle: Ellipse with rx == ry."""
@@ -1393,9 +1400,12 @@ class Circle(Ellipse):
 
     tangent_line_from_point = get_tangent_lines
 
+    @style._rounds_svg
     def to_svg(self, time):
         cx, cy = self.c.at_time(time)
-        return f"<circle cx='{cx}' cy='{cy}' r='{self.rx.at_time(time)}'{self.styling.svg_style(time)} />"
+        num = style._num
+        return (f"<circle cx='{num(cx)}' cy='{num(cy)}' r='{num(self.rx.at_time(time))}'"
+                f"{self.styling.svg_style(time)} />")
 
 class Dot(Circle):
     """Small filled circle, no stroke."""
@@ -1418,6 +1428,127 @@ class AnnotationDot(Dot):
         cx, cy = self.c.at_time(0)
         return f'AnnotationDot(cx={cx:.0f}, cy={cy:.0f})'
 
+def _rgb_rows(fill, n):
+    """Parse one color, or one color per row, into an ``(n, 3)`` array."""
+    if isinstance(fill, np.ndarray):
+        return np.broadcast_to(fill, (n, 3))
+    parse = attributes.Color().parse
+    if isinstance(fill, str) or (isinstance(fill, tuple) and all(isinstance(v, (int, float)) for v in fill)):
+        return np.broadcast_to(parse(fill)[1][:3], (n, 3))
+    return np.array([parse(f)[1][:3] for f in fill])
+
+
+_DOT_SVG = "<circle cx='{}' cy='{}' r='{}' fill='rgb({},{},{})' fill-opacity='{}' />"
+
+
+class DotCloud(VObject):
+    """Many dots in one object, stored column-wise.
+
+    Centres, radii, fill colours and fill opacities of all dots live in
+    :class:`attributes.Columns` (``pos``, ``r``, ``fill``, ``fill_opacity``),
+    so a frame is one vectorized evaluation and one string join instead of
+    thousands of ``Dot`` objects.  Dots are addressed by index (int, slice,
+    mask or index array); styling, shifts and other transforms apply to
+    the whole cloud.
+    """
+    def __init__(self, points, r: float = DEFAULT_DOT_RADIUS, fill='#fff', fill_opacity: float = 1,
+                 z: float = 0, creation: float = 0, **styling_kwargs):
+        super().__init__(creation=creation, z=z)
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        n = len(pts)
+        self.pos = attributes.Columns(creation, pts)
+        self.r = attributes.Columns(creation, np.broadcast_to(r, n))
+        self.fill = attributes.Columns(creation, _rgb_rows(fill, n))
+        self.fill_opacity = attributes.Columns(creation, np.broadcast_to(fill_opacity, n))
+        self.offset = attributes.Coor(creation, (0, 0))
+        self.styling = style.Styling(styling_kwargs, creation=creation, stroke_width=0)
+
+    def __len__(self):
+        return len(self.pos)
+
+    def _extra_attrs(self):
+        return [self.offset, self.pos, self.r, self.fill, self.fill_opacity]
+
+    def _shift_coors(self):
+        return [self.offset]
+
+    def _columns(self, time):
+        """Return (x, y, r, rgb, opacity) arrays of the visible dots at *time*."""
+        pos = self.pos.at_time(time)
+        r = self.r.at_time(time)
+        opacity = self.fill_opacity.at_time(time)
+        rgb = self.fill.at_time(time)
+        keep = (r > 0) & (opacity > 0)
+        ox, oy = self.offset.at_time(time)
+        return pos[keep, 0] + ox, pos[keep, 1] + oy, r[keep], rgb[keep], opacity[keep]
+
+    def to_svg(self, time):
+        x, y, r, rgb, opacity = self._columns(time)
+        rgb = np.clip(np.rint(rgb), 0, 255).astype(int)
+        dots = ''.join(map(_DOT_SVG.format,
+                           np.round(x, 2).tolist(), np.round(y, 2).tolist(), np.round(r, 2).tolist(),
+                           rgb[:, 0].tolist(), rgb[:, 1].tolist(), rgb[:, 2].tolist(),
+                           np.round(opacity, 3).tolist()))
+        return f"<g{self.styling.svg_style(time)}>{dots}</g>"
+
+    def path(self, time):
+        x, y, r, _, _ = self._columns(time)
+        return ''.join(f'M{cx-rr},{cy}a{rr},{rr} 0 1,0 {rr*2},0a{rr},{rr} 0 1,0 -{rr*2},0z'
+                       for cx, cy, rr in zip(x.tolist(), y.tolist(), r.tolist()))
+
+    def bbox(self, time: float = 0):
+        x, y, r, _, _ = self._columns(time)
+        if len(x) == 0:
+            ox, oy = self.offset.at_time(time)
+            return (ox, oy, 0, 0)
+        xmin, xmax = float((x - r).min()), float((x + r).max())
+        ymin, ymax = float((y - r).min()), float((y + r).max())
+        pts = [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax)]
+        return self._bbox_from_points(pts, time) or (xmin, ymin, xmax - xmin, ymax - ymin)
+
+    def get_points(self, time: float = 0):
+        """Return the dot centres at *time* as an ``(n, 2)`` array."""
+        ox, oy = self.offset.at_time(time)
+        return self.pos.at_time(time) + (ox, oy)
+
+    def set_points(self, points, start: float = 0, end: float | None = None,
+                   easing=easings.smooth, index=slice(None)):
+        """Move the selected dots to *points* (instantly, or animated over [start, end])."""
+        _set_columns(self.pos, start, end, np.asarray(points, dtype=float), easing, index)
+        return self
+
+    def set_radius(self, r, start: float = 0, end: float | None = None,
+                   easing=easings.smooth, index=slice(None)):
+        """Set the radius of the selected dots."""
+        _set_columns(self.r, start, end, r, easing, index)
+        return self
+
+    def set_fill(self, fill, start: float = 0, end: float | None = None,
+                 easing=easings.smooth, index=slice(None)):
+        """Set the fill colour (one colour, or one per selected dot)."""
+        n = len(self.fill.base[index].reshape(-1, 3))
+        _set_columns(self.fill, start, end, _rgb_rows(fill, n).reshape(self.fill.base[index].shape),
+                     easing, index)
+        return self
+
+    def set_fill_opacity(self, opacity, start: float = 0, end: float | None = None,
+                         easing=easings.smooth, index=slice(None)):
+        """Set the fill opacity of the selected dots."""
+        _set_columns(self.fill_opacity, start, end, opacity, easing, index)
+        return self
+
+    def __repr__(self):
+        return f'DotCloud({len(self)} dots)'
+
+
+def _set_columns(cols, start, end, value, easing, index):
+    """Set rows of *cols* instantly (end=None) or animate them to *value*."""
+    if end is None:
+        cols.set_onward(start, value, index=index)
+    else:
+        cols.move_to(start, end, value, easing=easing, index=index)
+
+
 class Rectangle(VObject):
     def __init__(self, width, height, x: float = ORIGIN[0], y: float = ORIGIN[1], rx: float = 0, ry: float = 0, creation: float = 0, z: float = 0, **styling_kwargs):
         super().__init__(creation=creation, z=z)
@@ -1460,10 +1591,12 @@ class Rectangle(VObject):
                 f'a {rx},{ry} 0 0,1 -{rx},-{ry} l 0,{ry*2-h} '
                 f'a {rx},{ry} 0 0,1 {rx},-{ry} z')
 
+    @style._rounds_svg
     def to_svg(self, time):
-        return (f"<rect x='{self.x.at_time(time)}' y='{self.y.at_time(time)}'"
-                f" width='{self.width.at_time(time)}' height='{self.height.at_time(time)}'"
-                f" rx='{self.rx.at_time(time)}' ry='{self.ry.at_time(time)}'"
+        num = style._num
+        return (f"<rect x='{num(self.x.at_time(time))}' y='{num(self.y.at_time(time))}'"
+                f" width='{num(self.width.at_time(time))}' height='{num(self.height.at_time(time))}'"
+                f" rx='{num(self.rx.at_time(time))}' ry='{num(self.ry.at_time(time))}'"
                 f"{self.styling.svg_style(time)} />")
 
     def get_vertices(self, time: float = 0):
@@ -1616,8 +1749,8 @@ class Rectangle(VObject):
         style_kw = {}
         for name in _STYLES:
             attr = getattr(self.styling, name)
-            # Color.time_func returns a raw tuple; for other attrs use at_time
-            val = attr.time_func(time) if isinstance(attr, attributes.Color) else attr.at_time(time)
+            # Color._tl returns a raw tuple; for other attrs use at_time
+            val = attr._tl(time) if isinstance(attr, attributes.Color) else attr.at_time(time)
             style_kw[name] = val
         style_kw.update(kwargs)
         return RoundedRectangle(w, h, x=x, y=y, corner_radius=radius, **style_kw)
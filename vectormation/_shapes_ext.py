@@ -47,10 +47,13 @@ class Line(VObject):
         x1, y1, x2, y2 = self._ep(time)
         return f'M{x1},{y1}L{x2},{y2}'
 
+    @style._rounds_svg
     def to_svg(self, time):
         """Return the SVG <line> element string."""
         x1, y1, x2, y2 = self._ep(time)
-        return f"<line x1='{x1}' y1='{y1}' x2='{x2}' y2='{y2}'{self.styling.svg_style(time)} />"
+        num = style._num
+        return (f"<line x1='{num(x1)}' y1='{num(y1)}' x2='{num(x2)}' y2='{num(y2)}'"
+                f"{self.styling.svg_style(time)} />")
 
     def get_start(self, time: float = 0):
         """Return the start point (x, y) of the line."""
@@ -350,7 +353,7 @@ class Line(VObject):
         tw = tip_width if tip_width is not None else DEFAULT_ARROW_TIP_WIDTH
         hw = tw / 2
         x1, y1, x2, y2 = self._ep(creation)
-        stroke_color = self.styling.stroke.time_func(creation)
+        stroke_color = self.styling.stroke._tl(creation)
         objects = [self]
 
         # Build tip at each requested endpoint: (tip_point, direction toward tip)
@@ -818,7 +821,7 @@ class Text(VObject):
         return (full, self.x.at_time(time), self.y.at_time(time),
                 self.font_size.at_time(time),
                 self.font_size.at_time(time) * CHAR_WIDTH_FACTOR,
-                self.styling.fill.time_func(time))
+                self.styling.fill._tl(time))
 
 
     def split_chars(self, time: float = 0):
@@ -923,7 +926,7 @@ class Text(VObject):
         total_w = self._estimate_width(full, fs)
         xl = self._text_left(x, total_w)
         style_kw = dict(font_size=fs, creation=time, stroke_width=0,
-                        fill=self.styling.fill.time_func(time))
+                        fill=self.styling.fill._tl(time))
         style_kw.update(kwargs)
         parts = []
         cursor = 0
@@ -960,7 +963,7 @@ class Text(VObject):
         fs = self.font_size.at_time(time)
         x = self.x.at_time(time)
         y = self.y.at_time(time)
-        fill_color = self.styling.fill.time_func(time)
+        fill_color = self.styling.fill._tl(time)
         line_height = fs * 1.2
         lines = []
         current_words = []
@@ -999,12 +1002,14 @@ class Text(VObject):
                 parts.append(f" {name}='{val}'")
         return ''.join(parts)
 
+    @style._rounds_svg
     def to_svg(self, time):
         """Return the SVG <text> element string."""
-        font_attrs = self._font_attrs()
-        txt = _xml_escape(str(self.text.at_time(time)))
-        return (f"<text x='{self.x.at_time(time)}' y='{self.y.at_time(time)}'"
-                f" font-size='{self.font_size.at_time(time)}'{font_attrs}{self.styling.svg_style(time)}"
+        num = style._num
+        font_attrs = num(self._font_attrs())
+        txt = num(_xml_escape(str(self.text.at_time(time))))
+        return (f"<text x='{num(self.x.at_time(time))}' y='{num(self.y.at_time(time))}'"
+                f" font-size='{num(self.font_size.at_time(time))}'{font_attrs}{self.styling.svg_style(time)}"
                 f">{txt}</text>")
 
 class CountAnimation(Text):
@@ -1167,6 +1172,9 @@ class Integer(DecimalNumber):
 
 class Trace(VObject):
     """Follows a point every dt and renders as a polyline."""
+
+    _fragment_cacheable = False  # the polyline grows with the time itself
+
     def __init__(self, point, start: float = 0, end: float | None = None, dt=1/60, z: float = 0, **styling_kwargs):
         super().__init__(creation=start, z=z)
         self.start = start
@@ -1288,7 +1296,7 @@ class Path(VObject):
         """Return a dict of styling kwargs capturing this path's style at *time*."""
         kw = {n: getattr(self.styling, n).at_time(time) for n in self._STYLE_NAMES}
         for n in ('fill', 'stroke'):
-            kw[n] = getattr(self.styling, n).time_func(time)
+            kw[n] = getattr(self.styling, n)._tl(time)
         return kw
 
     def get_length(self, time: float = 0):
@@ -1358,9 +1366,10 @@ class Path(VObject):
         """Return the SVG path data string."""
         return self.d.at_time(time)
 
+    @style._rounds_svg
     def to_svg(self, time):
         """Return the SVG <path> element string."""
-        return f"<path d='{self.d.at_time(time)}'{self.styling.svg_style(time)} />"
+        return f"<path d='{style._num(self.d.at_time(time))}'{self.styling.svg_style(time)} />"
 
     @classmethod
     def from_points(cls, points, closed=False, smooth=False, **kwargs):
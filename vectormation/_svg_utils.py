@@ -975,6 +975,8 @@ class AnimatedBoundary(VObject):
         Border stroke width.
     """
 
+    _fragment_cacheable = False  # colors cycle with the time itself
+
     def __init__(self, target, colors=None, cycle_rate: float = 1.0, buff: float = 8,
                  stroke_width: float = 3, creation: float = 0, z: float = 0):
         super().__init__(creation=creation, z=z)
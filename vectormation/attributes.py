@@ -2,10 +2,20 @@
 
 Each attribute (Real, Coor, Color, etc.) wraps a function of time,
 enabling smooth animations via set(), move_to(), interpolate(), etc.
+
+Internally every attribute keeps a ``_Timeline``: a sorted partition of the
+time axis into segments, looked up with a binary search.  Editing an
+attribute splices new segments in instead of wrapping the previous function,
+so evaluation cost grows with log(edits) rather than with the edit count.
 """
 from __future__ import annotations
 import math
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict
+from numbers import Real as _Number
 from typing import Any
+import numpy as np
 import vectormation.colors as colors
 from vectormation.colors import _rgb_to_hsl, _hsl_to_rgb
 import vectormation.easings as easings
@@ -32,18 +42,896 @@ def _wrap(outer, inner, start, end=None, lincl=True, rincl=True, stay=False):
     return f
 
 
-class Real:
+class _Varying:
+    """``_Segment.const`` marker for "not provably constant".
+
+    Survives copy/deepcopy/pickle as the same object so identity checks hold.
+    """
+    __slots__ = ()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return '_VARYING'
+
+    def __repr__(self):
+        return '_VARYING'
+
+
+_VARYING = _Varying()
+
+
+class _Segment:
+    """A piece of a timeline: a base function followed by stacked ops.
+
+    Each op is called as ``op(value, t)`` and returns the new value, which is
+    how ``add``-style edits layer on top of whatever was there before.
+    Segments are never mutated once built, so they can be shared freely.
+    ``const`` holds the value when the segment is known to be constant
+    (folded at edit time), so evaluating it needs no function call.
+    ``pure`` means the value depends on ``t`` alone (no other attributes),
+    so it may be evaluated ahead of time.
+    """
+    __slots__ = ('func', 'ops', 'const', 'pure')
+
+    def __init__(self, func, ops=(), const=_VARYING, pure=False):
+        self.func = func
+        self.ops = ops
+        self.const = const
+        self.pure = pure
+
+    def __call__(self, t):
+        if self.const is not _VARYING:
+            return self.const
+        v = self.func(t)
+        for op in self.ops:
+            v = op(v, t)
+        return v
+
+
+_held: dict | None = None   # hold -> value while one at_times call runs, see _Hold
+
+
+class _Hold:
+    """Segment function that keeps returning another segment's value at ``t``.
+
+    ``stay`` edits hold the last value of a piece that may read other
+    attributes, so it has to stay lazy.  Holds of holds form a chain, which
+    is walked with a loop rather than by nested calls, so evaluation needs
+    constant stack depth however many held edits pile up.  The value is
+    computed again on every call, since the held function may read state
+    that changes without an attribute edit; only within one ``at_times``
+    call are the values of the chain shared (see ``_held``).
+    """
+    __slots__ = ('seg', 't')
+
+    def __init__(self, seg, t):
+        self.seg = seg
+        self.t = t
+
+    def __call__(self, _t):
+        memo = _held
+        chain, hold = [], self
+        while True:
+            if memo is not None and hold in memo:
+                v = memo[hold]
+                break
+            seg = hold.seg
+            if seg.const is not _VARYING or type(seg.func) is not _Hold:
+                v = seg(hold.t)
+                if memo is not None:
+                    memo[hold] = v
+                break
+            chain.append(hold)
+            hold = seg.func
+        for hold in reversed(chain):
+            for op in hold.seg.ops:
+                v = op(v, hold.t)
+            if memo is not None:
+                memo[hold] = v
+        return v
+
+
+class _Timeline:
+    """Sorted, contiguous partition of the time axis into segments.
+
+    Piece ``i`` starts at ``starts[i]`` (excluded when ``lexcl[i]``) and runs
+    up to the start of piece ``i + 1``.  A timeline is callable, so it can be
+    used anywhere a plain ``time_func`` is expected.  ``stamp`` is the value
+    of ``_edits`` when the timeline was last edited (or a value it reads
+    through a link was), so caches can tell whether it changed since.
+    """
+    __slots__ = ('starts', 'lexcl', 'segs', 'shared', 'stamp')
+
+    def __init__(self, func=None):
+        self.starts = [-math.inf]
+        self.lexcl = [False]
+        self.segs = [_Segment(func)]
+        self.shared = False
+        self.stamp = _edits
+
+    def copy(self):
+        new = _Timeline.__new__(_Timeline)
+        new.starts = self.starts.copy()
+        new.lexcl = self.lexcl.copy()
+        new.segs = self.segs.copy()
+        new.shared = False
+        new.stamp = _edits
+        return new
+
+    def index(self, t):
+        """Return the index of the piece that covers time *t*."""
+        starts = self.starts
+        i = bisect_right(starts, t) - 1
+        if self.lexcl[i] and starts[i] == t:
+            i -= 1
+        return i
+
+    def __call__(self, t):
+        starts = self.starts
+        i = bisect_right(starts, t) - 1
+        if self.lexcl[i] and starts[i] == t:
+            i -= 1
+        seg = self.segs[i]
+        if seg.const is not _VARYING:
+            return seg.const
+        if not seg.ops:
+            return seg.func(t)
+        v = seg.func(t)
+        for op in seg.ops:
+            v = op(v, t)
+        return v
+
+    def groups(self, ts):
+        """Group an array of times by piece: yield ``(positions, segment)``."""
+        starts = np.array(self.starts)
+        idx = np.searchsorted(starts, ts, side='right') - 1
+        idx -= np.array(self.lexcl)[idx] & (starts[idx] == ts)
+        order = np.argsort(idx, kind='stable')
+        cuts = np.flatnonzero(np.diff(idx[order])) + 1
+        for sel in np.split(order, cuts):
+            yield sel, self.segs[idx[sel[0]]]
+
+    def at_times(self, times):
+        """Evaluate the timeline at every time in *times* (see ``_sample``)."""
+        global _held
+        ts = np.asarray(times, dtype=float).ravel()
+        if len(ts) == 0:
+            return np.empty(0)
+        outer = _held
+        if outer is None:
+            _held = {}
+        try:
+            with np.errstate(all='ignore'):
+                chunks = [(sel, _sample(seg, ts[sel])) for sel, seg in self.groups(ts)]
+        finally:
+            _held = outer
+        return _assemble(chunks, len(ts))
+
+    def _split(self, x, excl):
+        """Make sure a piece boundary exists at (x, excl); return its index."""
+        starts, lexcl = self.starts, self.lexcl
+        i = bisect_right(starts, x) - 1
+        if not excl and lexcl[i] and starts[i] == x:
+            i -= 1
+        if starts[i] == x and lexcl[i] == excl:
+            return i
+        i += 1
+        starts.insert(i, x)
+        lexcl.insert(i, excl)
+        self.segs.insert(i, self.segs[i - 1])
+        return i
+
+    def _span(self, lo, lo_excl, hi, hi_incl):
+        """Split at both ends of a range and return the covered index range."""
+        if hi is not None and (hi < lo or (hi == lo and (lo_excl or not hi_incl))):
+            return None
+        a = self._split(lo, lo_excl)
+        b = len(self.starts) if hi is None else self._split(hi, hi_incl)
+        return a, b
+
+    def put(self, lo, lo_excl, hi, hi_incl, seg):
+        """Replace everything on the range with *seg* (``hi=None``: onward)."""
+        span = self._span(lo, lo_excl, hi, hi_incl)
+        if span is None:
+            return
+        a, b = span
+        self.starts[a:b] = [lo]
+        self.lexcl[a:b] = [lo_excl]
+        self.segs[a:b] = [seg]
+        self._coalesce(a, a + 1)
+
+    def stack(self, lo, lo_excl, hi, hi_incl, op, folds=False, pure=False):
+        """Layer ``op(value, t)`` on top of every piece in the range.
+
+        With ``folds`` the op ignores ``t``, so constant pieces stay constant.
+        """
+        span = self._span(lo, lo_excl, hi, hi_incl)
+        if span is None:
+            return
+        segs = self.segs
+        done: dict[int, _Segment] = {}
+        for i in range(*span):
+            old = segs[i]
+            new = done.get(id(old))
+            if new is None:
+                if folds and old.const is not _VARYING:
+                    new = _const(op(old.const, None))
+                else:
+                    new = _Segment(old.func, old.ops + (op,), pure=old.pure and pure)
+                done[id(old)] = new
+            segs[i] = new
+        self._coalesce(*span)
+
+    def _coalesce(self, a, b):
+        """Merge pieces ``a - 1`` through ``b`` wherever neighbours always agree.
+
+        Boundaries between equal constants (or a segment and itself) do not
+        change any value, they only make lookups and ``static_run`` longer.
+        """
+        starts, lexcl, segs = self.starts, self.lexcl, self.segs
+        i, end = max(a, 1), min(b + 1, len(segs))
+        while i < end:
+            if _same(segs[i - 1], segs[i]):
+                del starts[i], lexcl[i], segs[i]
+                end -= 1
+            else:
+                i += 1
+
+    def static_value(self, t0, t1):
+        """Return the constant value on [t0, t1], or ``_VARYING``.
+
+        Pieces linked to another attribute count as constant wherever that
+        attribute is.
+        """
+        i0, i1 = self.index(t0), self.index(t1)
+        starts = self.starts
+        value = _VARYING
+        for i in range(i0, i1 + 1):
+            seg = self.segs[i]
+            v = seg.const
+            if v is _VARYING:
+                link = _link_of(seg)
+                if link is None:
+                    return _VARYING
+                v = link.static_value(max(t0, starts[i]),
+                                      min(t1, starts[i + 1]) if i < i1 else t1)
+                if v is _VARYING:
+                    return _VARYING
+            if i > i0 and v != value:
+                return _VARYING
+            value = v
+        return value
+
+    def static_since(self):
+        """Return the start of the trailing constant run, or None."""
+        segs = self.segs
+        value = segs[-1].const
+        if value is _VARYING:
+            link = _link_of(segs[-1])
+            since = None if link is None else link.source._tl.static_since()
+            return None if since is None else max(since, self.starts[-1])
+        i = len(segs) - 1
+        while i > 0 and segs[i - 1].const is not _VARYING and segs[i - 1].const == value:
+            i -= 1
+        return self.starts[i]
+
+    def static_run(self, t):
+        """Return ``(lo, hi, value)``: the value is constant on the open
+        interval ``(lo, hi)`` around *t*; None if it varies at *t*."""
+        i = self.index(t)
+        segs, starts = self.segs, self.starts
+        seg = segs[i]
+        hi = starts[i + 1] if i + 1 < len(starts) else math.inf
+        value = seg.const
+        if value is _VARYING:
+            link = _link_of(seg)
+            run = None if link is None else link.run(t)
+            if run is None:
+                return None
+            return max(run[0], starts[i]), min(run[1], hi), run[2]
+        lo = i
+        while lo > 0 and segs[lo - 1].const is not _VARYING and segs[lo - 1].const == value:
+            lo -= 1
+        j = i + 1
+        while j < len(segs) and segs[j].const is not _VARYING and segs[j].const == value:
+            j += 1
+        return starts[lo], starts[j] if j < len(starts) else math.inf, value
+
+
+class _CompiledTimeline:
+    """A timeline whose animated pieces are pre-sampled at known times.
+
+    The samples are computed with one vectorized pass per piece into the
+    ``values`` buffer and served from the ``rows`` table (time -> value);
+    any other time, and constant pieces (already cheap), go to the wrapped
+    timeline.  Only pure pieces (see ``_pure_at``) that evaluate to floats
+    (or tuples of floats) are sampled; the others may read state that can
+    change without notice, so they stay lazy.  Integral samples are
+    re-evaluated exactly, so lookups return the same types ``at_time``
+    would (``40`` stays ``40``).
+    """
+    __slots__ = ('timeline', 'rows', 'values')
+
+    def __init__(self, timeline, times):
+        self.timeline = timeline
+        ts = np.unique(np.asarray(times, dtype=float).ravel())
+        kept, chunks = [], []
+        if len(ts):
+            with np.errstate(all='ignore'):
+                for sel, seg in timeline.groups(ts):
+                    if seg.const is not _VARYING or not _pure_at(seg, ts[sel]):
+                        continue
+                    if not _is_float(seg(ts[sel[0]].item())):
+                        continue
+                    kept.append(ts[sel])
+                    chunks.append(_sample(seg, ts[sel]))
+        if len({c.shape[1:] for c in chunks}) > 1:   # tuple length changes: give up
+            kept, chunks = [], []
+        self.values = np.concatenate(chunks) if chunks else np.empty(0)
+        self.rows = {}
+        if not kept:
+            return
+        kept = np.concatenate(kept)
+        whole = self.values == np.round(self.values)
+        if self.values.ndim > 1:
+            whole = whole.any(axis=1)
+            rows = map(tuple, self.values.tolist())
+        else:
+            rows = self.values.tolist()
+        self.rows = dict(zip(kept.tolist(), rows))
+        for t in kept[whole].tolist():
+            self.rows[t] = timeline(t)
+
+    def __call__(self, t):
+        try:
+            return self.rows[t]
+        except KeyError:
+            return self.timeline(t)
+
+    def __getattr__(self, name):
+        return getattr(self.timeline, name)
+
+
+class _Link:
+    """Time function that reads another attribute: ``func(source(t))``.
+
+    Links are the edges of the attribute dependency graph.  The source keeps
+    a weak set of its links; editing the source clears their memos and drops
+    compiled buffers downstream (see ``_Attribute._changed``).  While the
+    source is constant around ``t``, its value is looked up once for the
+    whole constant run; ``func`` is still called on every lookup, since it
+    may read other state.
+    """
+    __slots__ = ('source', 'target', 'func', 'memo', '__weakref__')
+
+    def __init__(self, source, target, func=None):
+        self.source = source
+        self.target = target
+        self.func = func
+        self.memo = None
+        if type(source._links) is tuple:
+            source._links = weakref.WeakSet()
+        source._links.add(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Like a plain function, keep reading the original source; only the
+        # target follows the copy.
+        return _Link(self.source, memo.get(id(self.target), self.target), self.func)
+
+    def run(self, t):
+        """Return ``(lo, hi, value)`` for the constant run of the source around *t*, or None."""
+        memo = self.memo
+        if memo is None or not memo[0] < t < memo[1]:
+            memo = self.source._tl.static_run(t)
+            if memo is None:
+                return None
+            self.memo = memo
+        if self.func is None:
+            return memo
+        return memo[0], memo[1], self.func(memo[2])
+
+    def static_value(self, t0, t1):
+        v = self.source._tl.static_value(t0, t1)
+        if v is _VARYING or self.func is None:
+            return v
+        return self.func(v)
+
+    def __call__(self, t):
+        if isinstance(t, np.ndarray):
+            v = self.source._tl.at_times(t)
+            if v.dtype == object:
+                raise TypeError('non-numeric source')
+            if v.ndim > 1:
+                v = tuple(v.T)
+        else:
+            run = self.run(t)
+            if run is not None:
+                return run[2]
+            v = self.source._tl(t)
+        return v if self.func is None else self.func(v)
+
+
+def _link_of(seg):
+    """Return the link a segment evaluates, if its value is nothing else."""
+    func = seg.func
+    return func if type(func) is _Link and not seg.ops else None
+
+
+def _pure_at(seg, ts):
+    """Return True if *seg* depends on the time alone at the times *ts*.
+
+    A plain link (no ``func``, which may read other state) is pure when the
+    pieces of its source covering *ts* are; an edit to the source drops the
+    compiled buffers downstream anyway.
+    """
+    if seg.pure or seg.const is not _VARYING:
+        return True
+    link = _link_of(seg)
+    if link is None or link.func is not None:
+        return False
+    return all(_pure_at(s, ts[sel]) for sel, s in link.source._tl.groups(ts))
+
+
+def _same(a, b):
+    """Return True if segments *a* and *b* evaluate the same at every time."""
+    if a is b:
+        return True
+    if a.const is _VARYING or b.const is _VARYING:
+        return False
+    try:
+        return bool(_typed(a.const) == _typed(b.const))
+    except (TypeError, ValueError):  # e.g. arrays
+        return False
+
+
+def _is_float(value):
+    if isinstance(value, tuple):
+        return len(value) > 0 and all(isinstance(v, float) for v in value)
+    return isinstance(value, float)
+
+
+def _is_numeric(value):
+    if isinstance(value, tuple):
+        return all(isinstance(v, _Number) for v in value)
+    return isinstance(value, _Number)
+
+
+def _sample(seg, ts):
+    """Evaluate a segment on an array of times.
+
+    The segment's functions are first called with the whole array.  This
+    works for the built-in animations (easings accept arrays), but user
+    lambdas may not, so the result is checked against a scalar evaluation of
+    the first time and we fall back to a Python loop when anything is off.
+    Tuple values come back as ``(n, k)`` arrays, non-numeric values as lists.
+    """
+    if seg.const is not _VARYING and _is_numeric(seg.const):
+        out = np.empty((len(ts),) + np.shape(seg.const))
+        out[:] = seg.const
+        return out
+    first = seg(ts[0].item())
+    if not _is_numeric(first):
+        return [seg(t) for t in ts.tolist()]
+    n = len(ts)
+    try:
+        v = seg.func(ts)
+        for op in seg.ops:
+            v = op(v, ts)
+        if isinstance(first, tuple):
+            if len(v) != len(first):
+                raise ValueError('component count mismatch')
+            out = np.empty((n, len(first)))
+            for k, c in enumerate(v):
+                out[:, k] = c
+        else:
+            out = np.empty(n)
+            out[:] = v
+        if all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9) or a != a
+               for a, b in zip(out[0].tolist() if out.ndim > 1 else [out[0].item()],
+                               first if isinstance(first, tuple) else [first])):
+            return out
+    except Exception:  # scalar-only function: evaluate per time below
+        pass
+    return np.array([seg(t) for t in ts.tolist()], dtype=float)
+
+
+def _assemble(chunks, n):
+    """Scatter per-piece results back into one array in the caller's order."""
+    arrays = [c for _, c in chunks if isinstance(c, np.ndarray)]
+    if len(arrays) == len(chunks) and len({a.shape[1:] for a in arrays}) == 1:
+        out = np.empty((n,) + arrays[0].shape[1:])
+        for sel, vals in chunks:
+            out[sel] = vals
+        return out
+    out = np.empty(n, dtype=object)
+    for sel, vals in chunks:
+        for i, v in zip(sel.tolist(), vals):
+            out[i] = tuple(v.tolist()) if isinstance(v, np.ndarray) else v
+    return out
+
+
+def _as_float(v):
+    """``float(v)`` that lets NumPy arrays through (for ``at_times``)."""
+    return v + 0.0 if isinstance(v, np.ndarray) else float(v)
+
+
+def _const(value):
+    """Return a segment that always evaluates to *value*."""
+    return _Segment(lambda t, _v=value: _v, const=value, pure=True)
+
+
+_INTERNED: dict[tuple, _Timeline] = {}
+_INTERN_LIMIT = 4096
+
+
+def _typed(value):
+    """Hashable key that tells ``1``, ``1.0`` and ``True`` (and tuples of them) apart."""
+    if type(value) is tuple:
+        return value, *map(type, value)
+    return value, type(value)
+
+
+def _created(creation, value, before):
+    """Timeline that is *before* until ``creation`` and *value* from then on.
+
+    These "constant since creation" timelines are interned: attributes that
+    are never animated share one (marked ``shared``, so the first edit makes
+    a private copy).  The table is capped so unique values do not pile up.
+    """
+    key = (creation, _typed(value), _typed(before))
+    try:
+        tl = _INTERNED.get(key)
+    except TypeError:   # unhashable value
+        key = tl = None
+    if tl is None:
+        tl = _Timeline()
+        tl.segs[0] = _const(before)
+        tl.put(creation, False, None, False, _const(value))
+        tl.shared = True
+        if key is not None and len(_INTERNED) < _INTERN_LIMIT:
+            _INTERNED[key] = tl
+    return tl
+
+
+class EvalCache:
+    """Memo for ``at_time`` while frames are rendered, keyed by (attribute, time).
+
+    Use it as a context manager around the work for one frame; the canvas
+    does this when ``canvas.eval_cache`` is set (the browser viewer sets
+    one).  It pays off when values are read repeatedly within a frame
+    (updaters, ``bbox``, snap points); values live until the block ends,
+    or with ``frames > 0`` the values of that many recent times are kept
+    (least recently used dropped first), which speeds up scrubbing back and
+    forth in the browser viewer.  Any attribute edit clears the cache.
+    Functions that read plain Python state (not attributes) should not be
+    combined with ``frames > 0``.
+
+    Example: ``with cache: obj.to_svg(t)``, then ``cache.stats()``
+    """
+    __slots__ = ('frames', 'store', 'hits', 'misses', 'epoch', '_outer')
+
+    def __init__(self, frames=0):
+        self.frames = frames
+        self.store: OrderedDict[float, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.epoch = _edits
+        self._outer = None
+
+    def __enter__(self):
+        global _active_cache
+        if self.epoch != _edits:
+            self.store.clear()
+        self._outer = _active_cache
+        _active_cache = self
+        return self
+
+    def __exit__(self, *exc):
+        global _active_cache
+        _active_cache = self._outer
+        self._outer = None
+        self.epoch = _edits
+        store = self.store
+        if not self.frames:
+            store.clear()
+        while len(store) > self.frames:
+            store.popitem(last=False)
+
+    def touch(self, time):
+        """Mark *time* as most recently used."""
+        if time in self.store:
+            self.store.move_to_end(time)
+
+    def get(self, attr, time):
+        values = self.store.get(time)
+        if values is None:
+            values = self.store[time] = {}
+        value = values.get(attr, _VARYING)
+        if value is _VARYING:
+            self.misses += 1
+            value = values[attr] = attr._tl(time)
+        else:
+            self.hits += 1
+        return value
+
+    def clear(self):
+        self.store.clear()
+
+    def stats(self):
+        """Return ``{'hits', 'misses', 'hit_rate', 'times'}``."""
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'times': len(self.store)}
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
+
+
+_active_cache: EvalCache | None = None
+_edits = 0   # bumped on every attribute edit, so idle caches can tell
+
+
+def _edited():
+    """Note that some attribute changed: cached values may be stale."""
+    global _edits
+    _edits += 1
+    if _active_cache is not None:
+        _active_cache.store.clear()
+
+
+class _Attribute:
+    """Timeline plumbing shared by every time-varying attribute.
+
+    Attributes are slotted and start out on an interned timeline (see
+    ``_created``), so an attribute that is never animated costs one small
+    object.  ``_links`` is the weak set of links reading this attribute,
+    or ``()`` when there are none.
+    """
+    __slots__ = ('_tl', 'last_change', '_links')
+    _tl: _Timeline
+    last_change: float
+    _links: Any
+
+    def __getstate__(self):
+        # Copies start without dependents: existing links keep reading us
+        return {'_tl': self._tl, 'last_change': self.last_change}
+
+    def __setstate__(self, state):
+        self._links = ()
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def time_func(self):
+        """The value as a function of time.
+
+        The returned callable is a frozen view: later edits to this attribute
+        copy the timeline first, so captured references keep their old meaning.
+        Internal code that only evaluates reads ``_tl`` instead, so the next
+        edit does not have to copy.
+        """
+        return self._share()
+
+    def _share(self):
+        """Return the timeline, marked so the next edit by any holder copies it first."""
+        tl = self._tl
+        if type(tl) is _CompiledTimeline:
+            tl = tl.timeline
+        tl.shared = True
+        return tl
+
+    @time_func.setter
+    def time_func(self, func):
+        _edited()
+        self._tl = _Timeline(func)
+        if self._links:
+            self._changed()
+
+    def _link(self, source, func=None):
+        """Make this attribute read *source* (through *func*) at every time."""
+        _edited()
+        self._tl = _Timeline(_Link(source, self, func))
+        if self._links:
+            self._changed()
+
+    def _changed(self):
+        """Invalidate everything downstream of this attribute after an edit.
+
+        Walks the dependency graph: clears the memo of every link reading an
+        edited attribute and drops the compiled buffers of their targets.
+        """
+        seen = {id(self)}
+        stack = [self]
+        while stack:
+            for link in list(stack.pop()._links):
+                link.memo = None
+                target = link.target
+                if id(target) in seen:
+                    continue
+                seen.add(id(target))
+                if type(target._tl) is _CompiledTimeline:
+                    target._tl = target._tl.timeline
+                target._tl.stamp = _edits
+                stack.append(target)
+
+    def sources(self):
+        """Return the attributes this one reads through ``set_to``/``apply``.
+
+        Example: ``Real(0).apply(lambda x: x * 2).sources()`` → ``[<Real>]``
+        """
+        found = []
+        for seg in self._tl.segs:
+            func = seg.func
+            if type(func) is _Link and func.source not in found:
+                found.append(func.source)
+        return found
+
+    def dependents(self):
+        """Return the attributes that read this one through ``set_to``/``apply``."""
+        found = []
+        for link in list(self._links):
+            if link.target not in found:
+                found.append(link.target)
+        return found
+
+    def at_times(self, times):
+        """Return the values at many times at once as a NumPy array.
+
+        Scalar attributes give shape ``(n,)``, tuple-valued ones ``(n, k)``;
+        colors give their raw channel values, like ``time_func``.
+
+        Example: ``Real(0, 5).at_times([0, 1])`` → ``array([5., 5.])``
+        """
+        return self._tl.at_times(times)
+
+    def compile(self, times):
+        """Pre-sample the value at *times* (e.g. export frame times).
+
+        Later ``at_time`` calls at exactly those times read from a NumPy
+        buffer instead of running the animation functions.  Only functions of
+        time alone are sampled (animations and plain ``set_to`` links to
+        them); functions that may read other state are still called on every
+        lookup.  Editing this attribute, or one it is linked to, discards
+        the samples.
+
+        Example: ``real.compile([i / 60 for i in range(600)])``
+        """
+        tl = self._tl
+        if type(tl) is _CompiledTimeline:
+            tl = tl.timeline
+        self._tl = _CompiledTimeline(tl, times)
+        return self
+
+    def is_static(self, start, end):
+        """Return True if the value provably does not change on [start, end].
+
+        Only edits with constant values count as static, plus links made by
+        ``set_to``/``apply`` to attributes that are static; any other
+        function, even one that happens to return a constant, is treated as
+        changing.
+
+        Example: ``Real(0, 5).is_static(0, 10)`` → ``True``
+        """
+        return self._tl.static_value(start, end) is not _VARYING
+
+    def static_since(self):
+        """Return the time from which the value stays constant forever, or None.
+
+        Example: ``Real(2, 5).static_since()`` → ``2``
+        """
+        return self._tl.static_since()
+
+    def static_run(self, time):
+        """Return ``(lo, hi)`` such that the value at *time* also holds on
+        the open interval ``(lo, hi)``, or None if it is changing at *time*.
+
+        Example: ``Real(2, 5).static_run(3)`` → ``(2, inf)``
+        """
+        run = self._tl.static_run(time)
+        return None if run is None else run[:2]
+
+    def segments(self):
+        """Return the pieces of the timeline in time order, one dict each.
+
+        Keys: ``start`` and ``end`` (``-inf``/``inf`` at the ends),
+        ``start_incl`` (False when the piece begins just after ``start``),
+        ``kind`` (``'constant'``, ``'function'``, ``'link'`` for
+        ``set_to``/``apply`` or ``'held'`` for a value kept by ``stay``),
+        ``ops`` (the number of ``add``-style ops evaluated on top) and
+        ``value`` (the constant, or None).  Shadowed edits never show up:
+        they are dropped when overwritten, and equal neighbours are merged.
+
+        Example: ``Real(0, 5).segments()[1]`` →
+        ``{'start': 0, 'end': inf, 'start_incl': True, 'kind': 'constant', 'ops': 0, 'value': 5}``
+        """
+        tl = self._tl
+        starts, lexcl, segs = tl.starts, tl.lexcl, tl.segs
+        found = []
+        for i, seg in enumerate(segs):
+            func = seg.func
+            if seg.const is not _VARYING:
+                kind = 'constant'
+            elif type(func) is _Link:
+                kind = 'link'
+            elif type(func) is _Hold:
+                kind = 'held'
+            else:
+                kind = 'function'
+            found.append({'start': starts[i],
+                          'end': starts[i + 1] if i + 1 < len(starts) else math.inf,
+                          'start_incl': not lexcl[i], 'kind': kind,
+                          'ops': 0 if kind == 'constant' else len(seg.ops),
+                          'value': None if kind != 'constant' else seg.const})
+        return found
+
+    def _timeline(self):
+        """Return the timeline for editing, copying it if it was handed out.
+
+        Editing also drops any buffer made by :meth:`compile`.
+        """
+        _edited()
+        if self._links:
+            self._changed()
+        tl = self._tl
+        if type(tl) is _CompiledTimeline:
+            tl = self._tl = tl.timeline
+        if tl.shared:
+            tl = self._tl = tl.copy()
+        tl.stamp = _edits
+        return tl
+
+    def _edit(self, start, end, lincl, rincl, stay, func=None, op=None,
+              folds=False, pure=False):
+        """Splice a function or constant (``func``) or a stacked op (``op``) in.
+
+        Matches the semantics of :func:`_wrap`: the edit applies on
+        ``[start, end]`` (or from ``start`` onward when ``end`` is None), and
+        with ``stay`` the value at ``end`` is held afterwards.  Pass ``pure``
+        when the function only depends on ``t``, so a held value can be
+        folded into a constant.
+        """
+        tl = self._timeline()
+        if op is None:
+            seg = _Segment(func, pure=pure) if callable(func) else _const(func)
+            tl.put(start, not lincl, end, rincl, seg)
+        else:
+            tl.stack(start, not lincl, end, rincl, op, folds, pure)
+        if stay and end is not None:
+            held = tl.segs[tl.index(end)]
+            if held.const is not _VARYING:
+                seg = _const(held.const)
+            elif held.pure:
+                seg = _const(held(end))
+            else:
+                seg = _Segment(_Hold(held, end))
+            if end >= start:
+                tl.put(end, True, None, False, seg)
+            else:
+                tl.put(start, not lincl, None, False, seg)
+
+
+class Real(_Attribute):
     """Real-valued time-varying attribute.
 
     Example: ``Real(0, 5).at_time(0)`` → ``5``
     """
-    time_func: Any
+    __slots__ = ()
 
     def __init__(self, creation, start_val: float = 0):
+        self._links = ()
         if isinstance(start_val, Real):
             self.set_to(start_val)
         else:
-            self.time_func = lambda t, _c=creation, _v=start_val: _v if t >= _c else 0
+            self._tl = _created(creation, start_val, 0)
             self.last_change = creation
 
     def set(self, start, end, func_inner, lincl=True, rincl=True, stay=False):
@@ -51,8 +939,7 @@ class Real:
 
         Example: ``real.set(0, 1, lambda t: t * 10)``
         """
-        inner = func_inner if callable(func_inner) else lambda t: func_inner
-        self.time_func = _wrap(self.time_func, inner, start, end, lincl, rincl, stay)
+        self._edit(start, end, lincl, rincl, stay, func=func_inner)
         self.last_change = max(self.last_change, end)
 
     def add(self, start, end, func_inner, lincl=True, rincl=True, stay=False):
@@ -60,9 +947,8 @@ class Real:
 
         Example: ``real.add(0, 1, lambda t: t * 2)``
         """
-        outer = self.time_func
-        self.time_func = _wrap(outer, lambda t: float(outer(t)) + func_inner(t),
-                               start, end, lincl, rincl, stay)
+        self._edit(start, end, lincl, rincl, stay,
+                   op=lambda v, t: _as_float(v) + func_inner(t))
         self.last_change = max(self.last_change, end)
 
     def set_onward(self, start, value, lincl=True):
@@ -70,8 +956,7 @@ class Real:
 
         Example: ``real.set_onward(1, 10)``
         """
-        inner = value if callable(value) else lambda t: value
-        self.time_func = _wrap(self.time_func, inner, start, lincl=lincl)
+        self._edit(start, None, lincl, True, False, func=value)
         self.last_change = max(self.last_change, start)
 
     def add_onward(self, start, func, lincl=True, last_change=None):
@@ -79,12 +964,12 @@ class Real:
 
         Example: ``real.add_onward(1, 3)``
         """
-        outer = self.time_func
         if callable(func):
-            inner = lambda t: float(outer(t)) + func(t)  # type: ignore[operator]
+            self._edit(start, None, lincl, True, False,
+                       op=lambda v, t: _as_float(v) + func(t))  # type: ignore[operator]
         else:
-            inner = lambda t: float(outer(t)) + func
-        self.time_func = _wrap(outer, inner, start, lincl=lincl)
+            self._edit(start, None, lincl, True, False,
+                       op=lambda v, t: _as_float(v) + func, folds=True)
         self.last_change = max(self.last_change, start)
         if last_change is not None:
             self.last_change = max(self.last_change, last_change)
@@ -94,11 +979,7 @@ class Real:
 
         Example: ``real.set_at(1, 99)``
         """
-        func_otherwise = self.time_func
-        def new_func(t):
-            if abs(t - time) < eps: return value
-            return func_otherwise(t)
-        self.time_func = new_func
+        self._edit(time - eps, time + eps, False, False, False, func=value)
         self.last_change = max(self.last_change, time)
 
     def add_at(self, time, value):
@@ -106,12 +987,8 @@ class Real:
 
         Example: ``real.add_at(1, 3)``
         """
-        old = float(self.time_func(time))
-        func_otherwise = self.time_func
-        def new_func(t):
-            if t == time: return old + value
-            return func_otherwise(t)
-        self.time_func = new_func
+        new = float(self._tl(time)) + value
+        self._edit(time, time, True, True, False, func=new)
         self.last_change = max(self.last_change, time)
 
     def at_time(self, time):
@@ -119,7 +996,10 @@ class Real:
 
         Example: ``Real(0, 5).at_time(0)`` → ``5``
         """
-        return self.time_func(time)
+        cache = _active_cache
+        if cache is None:
+            return self._tl(time)
+        return cache.get(self, time)
 
     def __repr__(self):
         return f'Real(val={self.at_time(self.last_change):g})'
@@ -129,7 +1009,7 @@ class Real:
 
         Example: ``real_b.set_to(real_a)``
         """
-        self.time_func = lambda t: other.time_func(t)
+        self._link(other)
         self.last_change = other.last_change
 
     def move_to(self, start, end, end_val, stay=True, easing=easings.smooth):
@@ -137,13 +1017,14 @@ class Real:
 
         Example: ``real.move_to(0, 1, 10)``
         """
-        start_val = self.time_func(start)
+        start_val = self._tl(start)
         diff = start_val - end_val
         dur = end - start
         if dur <= 0:
             self.set_onward(start, end_val)
         else:
-            self.set(start, end, lambda t, _s=start, _d=dur: diff * (1-easing((t-_s)/_d)) + end_val, stay=stay)
+            self._edit(start, end, True, True, stay,
+                       func=lambda t, _s=start, _d=dur: diff * (1-easing((t-_s)/_d)) + end_val, pure=True)
         self.last_change = max(self.last_change, end)
         return self
 
@@ -153,7 +1034,7 @@ class Real:
         Example: ``real.apply(lambda x: x * 2)``
         """
         new = Real(0)
-        new.time_func = lambda t: func(self.at_time(t))
+        new._link(self, func)
         new.last_change = self.last_change
         return new
 
@@ -164,8 +1045,8 @@ class Real:
         """
         if self.__class__ != Real or other.__class__ != Real:
             raise TypeError('interpolate requires both values to be Real instances')
-        start_val = self.time_func(start)
-        end_val = other.time_func(end)
+        start_val = self._tl(start)
+        end_val = other._tl(end)
         d = max(end - start, 1e-9)
         new = Real(0)
         new.time_func = lambda t, _s=start, _d=d, _sv=start_val, _ev=end_val: _sv + (_ev - _sv) * easing((t - _s) / _d)
@@ -178,16 +1059,22 @@ class Tup(Real):
 
     Example: ``Tup(0, (0, 100, 200)).at_time(0)`` → ``(0, 100, 200)``
     """
+    __slots__ = ()
+
     def __init__(self, creation, start_val: tuple = ()):
+        self._links = ()
         if isinstance(start_val, Tup):
             self.set_to(start_val)
         else:
             zero = tuple(0 for _ in start_val)
-            self.time_func = lambda t, _c=creation, _v=start_val, _z=zero: _v if t >= _c else _z
+            self._tl = _created(creation, start_val, zero)
             self.last_change = creation
 
     def at_time(self, time) -> tuple:
-        return self.time_func(time)
+        cache = _active_cache
+        if cache is None:
+            return self._tl(time)
+        return cache.get(self, time)
 
     def __repr__(self):
         return f'Tup(val={self.at_time(self.last_change)})'
@@ -197,10 +1084,9 @@ class Tup(Real):
 
         Example: ``tup.add(0, 1, (1, 2, 3))``
         """
-        outer = self.time_func
-        self.time_func = _wrap(outer,
-            lambda t, _fi=func_inner: tuple(float(i) + _fi[idx] for idx, i in enumerate(outer(t))),
-            start, end, lincl, rincl, stay)
+        self._edit(start, end, lincl, rincl, stay,
+                   op=lambda v, t, _fi=func_inner: tuple(_as_float(i) + _fi[idx] for idx, i in enumerate(v)),
+                   folds=True)
         self.last_change = max(self.last_change, end)
 
     def interpolate(self, other, start, end, easing=easings.linear):
@@ -210,8 +1096,8 @@ class Tup(Real):
         """
         if self.__class__ != Tup or other.__class__ != Tup:
             raise TypeError('interpolate requires both values to be Tup instances')
-        start_val = self.time_func(start)
-        end_val = other.time_func(end)
+        start_val = self._tl(start)
+        end_val = other._tl(end)
         d = max(end - start, 1e-9)
         new = Tup(0, ())
         new.time_func = lambda t, _s=start, _d=d, _sv=start_val, _ev=end_val: tuple(
@@ -225,12 +1111,18 @@ class Coor(Real):
 
     Example: ``Coor(0, (100, 200)).at_time(0)`` → ``(100, 200)``
     """
+    __slots__ = ()
+
     def __init__(self, creation, start_val: tuple[float, float] = (0, 0)):
-        self.time_func = lambda t, _c=creation, _v=start_val: _v if t >= _c else (0, 0)
+        self._links = ()
+        self._tl = _created(creation, start_val, (0, 0))
         self.last_change = creation
 
     def at_time(self, time) -> tuple[float, float]:
-        return self.time_func(time)
+        cache = _active_cache
+        if cache is None:
+            return self._tl(time)
+        return cache.get(self, time)
 
     def __repr__(self):
         x, y = self.at_time(self.last_change)
@@ -241,16 +1133,14 @@ class Coor(Real):
 
         Example: ``coor.add_onward(1, (10, -20))``
         """
-        outer = self.time_func
         if callable(func):
-            def _inner(t, _o=outer, _f=func):
-                o = _o(t); f = _f(t)
+            def _op(o, t, _f=func):
+                f = _f(t)
                 return (o[0] + f[0], o[1] + f[1])  # type: ignore[index]
         else:
-            def _inner(t, _o=outer, _fx=func[0], _fy=func[1]):  # type: ignore[index]
-                o = _o(t)
+            def _op(o, t, _fx=func[0], _fy=func[1]):  # type: ignore[index]
                 return (o[0] + _fx, o[1] + _fy)
-        self.time_func = _wrap(outer, _inner, start, lincl=lincl)
+        self._edit(start, None, lincl, True, False, op=_op, folds=not callable(func))
         self.last_change = max(self.last_change, start)
         if last_change is not None:
             self.last_change = max(self.last_change, last_change)
@@ -260,20 +1150,18 @@ class Coor(Real):
 
         Example: ``coor.rotate_around(0, 1, (0, 0), 90)``
         """
-        old_func = self.time_func
         sign = -1 if clockwise else 1
         dur = end - start
         if dur <= 0:
             return self
-        def f(t):
-            now = old_func(t)
+        def _op(now, t):
             pp: tuple = pivot_point(t) if callable(pivot_point) else pivot_point  # type: ignore[assignment]
             dx, dy = now[0] - pp[0], now[1] - pp[1]
             r = math.hypot(dx, dy)
             base_angle = math.atan2(dy, dx)
             phi = base_angle + sign * math.radians(degrees * (t - start) / dur)
             return (pp[0] + r * math.cos(phi), pp[1] + r * math.sin(phi))
-        self.set(start, end, f, stay=stay)
+        self._edit(start, end, True, True, stay, op=_op, pure=not callable(pivot_point))
         self.last_change = end
         return self
 
@@ -282,7 +1170,7 @@ class Coor(Real):
 
         Example: ``coor.move_to(0, 1, (100, 200))``
         """
-        start_pos = self.time_func(start)
+        start_pos = self._tl(start)
         dx, dy = start_pos[0]-end_val[0], start_pos[1]-end_val[1]
         dur = end - start
         if dur <= 0:
@@ -291,7 +1179,7 @@ class Coor(Real):
             def _interp(t, _s=start, _d=dur, _dx=dx, _dy=dy, _ex=end_val[0], _ey=end_val[1]):
                 p = 1 - easing((t - _s) / _d)
                 return (_dx * p + _ex, _dy * p + _ey)
-            self.set(start, end, _interp, stay=stay)
+            self._edit(start, end, True, True, stay, func=_interp, pure=True)
         self.last_change = max(self.last_change, end)
         return self
 
@@ -300,11 +1188,10 @@ class Coor(Real):
 
         Example: ``coor.add(0, 1, lambda t: (t * 10, t * 20))``
         """
-        outer = self.time_func
-        def _add(t, _o=outer, _fi=func_inner):
-            o = _o(t); f = _fi(t)
-            return (float(o[0]) + f[0], float(o[1]) + f[1])
-        self.time_func = _wrap(outer, _add, start, end, lincl, rincl, stay)
+        def _add(o, t, _fi=func_inner):
+            f = _fi(t)
+            return (_as_float(o[0]) + f[0], _as_float(o[1]) + f[1])
+        self._edit(start, end, lincl, rincl, stay, op=_add)
         self.last_change = max(self.last_change, end)
 
     def along_path(self, start, end, path_d, easing=easings.smooth, stay=True):
@@ -322,7 +1209,7 @@ class Coor(Real):
             progress = max(0, min(1, easing((t - _s) / _d)))
             point = parsed.point(parsed.ilength(progress * total_length))  # type: ignore[operator]
             return (point.real, point.imag)
-        self.set(start, end, position_at, stay=stay)
+        self._edit(start, end, True, True, stay, func=position_at, pure=True)
         self.last_change = max(self.last_change, end)
         return self
 
@@ -332,23 +1219,114 @@ class String(Real):
 
     Example: ``String(0, 'nonzero').at_time(0)`` → ``'nonzero'``
     """
+    __slots__ = ()
+
     def __init__(self, creation, start_val: str = ''):
+        self._links = ()
         if isinstance(start_val, String):
             self.set_to(start_val)
         else:
-            self.time_func = lambda t, _c=creation, _v=start_val: _v if t >= _c else ''
+            self._tl = _created(creation, start_val, '')
             self.last_change = creation
 
     def __repr__(self):
         return f'String({self.at_time(self.last_change)!r})'
 
 
-class Color:
+class _Blend:
+    """``time_func`` of an interpolated Color: ``mix(easing(progress))``.
+
+    A slotted callable rather than a closure, since big collections create
+    one per object (see ``colors._color_mixer`` for *mix*).
+    """
+    __slots__ = ('mix', 'start', 'dur', 'easing')
+
+    def __init__(self, mix, start, dur, easing):
+        self.mix = mix
+        self.start = start
+        self.dur = dur
+        self.easing = easing
+
+    def __call__(self, t):
+        return self.mix(self.easing((t - self.start) / self.dur))
+
+
+class _Lerp:
+    """Linear blends of many rows at once: ``start + (end - start) * easing(progress)``.
+
+    *lo* and *hi* hold the start and end value of each row (numbers or
+    equal-length tuples).  All rows share one easing call and, for float
+    progress, one array operation per time, which :class:`_LerpRow` (the
+    ``time_func`` of each interpolated attribute) reads from.  Other
+    progress values (easings may return an exact ``0`` or ``1``) are
+    blended in Python, so the results keep the types a per-object
+    interpolation would give.
+    """
+    __slots__ = ('lo', 'hi', 'base', 'delta', 'start', 'dur', 'easing', 't', 'rows')
+
+    def __init__(self, lo, hi, start, dur, easing):
+        self.lo = lo
+        self.hi = hi
+        self.base = np.array(lo, dtype=float)
+        self.delta = np.array(hi, dtype=float) - self.base
+        self.start = start
+        self.dur = dur
+        self.easing = easing
+        self.t = None
+        self.rows = None
+
+    def at(self, t):
+        if t != self.t:
+            p = self.easing((t - self.start) / self.dur)
+            if not isinstance(p, float):
+                rows = [_lerp(a, b, p) for a, b in zip(self.lo, self.hi)]
+            elif self.base.ndim > 1:
+                rows = list(map(tuple, (self.base + self.delta * p).tolist()))
+            else:
+                rows = (self.base + self.delta * p).tolist()
+            self.rows = rows
+            self.t = t
+        return self.rows
+
+
+def _lerp(a, b, p):
+    if type(a) is tuple:
+        return tuple(x + (y - x) * p for x, y in zip(a, b))
+    return a + (b - a) * p
+
+
+class _LerpRow:
+    """``time_func`` of one row of a :class:`_Lerp`."""
+    __slots__ = ('lerp', 'i')
+
+    def __init__(self, lerp, i):
+        self.lerp = lerp
+        self.i = i
+
+    def __call__(self, t):
+        lerp = self.lerp
+        if isinstance(t, np.ndarray):
+            p = lerp.easing((t - lerp.start) / lerp.dur)
+            if lerp.base.ndim > 1:
+                return tuple(b + d * p for b, d in zip(lerp.base[self.i].tolist(),
+                                                       lerp.delta[self.i].tolist()))
+            return lerp.base[self.i].item() + lerp.delta[self.i].item() * p
+        return lerp.at(t)[self.i]
+
+
+_COLOR_STRINGS: dict[str, dict] = {'rgb': {}, 'rgba': {}}   # channel values -> SVG text
+_COLOR_STRINGS_LIMIT = 65536
+
+
+class Color(_Attribute):
     """Time-varying color attribute. Accepts hex, named colors, RGB/RGBA tuples, or gradients.
 
     Example: ``Color(0, '#ff0000').at_time(0)`` → ``'rgb(255,0,0)'``
     """
+    __slots__ = ('use',)
+
     def __init__(self, creation: float = 0, start_color: 'str | tuple' = '#000', use=None):
+        self._links = ()
         if not isinstance(creation, (int, float)):
             raise TypeError(f"creation must be a number, got {type(creation).__name__}")
         if isinstance(start_color, Color):
@@ -356,27 +1334,32 @@ class Color:
         elif use is not None:
             # Caller will set time_func manually (used by interpolate, apply, etc.)
             self.use = use
-            self.time_func = lambda t: (0, 0, 0)
+            self._tl = _created(-math.inf, (0, 0, 0), (0, 0, 0))
         else:
             self.use, col = self.parse(start_color)
             if self.use in ('rgb', 'rgba'):
-                self.time_func = lambda t, _c=creation, _v=col, _z=(0,) * len(col): _v if t >= _c else _z
+                self._tl = _created(creation, col, (0,) * len(col))
             elif self.use == 'url':
-                self.time_func = lambda t: col
+                self._tl = _created(-math.inf, col, col)
             else:
                 raise NotImplementedError(f'Color type {self.use!r} not supported')
         self.last_change = creation
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['use'] = self.use
+        return state
+
     def set(self, start, end, func_inner, lincl=True, rincl=True, stay=False):
         """Override the color with a custom function returning ``(r, g, b)`` on [start, end].
 
         Example: ``color.set(0, 1, lambda t: (255, int(t*255), 0))``
         """
-        self.time_func = _wrap(self.time_func, func_inner, start, end, lincl, rincl, stay)
+        self._edit(start, end, lincl, rincl, stay, func=func_inner)
         self.last_change = max(self.last_change, end)
 
     def __repr__(self):
-        val = self.time_func(self.last_change)
+        val = self._tl(self.last_change)
         if isinstance(val, str):
             return f'Color({val!r})'
         if isinstance(val, tuple) and len(val) >= 3:
@@ -391,7 +1374,7 @@ class Color:
         if not isinstance(other, Color):
             raise TypeError(f'other must be a Color instance, got {type(other).__name__}')
         self.use = other.use
-        self.time_func = lambda t: other.time_func(t)
+        self._link(other)
         self.last_change = other.last_change
 
     def parse(self, color):
@@ -431,17 +1414,40 @@ class Color:
 
         Example: ``Color(0, '#ff0000').at_time(0)`` → ``'rgb(255,0,0)'``
         """
-        if self.use in ('rgb', 'rgba'):
-            vals = ','.join(str(rounding_func(v)) for v in self.time_func(time))
-            return f'{self.use}({vals})'
-        elif self.use == 'url':
-            return self.time_func(time)
+        use = self.use
+        if use in ('rgb', 'rgba'):
+            vals = self._tl(time)
+            if rounding_func is round:
+                cache = _COLOR_STRINGS[use]
+                try:
+                    return cache[vals]
+                except KeyError:
+                    text = f"{use}({','.join(str(round(v)) for v in vals)})"
+                    if len(cache) >= _COLOR_STRINGS_LIMIT:
+                        cache.clear()
+                    cache[vals] = text
+                    return text
+                except TypeError:  # unhashable values, e.g. a list from a user function
+                    pass
+            return f"{use}({','.join(str(rounding_func(v)) for v in vals)})"
+        elif use == 'url':
+            return self._tl(time)
         else:
-            raise NotImplementedError(f'Color type {self.use!r} not supported')
+            raise NotImplementedError(f'Color type {use!r} not supported')
+
+    def _blend(self, mix, start, end, easing, use='rgb'):
+        """Return a new Color that is ``mix(easing(progress))`` on [start, end]."""
+        new = Color(use=use)
+        new.time_func = _Blend(mix, start, max(end - start, 1e-9), easing)
+        new.last_change = end
+        return new
 
     def interpolate(self, other, start, end, easing=easings.linear, color_space='rgb'):
         """Create a new Color that interpolates between self and other.
 
+        *color_space* is ``'rgb'``, ``'hsl'`` (see :meth:`interpolate_hsl`)
+        or ``'oklab'`` (perceptually even steps in lightness and hue).
+
         Example: ``Color(0, '#f00').interpolate(Color(0, '#00f'), 0, 1)``
         """
         if self.__class__ != Color or other.__class__ != Color:
@@ -449,14 +1455,9 @@ class Color:
         if color_space == 'hsl':
             return self.interpolate_hsl(other, start, end, easing=easing)
         if self.use == other.use == 'rgb':
-            start_val = self.time_func(start)
-            end_val = other.time_func(end)
-            d = max(end - start, 1e-9)
-            new = Color(use='rgb')
-            new.time_func = lambda t, _s=start, _d=d, _sv=start_val, _ev=end_val: tuple(
-                sv + (ev - sv) * easing((t - _s) / _d) for sv, ev in zip(_sv, _ev))
-            new.last_change = end
-            return new
+            space = 'oklab' if color_space == 'oklab' else 'rgb'
+            return self._blend(colors._color_mixer(self._tl(start), other._tl(end), space),
+                               start, end, easing)
         else:
             raise NotImplementedError('Only rgb colors can be transformed yet.')
 
@@ -467,23 +1468,8 @@ class Color:
         """
         if self.__class__ != Color or other.__class__ != Color:
             raise TypeError('interpolate_hsl requires both values to be Color instances')
-
-        h1, s1, l1 = _rgb_to_hsl(*self.time_func(start)[:3])
-        h2, s2, l2 = _rgb_to_hsl(*other.time_func(end)[:3])
-
-        dh = h2 - h1
-        if dh > 0.5: dh -= 1.0
-        elif dh < -0.5: dh += 1.0
-
-        new = Color(use='rgb')
-        _d = max(end - start, 1e-9)
-        _dh, _ds, _dl = dh, s2 - s1, l2 - l1
-        def _interp(t, _s=start, _d=_d, _h1=h1, _s1=s1, _l1=l1, _ddh=_dh, _dds=_ds, _ddl=_dl):
-            p = easing((t - _s) / _d)
-            return _hsl_to_rgb((_h1 + _ddh * p) % 1.0, _s1 + _dds * p, _l1 + _ddl * p)
-        new.time_func = _interp
-        new.last_change = end
-        return new
+        return self._blend(colors._color_mixer(self._tl(start), other._tl(end), 'hsl'),
+                           start, end, easing)
 
     def apply(self, func):
         """Return a new Color where ``result.time_func(t) = func(self.time_func(t))``.
@@ -491,7 +1477,7 @@ class Color:
         Example: ``color.apply(lambda rgb: (255 - rgb[0], 255 - rgb[1], 255 - rgb[2]))``
         """
         new = Color(use=self.use)
-        new.time_func = lambda t: func(self.time_func(t))
+        new._link(self, func)
         new.last_change = self.last_change
         return new
 
@@ -500,12 +1486,67 @@ class Color:
 
         Example: ``color.set_onward(1, '#00ff00')``
         """
-        if callable(value):
-            inner = value
-        else:
-            use, color = self.parse(value)
+        if not callable(value):
+            use, value = self.parse(value)
             if use != self.use:
                 raise ValueError(f'Color type mismatch: {use} vs {self.use}')
-            inner = lambda t: color
-        self.time_func = _wrap(self.time_func, inner, start, lincl=lincl)
+        self._edit(start, None, lincl, True, False, func=value)
+        self.last_change = max(self.last_change, start)
+
+
+class Columns:
+    """Time-varying values of many objects at once, stored column-wise.
+
+    Instead of one timeline per object, every edit keeps its start and target
+    values for all affected rows as NumPy arrays, so evaluating all objects
+    at a time is a few array operations.  Values have shape ``(n,)`` or
+    ``(n, k)``.  Edits follow the rules of ``Real``: each one takes over from
+    its start time onward and later edits win.  *index* (an int, slice, mask
+    or index array) selects the rows an edit touches; default is all rows.
+
+    Example: ``Columns(0, [1, 2, 3]).at_time(0)`` → ``array([1., 2., 3.])``
+    """
+    __slots__ = ('base', 'edits', 'last_change')
+
+    def __init__(self, creation, values):
+        self.base = np.array(values, dtype=float)
+        self.edits: list[tuple] = []
+        self.last_change = creation
+
+    def __len__(self):
+        return len(self.base)
+
+    def at_time(self, time):
+        """Return the values of all rows at *time* (a fresh array)."""
+        out = self.base.copy()
+        for start, dur, index, v0, v1, easing in self.edits:
+            if time < start:
+                continue
+            if dur is None or time >= start + dur:
+                out[index] = v1
+            else:
+                out[index] = v0 + (v1 - v0) * easing((time - start) / dur)
+        return out
+
+    def set_onward(self, start, values, index=slice(None)):
+        """Set the selected rows to *values* from ``start`` onward.
+
+        Example: ``cols.set_onward(1, 0, index=[0, 2])``
+        """
+        target = np.broadcast_to(np.asarray(values, dtype=float), self.base[index].shape).copy()
+        self.edits.append((start, None, index, target, target, None))
         self.last_change = max(self.last_change, start)
+        return self
+
+    def move_to(self, start, end, values, easing=easings.smooth, index=slice(None)):
+        """Animate the selected rows from their current values to *values*.
+
+        Example: ``cols.move_to(0, 1, [10, 20, 30])``
+        """
+        if end <= start:
+            return self.set_onward(start, values, index)
+        v0 = self.at_time(start)[index]
+        v1 = np.broadcast_to(np.asarray(values, dtype=float), v0.shape).copy()
+        self.edits.append((start, end - start, index, v0, v1, easing))
+        self.last_change = max(self.last_change, end)
+        return self
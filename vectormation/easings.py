@@ -29,6 +29,8 @@ from collections.abc import Callable
 from functools import wraps
 from math import cos, exp, pi, sin, sqrt
 
+import numpy as np
+
 
 def _clamp01(t):
     """Clamp *t* to [0, 1]."""
@@ -37,9 +39,27 @@ def _clamp01(t):
 _BACK_C1 = 1.70158  # Penner back-ease overshoot constant
 
 
+def _array_form(wrapper, function):
+    """Return the NumPy version of an easing, or an element-wise stand-in.
+
+    NumPy versions are registered with :func:`_vectorizes` and are only ever
+    called with values already clipped to [0, 1].
+    """
+    array_func = getattr(wrapper, 'array', None)
+    if array_func is not None:
+        return array_func
+    def elementwise(t, *args, **kwargs):
+        vals = [function(x, *args, **kwargs) for x in t.ravel().tolist()]
+        return np.array(vals, dtype=float).reshape(t.shape)
+    return elementwise
+
+
 def unit_interval(function):
     @wraps(function)
     def wrapper(t, *args, **kwargs):
+        if isinstance(t, np.ndarray):
+            inside = _array_form(wrapper, function)(np.clip(t, 0, 1), *args, **kwargs)
+            return np.where(t < 0, 0.0, np.where(t > 1, 1.0, inside))
         if 0 <= t <= 1:
             return function(t, *args, **kwargs)
         return 0 if t < 0 else 1
@@ -49,12 +69,23 @@ def unit_interval(function):
 def zero(function):
     @wraps(function)
     def wrapper(t, *args, **kwargs):
+        if isinstance(t, np.ndarray):
+            inside = _array_form(wrapper, function)(np.clip(t, 0, 1), *args, **kwargs)
+            return np.where((t < 0) | (t > 1), 0.0, inside)
         if 0 <= t <= 1:
             return function(t, *args, **kwargs)
         return 0
     return wrapper
 
 
+def _vectorizes(easing):
+    """Register the decorated function as the NumPy version of *easing*."""
+    def register(array_func):
+        easing.array = array_func
+        return array_func
+    return register
+
+
 def sigmoid(x: float) -> float:
     return 1.0 / (1 + exp(-x))
 
@@ -163,6 +194,9 @@ def _make_power_easings(n):
     @unit_interval
     def ease_in_out(t):
         return (2 ** (n - 1)) * t ** n if t < 0.5 else 1 - (-2 * t + 2) ** n / 2
+    ease_in.array = ease_in.__wrapped__
+    ease_out.array = ease_out.__wrapped__
+    ease_in_out.array = lambda t: np.where(t < 0.5, (2 ** (n - 1)) * t ** n, 1 - (-2 * t + 2) ** n / 2)
     return ease_in, ease_out, ease_in_out
 
 for _name, _n in [('quad', 2), ('cubic', 3), ('quart', 4), ('quint', 5)]:
@@ -422,3 +456,146 @@ def blend(easing_a, easing_b, weight: float = 0.5):
     def _blended(t):
         return (1 - weight) * easing_a(t) + weight * easing_b(t)
     return _blended
+
+
+# ── NumPy forms ──
+# Used when an easing is called with an array (e.g. by ``Real.at_times``).
+# Inputs are already clipped to [0, 1] by the decorators.
+
+@_vectorizes(linear)
+def _linear_array(t):
+    return t
+
+@_vectorizes(smooth)
+def _smooth_array(t, inflection: float = 10.0):
+    error = sigmoid(-inflection / 2)
+    return np.clip((1.0 / (1 + np.exp(-inflection * (t - 0.5))) - error) / (1 - 2 * error), 0, 1)
+
+@_vectorizes(rush_into)
+def _rush_into_array(t, inflection: float = 10.0):
+    return 2 * smooth(t / 2.0, inflection)
+
+@_vectorizes(rush_from)
+def _rush_from_array(t, inflection: float = 10.0):
+    return 2 * smooth(t / 2.0 + 0.5, inflection) - 1
+
+@_vectorizes(slow_into)
+def _slow_into_array(t):
+    return np.sqrt(1 - (1 - t) * (1 - t))
+
+@_vectorizes(double_smooth)
+def _double_smooth_array(t):
+    return np.where(t < 0.5, 0.5 * smooth(2 * t), 0.5 * (1 + smooth(2 * t - 1)))
+
+@_vectorizes(there_and_back)
+def _there_and_back_array(t, inflection: float = 10.0):
+    return smooth(np.where(t < 0.5, 2 * t, 2 * (1 - t)), inflection)
+
+@_vectorizes(there_and_back_with_pause)
+def _there_and_back_with_pause_array(t, pause_ratio: float = 1.0 / 3):
+    a = 1.0 / pause_ratio
+    return np.where(t < 0.5 - pause_ratio / 2, smooth(a * t),
+                    np.where(t < 0.5 + pause_ratio / 2, 1.0, smooth(a - a * t)))
+
+@_vectorizes(wiggle)
+def _wiggle_array(t, wiggles: float = 2):
+    return there_and_back(t) * np.sin(wiggles * pi * t)
+
+@_vectorizes(lingering)
+def _lingering_array(t):
+    return np.minimum(t / 0.8, 1.0)
+
+@_vectorizes(exponential_decay)
+def _exponential_decay_array(t, half_life: float = 0.1):
+    return 1 - np.exp(-t / half_life)
+
+@_vectorizes(ease_in_sine)
+def _ease_in_sine_array(t):
+    return 1 - np.cos((t * pi) / 2)
+
+@_vectorizes(ease_out_sine)
+def _ease_out_sine_array(t):
+    return np.sin((t * pi) / 2)
+
+@_vectorizes(ease_in_out_sine)
+def _ease_in_out_sine_array(t):
+    return -(np.cos(pi * t) - 1) / 2
+
+@_vectorizes(ease_in_expo)
+def _ease_in_expo_array(t):
+    return np.where(t == 0, 0.0, 2.0 ** (10 * t - 10))
+
+@_vectorizes(ease_out_expo)
+def _ease_out_expo_array(t):
+    return np.where(t == 1, 1.0, 1 - 2.0 ** (-10 * t))
+
+@_vectorizes(ease_in_out_expo)
+def _ease_in_out_expo_array(t):
+    mid = np.where(t < 0.5, 2.0 ** (20 * t - 10) / 2, (2 - 2.0 ** (-20 * t + 10)) / 2)
+    return np.where(t == 0, 0.0, np.where(t == 1, 1.0, mid))
+
+@_vectorizes(ease_in_circ)
+def _ease_in_circ_array(t):
+    return 1 - np.sqrt(1 - t * t)
+
+@_vectorizes(ease_out_circ)
+def _ease_out_circ_array(t):
+    return np.sqrt(1 - (t - 1) ** 2)
+
+@_vectorizes(ease_in_out_circ)
+def _ease_in_out_circ_array(t):
+    lo = (1 - np.sqrt(np.maximum(0, 1 - (2 * t) ** 2))) / 2
+    hi = (np.sqrt(np.maximum(0, 1 - (-2 * t + 2) ** 2)) + 1) / 2
+    return np.where(t < 0.5, lo, hi)
+
+ease_in_back.array = ease_in_back.__wrapped__
+ease_out_back.array = ease_out_back.__wrapped__
+
+@_vectorizes(ease_in_out_back)
+def _ease_in_out_back_array(t):
+    c2 = _BACK_C1 * 1.525
+    return np.where(t < 0.5,
+                    ((2 * t) ** 2 * ((c2 + 1) * 2 * t - c2)) / 2,
+                    ((2 * t - 2) ** 2 * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2)
+
+@_vectorizes(ease_in_elastic)
+def _ease_in_elastic_array(t):
+    mid = -(2.0 ** (10 * t - 10)) * np.sin((t * 10 - 10.75) * _ELASTIC_C4)
+    return np.where(t == 0, 0.0, np.where(t == 1, 1.0, mid))
+
+@_vectorizes(ease_out_elastic)
+def _ease_out_elastic_array(t):
+    mid = 2.0 ** (-10 * t) * np.sin((t * 10 - 0.75) * _ELASTIC_C4) + 1
+    return np.where(t == 0, 0.0, np.where(t == 1, 1.0, mid))
+
+@_vectorizes(ease_in_out_elastic)
+def _ease_in_out_elastic_array(t):
+    s = np.sin((20 * t - 11.125) * _ELASTIC_C5)
+    mid = np.where(t < 0.5, -(2.0 ** (20 * t - 10) * s) / 2, (2.0 ** (-20 * t + 10) * s) / 2 + 1)
+    return np.where(t == 0, 0.0, np.where(t == 1, 1.0, mid))
+
+@_vectorizes(ease_out_bounce)
+def _ease_out_bounce_array(t):
+    n1, d1 = _BOUNCE_N, _BOUNCE_D
+    return np.select(
+        [t < 1 / d1, t < 2 / d1, t < 2.5 / d1],
+        [n1 * t * t,
+         n1 * (t - 1.5 / d1) * (t - 1.5 / d1) + 0.75,
+         n1 * (t - 2.25 / d1) * (t - 2.25 / d1) + 0.9375],
+        n1 * (t - 2.625 / d1) * (t - 2.625 / d1) + 0.984375)
+
+@_vectorizes(ease_in_bounce)
+def _ease_in_bounce_array(t):
+    return 1 - ease_out_bounce(1 - t)
+
+@_vectorizes(ease_in_out_bounce)
+def _ease_in_out_bounce_array(t):
+    return np.where(t < 0.5, (1 - ease_out_bounce(1 - 2 * t)) / 2, (1 + ease_out_bounce(2 * t - 1)) / 2)
+
+@_vectorizes(running_start)
+def _running_start_array(t, pull_factor: float = -0.5):
+    return _bezier_y(0, pull_factor, 1, t)
+
+smoothstep.array = smoothstep.__wrapped__
+smootherstep.array = smootherstep.__wrapped__
+smoothererstep.array = smoothererstep.__wrapped__
@@ -72,6 +72,13 @@ class QuadraticBezier(svgpathtools.QuadraticBezier):
             end=self.end
         )
 
+def _affine_point(z, m):
+    """Map the complex point *z* through the SVG matrix *m*."""
+    a, b, c, d, e, f = m
+    x, y = z.real, z.imag
+    return complex(a * x + c * y + e, b * x + d * y + f)
+
+
 class Path(svgpathtools.Path):
     def adjusted_bbox(self, *transforms):
         """Adjust the bbox of this path to the transforms given in svg-format as strings"""
@@ -79,6 +86,30 @@ class Path(svgpathtools.Path):
             return self.bbox()
         return self.adjusted_path(*transforms).bbox()
 
+    def transformed_bbox(self, matrix):
+        """Bbox of this path mapped through an SVG matrix ``(a, b, c, d, e, f)``.
+
+        *matrix* is what ``Styling.transform_matrix`` returns (None for the
+        identity), so no transform string has to be parsed.
+        """
+        if matrix is None:
+            return self.bbox()
+        return self.transformed_path(matrix).bbox()
+
+    def transformed_path(self, matrix):
+        """Apply an SVG matrix to this path; arcs are converted to cubics."""
+        segs = []
+        for seg in self._segments:  # type: ignore[attr-defined]
+            if isinstance(seg, svgpathtools.Arc):
+                segs.extend(self._affine_segment(b, matrix) for b in convert_to_bezier(seg))
+            else:
+                segs.append(self._affine_segment(seg, matrix))
+        return Path(*segs)
+
+    @staticmethod
+    def _affine_segment(seg, matrix):
+        return type(seg)(*(_affine_point(p, matrix) for p in seg.bpoints()))
+
     def adjusted_path(self, *transforms):
         """Apply SVG transform strings to this path (in reverse order, matching SVG semantics)."""
         segs = self._segments  # type: ignore[attr-defined]
@@ -144,12 +175,10 @@ class Paths:
         to_centers = {}
         if dist_vs_length:
             for i, (path, st) in enumerate(zip(self.paths, self.stylings)):
-                transforms = st.transform_style(start).split()
-                xmin, xmax, ymin, ymax = path.adjusted_bbox(*transforms)
+                xmin, xmax, ymin, ymax = path.transformed_bbox(st.transform_matrix(start))
                 from_centers[i] = ((xmin+xmax)/2, (ymin+ymax)/2)
             for j, (path, st) in enumerate(zip(other.paths, other.stylings)):
-                transforms = st.transform_style(end).split()
-                xmin, xmax, ymin, ymax = path.adjusted_bbox(*transforms)
+                xmin, xmax, ymin, ymax = path.transformed_bbox(st.transform_matrix(end))
                 to_centers[j] = ((xmin+xmax)/2, (ymin+ymax)/2)
 
         for i in range(n_from):
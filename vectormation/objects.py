@@ -36,7 +36,7 @@ from vectormation._base import VObject, VCollection, VGroup
 from vectormation._canvas import VectorMathAnim
 
 from vectormation._shapes import (
-    Polygon, Ellipse, Circle, Dot, AnnotationDot, Rectangle, RoundedRectangle, Square,
+    Polygon, Ellipse, Circle, Dot, AnnotationDot, DotCloud, Rectangle, RoundedRectangle, Square,
     Line, DashedLine, Lines, FunctionGraph,
     Text, CountAnimation, ValueTracker, ComplexValueTracker, DecimalNumber, Integer,
     Path, Image, Trace,
@@ -3,6 +3,8 @@
 Each VObject has a Styling instance controlling its visual appearance (fill, stroke, opacity, etc.)
 and geometric transforms (translate, scale, rotate, skew). All values are time-varying attributes.
 """
+import math
+import re
 import vectormation.attributes as attributes
 import vectormation.easings as easings
 
@@ -43,6 +45,7 @@ _STYLE_PAIRS = [(name, svg) for name, svg, _, _, _ in _ATTR_SCHEMA if svg is not
 _STYLES = [name for name, svg, _, _, _ in _ATTR_SCHEMA if svg is not None]
 _GLOBAL_DEFAULTS = {name: default for name, _, _, default, _ in _ATTR_SCHEMA}
 _ATTR_NAMES = [name for name, _, _, _, _ in _ATTR_SCHEMA]
+_TRANSFORMS = [name for name, svg, _, _, _ in _ATTR_SCHEMA if svg is None]
 
 # Pre-render SVG spec defaults for style comparison (computed once at import).
 # None means the attribute is always emitted (no SVG spec default to match).
@@ -50,9 +53,215 @@ _RENDERED_DEFAULTS = {name: cls(0, svg_default).at_time(0) if svg_default is not
                       for name, svg, cls, _, svg_default in _ATTR_SCHEMA if svg is not None}
 
 
+_STYLE_ATTR_RE = re.compile(r"([\w-]+)='([^']*)'")
+
+
+class _StyleSheet:
+    """Collects the style strings of one frame as shared CSS classes.
+
+    While a sheet is active (``with _StyleSheet() as sheet:``),
+    :meth:`Styling.svg_style` passes its style text through
+    :meth:`class_attr`: the first object with a given style keeps its
+    presentation attributes, later ones write ``class='vmN'`` instead, so a
+    style used once costs nothing extra.  :meth:`to_svg` returns the
+    ``<style>`` element with the rules for the repeated styles.
+    """
+
+    def __init__(self):
+        self.classes = {}   # style text -> "class='vmN'", or None when seen once
+        self.rules = []
+        self._outer = None
+
+    def __enter__(self):
+        global _active_sheet
+        self._outer = _active_sheet
+        _active_sheet = self
+        return self
+
+    def __exit__(self, *exc):
+        global _active_sheet
+        _active_sheet = self._outer
+        return False
+
+    def class_attr(self, text):
+        try:
+            attr = self.classes[text]
+        except KeyError:
+            self.classes[text] = None
+            return text
+        if attr is None:
+            decls = ';'.join(f'{name}:{value}' for name, value in _STYLE_ATTR_RE.findall(text))
+            attr = self.classes[text] = f"class='vm{len(self.rules)}'"
+            self.rules.append(f'.vm{len(self.rules)}{{{decls}}}')
+        return attr
+
+    def to_svg(self):
+        if not self.rules:
+            return ''
+        return '<style>' + ''.join(self.rules) + '</style>\n'
+
+
+_active_sheet: _StyleSheet | None = None
+
+
+def _compose(m, n):
+    """Return the SVG matrix ``m @ n`` (apply *n* first); *m* may be None."""
+    if m is None:
+        return n
+    a, b, c, d, e, f = m
+    na, nb, nc, nd, ne, nf = n
+    return (a * na + c * nb, b * na + d * nb,
+            a * nc + c * nd, b * nc + d * nd,
+            a * ne + c * nf + e, b * ne + d * nf + f)
+
+
+def _fmt(v):
+    """Format a matrix entry, dropping float noise such as ``cos(90°)``."""
+    v = round(v, 12)
+    if float(v).is_integer():
+        return str(int(v))
+    return _num(v)
+
+
+_SVG_FLOAT_RE = re.compile(r'-?\d+\.\d{3,}')
+_ROUNDED: dict[int, dict[str, str]] = {}   # precision -> {number text: rounded text}
+_ROUNDED_LIMIT = 65536
+_ROUNDED_FLOATS: dict[int, dict[float, str]] = {}   # precision -> {value: rounded text}
+_ROUNDED_TEXT: dict[int, dict[str, str]] = {}   # precision -> {SVG text: rounded text}
+_ROUNDED_TEXT_LIMIT = 4096
+
+
+def _rounder(precision):
+    """Return ``round(svg)`` that shortens every number with 3+ decimals.
+
+    Frames repeat most numbers from one frame to the next, so the rounded
+    text of each number is cached instead of reformatted every time.
+    """
+    cache = _ROUNDED.setdefault(precision, {})
+    sub = _SVG_FLOAT_RE.sub
+
+    def _round_match(m):
+        text = m.group()
+        try:
+            return cache[text]
+        except KeyError:
+            out = f'{float(text):.{precision}f}'.rstrip('0').rstrip('.')
+            if len(cache) >= _ROUNDED_LIMIT:
+                cache.clear()
+            cache[text] = out
+            return out
+    return lambda svg: sub(_round_match, svg)
+
+
+class _Rounding:
+    """Rounds the numbers written through ``_num`` to *precision* decimals.
+
+    The canvas enters one around each frame, so ``to_svg`` methods marked
+    with ``_rounds_svg`` write their numbers rounded as they format them,
+    the same way ``_rounder`` would shorten them afterwards.  Outside,
+    numbers are written in full.
+    """
+
+    def __init__(self, precision):
+        self.precision = precision
+        self.floats = _ROUNDED_FLOATS.setdefault(precision, {})
+        self.texts = _ROUNDED_TEXT.setdefault(precision, {})
+        self.round = _rounder(precision)
+        self._outer = None
+
+    def __enter__(self):
+        global _rounding
+        self._outer = _rounding
+        _rounding = self
+        return self
+
+    def __exit__(self, *exc):
+        global _rounding
+        _rounding = self._outer
+        self._outer = None
+
+
+_rounding: _Rounding | None = None
+
+
+def _num(v):
+    """Return the SVG text of *v*, rounded while a ``_Rounding`` is active.
+
+    The text is ``str(v)`` rounded like ``_rounder`` rounds a fragment.
+    Floats and strings (path data, text) are remembered by value, since
+    most of them come back in the next frame.
+    """
+    r = _rounding
+    if r is None:
+        return str(v)
+    if isinstance(v, float):
+        if not v:
+            return str(v)   # not cached, since 0.0 == -0.0
+        known, limit = r.floats, _ROUNDED_LIMIT
+    elif isinstance(v, str):
+        known, limit = r.texts, _ROUNDED_TEXT_LIMIT
+    elif isinstance(v, int):
+        return str(v)
+    else:
+        return r.round(str(v))
+    out = known.get(v)
+    if out is None:
+        out = r.round(str(v))
+        if len(known) >= limit:
+            known.clear()
+        known[v] = out
+    return out
+
+
+def _round_svg(text):
+    """Round the numbers of an SVG fragment not written through ``_num``."""
+    r = _rounding
+    return text if r is None else r.round(text)
+
+
+def _rounds_svg(to_svg):
+    """Mark a ``to_svg`` method that writes every number through ``_num``.
+
+    The canvas then skips rounding its output again; subclasses that
+    override ``to_svg`` without the mark are rounded as a whole.
+    """
+    to_svg._rounds_svg = True
+    return to_svg
+
+
+def _lerp_kind(start_attr, end_attr):
+    """Attribute class to blend *start_attr* into *end_attr* in a batch, or None.
+
+    None leaves the pair to the attribute's own ``interpolate`` (which also
+    raises its errors, e.g. for strings or non-rgb colors).
+    """
+    cls = start_attr.__class__
+    if cls is not end_attr.__class__:
+        return None
+    if cls is attributes.Real or cls is attributes.Tup:
+        return cls
+    if cls is attributes.Color and start_attr.use == end_attr.use == 'rgb':
+        return cls
+    return None
+
+
 class Styling:
-    """Represents the styling part of an svg."""
+    """Represents the styling part of an svg.
+
+    The style and transform strings are cached separately, each together
+    with the time window over which all of its attributes stay constant,
+    so static objects are serialized once.  Editing one of the attributes
+    (see the timeline ``stamp``) or assigning to the styling drops them.
+
+    Inside a :class:`_StyleSheet` (see ``VectorMathAnim.style_classes``)
+    the style part becomes a shared CSS class.
+
+    With ``compose_transforms`` set (on the class or on one styling), the
+    transform is emitted as a single ``matrix(...)`` precomposed by
+    :meth:`transform_matrix` instead of a chain of SVG operations.
+    """
     global_defaults = _GLOBAL_DEFAULTS
+    compose_transforms = False
 
     # Styles
     opacity: attributes.Real
@@ -89,6 +298,12 @@ class Styling:
         self.set_values(creation=creation, **(self.global_defaults | defaults | kwargs))
         self._scale_origin: tuple[float, float] | None = None
 
+    def __setattr__(self, name, value):
+        d = self.__dict__
+        d[name] = value
+        d['_style_memo'] = d['_transform_memo'] = d['_matrix_memo'] = None
+        d['_joined'] = d['_composed'] = None
+
     def set_values(self, creation: float = 0, **values):
         for name, _, cls, _, _ in _ATTR_SCHEMA:
             setattr(self, name, cls(creation, values[name]))
@@ -100,84 +315,234 @@ class Styling:
     def last_change(self):
         return max(getattr(self, name).last_change for name in _ATTR_NAMES)
 
+    def _memo(self, key, names, time, build):
+        """Return ``build(time)``, reusing the cached result while *names* hold still.
+
+        The cache entry is valid at the time it was built and on the open
+        window where every attribute is constant (see ``static_run``).  The
+        window is only looked up from the second build on, so objects that
+        are made for a single frame do not pay for it.  When an attribute is
+        animating it is remembered as ``hot`` and checked first next time,
+        so animated objects do not rescan the others.  Text is also only
+        reused at the rounding it was written with (see ``_Rounding``).
+        """
+        memo = self.__dict__[key]
+        epoch = attributes._edits
+        digits = None if _rounding is None else _rounding.precision
+        if memo is not None and memo[6] == digits and (time == memo[1] or memo[2] < time < memo[3]):
+            if memo[0] == epoch:
+                return memo[4]
+            # Something was edited since: still valid if none of ours was
+            if all(getattr(self, name)._tl.stamp <= memo[0] for name in names):
+                self.__dict__[key] = (epoch,) + memo[1:]
+                return memo[4]
+        text = build(time)
+        hot = None if memo is None else memo[5]
+        if memo is None:
+            lo = hi = time
+        elif hot is not None and getattr(self, hot).static_run(time) is None:
+            lo = hi = time
+        else:
+            lo, hi, hot = -math.inf, math.inf, None
+            for name in names:
+                run = getattr(self, name).static_run(time)
+                if run is None:
+                    lo = hi = time
+                    hot = name
+                    break
+                if run[0] > lo:
+                    lo = run[0]
+                if run[1] < hi:
+                    hi = run[1]
+        self.__dict__[key] = (epoch, time, lo, hi, text, hot, digits)
+        return text
+
     def svg_style(self, time):
+        style = self._memo('_style_memo', _STYLES, time, self._style_text)
+        transform = self.transform_style(time)
+        if style and _active_sheet is not None:
+            style = _active_sheet.class_attr(style)
+        joined = self.__dict__['_joined']
+        if joined is not None and joined[0] is style and joined[1] is transform:
+            return joined[2]
+        if transform:
+            text = f" {style} transform='{transform}'" if style else f" transform='{transform}'"
+        else:
+            text = ' ' + style if style else ''
+        self.__dict__['_joined'] = (style, transform, text)
+        return text
+
+    def _style_text(self, time):
         parts = []
         for name, stylename in _STYLE_PAIRS:
             val = getattr(self, name).at_time(time)
             rendered_default = _RENDERED_DEFAULTS[name]
             if rendered_default is None or val != rendered_default:
-                parts.append(f"{stylename}='{val}'")
+                parts.append(f"{stylename}='{_num(val)}'")
+        return ' '.join(parts)
 
-        transform = self.transform_style(time)
-        if transform:
-            parts.append(f"transform='{transform}'")
+    def transform_style(self, time):
+        if not self.compose_transforms:
+            return self._memo('_transform_memo', _TRANSFORMS, time, self._transform_text)
+        mat = self.transform_matrix(time)
+        digits = None if _rounding is None else _rounding.precision
+        composed = self.__dict__['_composed']
+        if composed is not None and composed[0] is mat and composed[1] == digits:
+            return composed[2]
+        text = '' if mat is None else f"matrix({','.join(map(_fmt, mat))})"
+        self.__dict__['_composed'] = (mat, digits, text)
+        return text
 
-        return (' ' + ' '.join(parts)) if parts else ''
+    def transform_matrix(self, time):
+        """Return the transform at *time* composed into one affine matrix.
 
-    def transform_style(self, time):
+        The result is an SVG ``matrix(a, b, c, d, e, f)`` tuple mapping a
+        local point ``(x, y)`` to ``(a*x + c*y + e, b*x + d*y + f)``, or None
+        when the styling applies no transform.
+        """
+        return self._memo('_matrix_memo', _TRANSFORMS, time, self._matrix)
+
+    def _transform_text(self, time):
         parts = []
         rot = self.rotation.at_time(time)
         if rot != (0, 0, 0):
-            parts.append(f'rotate({-rot[0]%360},{rot[1]},{rot[2]})')
+            parts.append(f'rotate({_num(-rot[0]%360)},{_num(rot[1])},{_num(rot[2])})')
         dx, dy = self.dx.at_time(time), self.dy.at_time(time)
         if dx != 0 or dy != 0:
-            parts.append(f'translate({dx},{dy})')
+            parts.append(f'translate({_num(dx)},{_num(dy)})')
         sx, sy = self.scale_x.at_time(time), self.scale_y.at_time(time)
         if sx != 1 or sy != 1:
             if self._scale_origin:
                 cx, cy = self._scale_origin
-                parts.append(f'translate({cx},{cy}) scale({sx},{sy}) translate({-cx},{-cy})')
+                parts.append(f'translate({_num(cx)},{_num(cy)}) scale({_num(sx)},{_num(sy)}) '
+                             f'translate({_num(-cx)},{_num(-cy)})')
             else:
-                parts.append(f'scale({sx},{sy})')
+                parts.append(f'scale({_num(sx)},{_num(sy)})')
         skx = self.skew_x.at_time(time)
         if skx != 0:
-            parts.append(f'skewX({skx})')
+            parts.append(f'skewX({_num(skx)})')
         sky = self.skew_y.at_time(time)
         if sky != 0:
-            parts.append(f'skewY({sky})')
+            parts.append(f'skewY({_num(sky)})')
         skxa = self.skew_x_after.at_time(time)
         if skxa != 0:
-            parts.append(f'skewX({skxa})')
+            parts.append(f'skewX({_num(skxa)})')
         skya = self.skew_y_after.at_time(time)
         if skya != 0:
-            parts.append(f'skewY({skya})')
+            parts.append(f'skewY({_num(skya)})')
         mat = self.matrix.at_time(time)
         if mat != (0, 0, 0, 0, 0, 0):
-            parts.append(f"matrix({','.join(str(v) for v in mat)})")
+            parts.append(f"matrix({','.join(_num(v) for v in mat)})")
         return ' '.join(parts)
 
+    def _matrix(self, time):
+        """Compose the operations of :meth:`_transform_text` (same order)."""
+        m = None
+        rot = self.rotation.at_time(time)
+        if rot != (0, 0, 0):
+            a = math.radians(-rot[0] % 360)
+            cos, sin = math.cos(a), math.sin(a)
+            cx, cy = rot[1], rot[2]
+            m = (cos, sin, -sin, cos, cx - cos * cx + sin * cy, cy - sin * cx - cos * cy)
+        dx, dy = self.dx.at_time(time), self.dy.at_time(time)
+        if dx != 0 or dy != 0:
+            m = _compose(m, (1, 0, 0, 1, dx, dy))
+        sx, sy = self.scale_x.at_time(time), self.scale_y.at_time(time)
+        if sx != 1 or sy != 1:
+            cx, cy = self._scale_origin or (0, 0)
+            m = _compose(m, (sx, 0, 0, sy, cx - sx * cx, cy - sy * cy))
+        for name, skew_y in (('skew_x', False), ('skew_y', True),
+                             ('skew_x_after', False), ('skew_y_after', True)):
+            angle = getattr(self, name).at_time(time)
+            if angle != 0:
+                tan = math.tan(math.radians(angle))
+                m = _compose(m, (1, tan, 0, 1, 0, 0) if skew_y else (1, 0, tan, 1, 0, 0))
+        mat = self.matrix.at_time(time)
+        if mat != (0, 0, 0, 0, 0, 0):
+            m = _compose(m, tuple(mat))
+        return m
+
     def interpolate(self, other, start, end, easing=easings.linear,
                     rotation_degrees=0, rotation_center=None):
-        if not isinstance(other, Styling):
-            raise TypeError(f'other must be a Styling instance, got {type(other).__name__}')
-        if self == other and rotation_degrees == 0:
-            return self
+        return Styling.interpolate_many([(self, other)], start, end, easing=easing,
+                                        rotation_degrees=rotation_degrees,
+                                        rotation_center=rotation_center)[0]
+
+    @staticmethod
+    def interpolate_many(pairs, start, end, easing=easings.linear,
+                         rotation_degrees=0, rotation_center=None):
+        """Batch :meth:`interpolate` over ``(source, target)`` styling pairs.
 
+        Returns one styling per pair.  Attributes that do not change are set
+        up once per distinct source timeline and shared, and the changing
+        numbers, tuples and colors of all pairs are blended by one shared
+        ``attributes._Lerp`` per attribute, so a large morph neither creates
+        a closure per object nor calls the easing per object and frame.
+        """
+        for _, other in pairs:
+            if not isinstance(other, Styling):
+                raise TypeError(f'other must be a Styling instance, got {type(other).__name__}')
         if rotation_center is None:
             rotation_center = (0, 0)
+        result = []
+        todo = []
+        for i, (src, dst) in enumerate(pairs):
+            if src == dst and rotation_degrees == 0:
+                result.append(src)
+            else:
+                result.append(Styling({}, creation=start))
+                todo.append(i)
+        dur = max(end - start, 1e-9)
 
-        new_styling = Styling({}, creation=start)
         for attr in _ATTR_NAMES:
-            start_attr = getattr(self, attr)
-            end_attr = getattr(other, attr)
-            start_val = start_attr.at_time(start)
-            end_val = end_attr.at_time(end)
-
-            if attr == 'rotation' and rotation_degrees != 0:
-                rcx, rcy = rotation_center
-                rot_start = (start_val[0], rcx, rcy)
-                rot_end = (end_val[0] + rotation_degrees, rcx, rcy)
-                start_tup = attributes.Tup(0, rot_start)
-                start_tup.last_change = start
-                end_tup = attributes.Tup(0, rot_end)
-                end_tup.last_change = end
-                inter_attr = start_tup.interpolate(end_tup, start, end, easing=easing)
-                setattr(new_styling, attr, inter_attr)
-                continue
-
-            if start_val == end_val:
-                getattr(new_styling, attr).set(start, end, start_attr.time_func)
-                continue
-            inter_attr = start_attr.interpolate(end_attr, start, end, easing=easing)
-            setattr(new_styling, attr, inter_attr)
-        return new_styling
+            shared = {}   # id(source timeline) -> (timeline, attribute set from it)
+            rows = {}     # attribute class -> (indices, start values, end values)
+            for i in todo:
+                start_attr = getattr(pairs[i][0], attr)
+                end_attr = getattr(pairs[i][1], attr)
+                if attr == 'rotation' and rotation_degrees != 0:
+                    rcx, rcy = rotation_center
+                    start_val = (start_attr.at_time(start)[0], rcx, rcy)
+                    end_val = (end_attr.at_time(end)[0] + rotation_degrees, rcx, rcy)
+                    kind = attributes.Tup
+                elif start_attr.at_time(start) == end_attr.at_time(end):
+                    new_attr = getattr(result[i], attr)
+                    tl = start_attr._tl
+                    known = shared.get(id(tl))
+                    if known is None:
+                        new_attr.set(start, end, tl.copy())   # later edits to the source must not leak in
+                        shared[id(tl)] = (tl, new_attr)
+                    else:
+                        new_attr._tl = known[1]._share()
+                        new_attr.last_change = known[1].last_change
+                    continue
+                else:
+                    kind = _lerp_kind(start_attr, end_attr)
+                    if kind is not None:
+                        start_val, end_val = start_attr._tl(start), end_attr._tl(end)
+                        if kind is not attributes.Real and len(start_val) != len(end_val):
+                            kind = None
+                    if kind is None:
+                        setattr(result[i], attr,
+                                start_attr.interpolate(end_attr, start, end, easing=easing))
+                        continue
+                group = rows.setdefault(kind, ([], [], []))
+                group[0].append(i)
+                group[1].append(start_val)
+                group[2].append(end_val)
+
+            for kind, (indices, start_vals, end_vals) in rows.items():
+                try:
+                    lerp = attributes._Lerp(start_vals, end_vals, start, dur, easing)
+                except (TypeError, ValueError):   # ragged or non-numeric
+                    for i in indices:
+                        start_attr = getattr(pairs[i][0], attr)
+                        setattr(result[i], attr, start_attr.interpolate(
+                            getattr(pairs[i][1], attr), start, end, easing=easing))
+                    continue
+                for row, i in enumerate(indices):
+                    new_attr = attributes.Color(use='rgb') if kind is attributes.Color else kind(0)
+                    new_attr.time_func = attributes._LerpRow(lerp, row)
+                    new_attr.last_change = end
+                    setattr(result[i], attr, new_attr)
+        return result